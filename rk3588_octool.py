@@ -3,11 +3,14 @@ import mmap
 import os
 import struct
 import time
+from itertools import islice
 import textwrap
 
 # Common Constants
 REG_SIZE = 0x1000
 
+VERIFY_WRITES = False   # re-read registers after writing (3 MMIO ops per write instead of 1)
+
 CRU_BASE            = 0xFD7C0000
 CRU_BIGCORE0_BASE   = 0xFD810000
 CRU_BIGCORE1_BASE   = 0xFD812000
@@ -38,6 +41,18 @@ NPLL_FREQ           = 1700      # RK3588 Registers  [m=425, p=3, s=1]
 SPLL_FREQ           = 702       # rk3588 dts; can't read from devmem
 V0PLL_FREQ          = 1188      # RK3588 Registers  [m=198, p=2, s=1, k=0]
 
+# Source PLL lookup for the GPU/NPU src muxes, indexed by the raw
+# selector code (gpll=0, cpll=1, aupll=2, npll=3, spll=4)
+PLL_FREQ_BY_CODE = (GPLL_FREQ, CPLL_FREQ, AUPLL_FREQ, NPLL_FREQ, SPLL_FREQ)
+
+# Raw selector codes shared across the clock trees; these match the enum
+# maps in the SECTIONS tables below, and the frequency logic compares
+# codes instead of decoded strings
+MUX_SEL_SLOW, MUX_SEL_GPLL, MUX_SEL_PLL = 0b00, 0b01, 0b10
+SLOW_SEL_XIN_OSC0 = 0b0
+CLK_SEL_UC, CLK_SEL_CLEAN, CLK_SEL_PVTPLL = 0b00, 0b01, 0b10
+SRC_MUX_SRC, SRC_MUX_PVTPLL = 0b0, 0b1
+
                                 # FRACPLL #
                                 #   FFVCO = ((m + k / 65536) * FFIN) / p
                                 #   FFOUT = ((m + k / 65536) * FFIN) / (p * 2s)
@@ -70,113 +85,792 @@ MEMORY_MAP = {
 FLAT_FIELDS_BY_TAB = {}
 
 # Common Functions
-def get_bits(value, lsb, msb):
-    mask = (1 << (msb - lsb + 1)) - 1
-    return (value >> lsb) & mask
 
-def set_bits(orig, value, lsb, msb):
-    mask = (1 << (msb - lsb + 1)) - 1
-    orig &= ~(mask << lsb)
-    orig |= (value & mask) << lsb
-    return orig
+_DEV_MEM_FD = os.open("/dev/mem", os.O_RDWR | os.O_SYNC)
 
 class Registers:
+    # The mapping is created on first access, not in __init__: a session
+    # usually visits one or two tabs, so most clusters never need to be
+    # mapped at all
     def __init__(self, base, size):
-        self.mem_fd = os.open("/dev/mem", os.O_RDWR | os.O_SYNC)
-        self.mem = mmap.mmap(self.mem_fd, size, mmap.MAP_SHARED,
-                             mmap.PROT_READ | mmap.PROT_WRITE, offset=base)
-
-    def read32(self, offset):
-        self.mem.seek(offset)
-        return struct.unpack("<I", self.mem.read(4))[0]
-
-    def write32(self, offset, value):
-        self.mem.seek(offset)
-        self.mem.write(struct.pack("<I", value))
+        self._base = base
+        self._size = size
+        self.mem = None
+        self._u32 = None
+
+    def _map(self):
+        # Pre-fault the pages up front and tell the kernel accesses are random
+        # single words, so no first-touch fault or readahead on the hot path
+        flags = mmap.MAP_SHARED | getattr(mmap, "MAP_POPULATE", 0)
+        self.mem = mmap.mmap(_DEV_MEM_FD, self._size, flags,
+                             mmap.PROT_READ | mmap.PROT_WRITE,
+                             offset=self._base)
+        if hasattr(mmap, "MADV_RANDOM"):
+            self.mem.madvise(mmap.MADV_RANDOM)
+        # Word-indexed view: one indexing op per access, no seek/struct/bytes temp
+        self._u32 = memoryview(self.mem).cast("I")
+        return self._u32
+
+    # Builtins bound as defaults: LOAD_FAST instead of a global/attribute
+    # lookup on every register access
+    def read32(self, offset, _unpack=struct.unpack):
+        u32 = self._u32
+        if u32 is None:
+            u32 = self._map()
+        if offset & 0x3:
+            # fallback for non-aligned offsets
+            self.mem.seek(offset)
+            return _unpack("<I", self.mem.read(4))[0]
+        return u32[offset >> 2]
+
+    def write32(self, offset, value, _pack=struct.pack):
+        u32 = self._u32
+        if u32 is None:
+            u32 = self._map()
+        if offset & 0x3:
+            self.mem.seek(offset)
+            self.mem.write(_pack("<I", value))
+            return
+        u32[offset >> 2] = value & 0xFFFFFFFF
+
+    def read_words(self, offset, n):
+        # One slice fills n words instead of n read32 calls
+        u32 = self._u32
+        if u32 is None:
+            u32 = self._map()
+        i = offset >> 2
+        return list(u32[i:i + n])
 
     def close(self):
+        if self.mem is None:
+            return
+        self._u32.release()
         self.mem.close()
-        os.close(self.mem_fd)
+        self._u32 = None
+        self.mem = None
 
-reg_mem = {
-    key: Registers(addr, REG_SIZE)
-    for key, addr in MEMORY_MAP.items()
-}
+class RegisterWindow:
+    # Thin view into a cluster mapping; offsets stay relative to the block base
+    def __init__(self, cluster, bias):
+        self.cluster = cluster
+        self.bias = bias
 
-def read_field(field):
-    mem, name, offset, lsb, msb, ftype, enum_map, value_range = field
-    val = mem.read32(offset)
-    width = msb - lsb + 1
-    mask = (1 << width) - 1
-    raw = (val >> lsb) & mask
-    return raw
-
-def write_field(mem, field, user_input, message, flat_fields):
-    mem, name, offset, lsb, msb, ftype, enum_map, value_range = field
-    user_input = user_input.strip()
+    def read32(self, offset):
+        return self.cluster.read32(self.bias + offset)
 
-    # Safeguard: prevent changing b0pll_pll_reset if bigcore0_mux_sel == "b0pll"
-    if name == "b0pll_pll_reset":
-        bigcore0_mux_sel_field = next(f for f in flat_fields if f[1] == "bigcore0_mux_sel")
-        current_mux_sel = read_field(bigcore0_mux_sel_field)
-        if current_mux_sel == "b0pll":
-            message[0] = "ERROR: Cannot configure 'b0pll_pll_reset' while 'bigcore0_mux_sel' is set to 'b0pll' — system will lock."
-            return False
+    def write32(self, offset, value):
+        self.cluster.write32(self.bias + offset, value)
+
+    def read_words(self, offset, n):
+        return self.cluster.read_words(self.bias + offset, n)
+
+# The register blocks cluster into a few 1MiB-aligned ranges, so one mapping
+# per cluster covers them all instead of 14 separate 4KiB mmaps
+CLUSTER_SIZE = 0x100000
+_clusters = {}
+reg_mem = {}
+for _key, _addr in MEMORY_MAP.items():
+    _cluster_base = _addr & ~(CLUSTER_SIZE - 1)
+    if _cluster_base not in _clusters:
+        _clusters[_cluster_base] = Registers(_cluster_base, CLUSTER_SIZE)
+    reg_mem[_key] = RegisterWindow(_clusters[_cluster_base], _addr - _cluster_base)
+
+def flatten_fields(sections):
+    flat = []
+    for _, base_tag, fields in sections:
+        mem_obj = reg_mem[base_tag]
+        for entry in fields:
+            name, offset, bit_range, ftype = entry[:4]
+            enum_map = entry[4] if len(entry) > 4 else None
+            val_range = entry[5] if len(entry) > 5 else None
+            lsb, msb = bit_range
+            # Bake the extraction mask in once; decode is then a shift and an AND
+            mask = (1 << (msb - lsb + 1)) - 1
+            enum_map_inv = {v: k for k, v in enum_map.items()} if enum_map else None
+            if enum_map:
+                extra_str = f"Options: {list(enum_map.keys())}"
+            elif val_range:
+                extra_str = f"Range: {val_range}"
+            else:
+                extra_str = ""
+            flat.append((mem_obj, name, offset, lsb, mask, ftype,
+                         enum_map, enum_map_inv, val_range, extra_str))
+    return flat
+
+def fields_by_name(flat_fields):
+    return {f[1]: f for f in flat_fields}
+
+def unique_regs(flat_fields):
+    # Distinct (mem, offset) pairs in first-seen order, computed once at
+    # import so each draw knows exactly which registers to sample
+    seen = {}
+    for f in flat_fields:
+        seen.setdefault((id(f[0]), f[2]), (f[0], f[2]))
+    return list(seen.values())
+
+# CRU & GRF Offsets
+BIGCORE0_B0PLL_CON0 = 0x0000
+BIGCORE0_B0PLL_CON1 = 0x0004
+BIGCORE0_B0PLL_CON6 = 0x0018
+BIGCORE0_MODE_CON00 = 0x0280
+BIGCORE0_CLKSEL_CON00 = 0x0300
+BIGCORE0_CLKSEL_CON01 = 0x0304
+GRF_BIGCORE0_PVTPLL_CON0_L = 0x0000
+GRF_BIGCORE0_PVTPLL_CON0_H = 0x0004
+GRF_BIGCORE0_PVTPLL = 0x18
+
+# BigCore0 Clocking Parameters
+BIGCORE0_SECTIONS = [
+    ("## bigcore0 pvtpll configuration ##", "GRF_BIGCORE0_BASE", [
+        ("osc_ring_sel", GRF_BIGCORE0_PVTPLL_CON0_L, (8, 10), "int", None, (0, 7)),
+            # 0 = HDBLVT20_INV_S_4, 1 = HDBLVT22_INV_S_4, 2 = Reserved, 3 = HDBSVT22_INV_S_4
+            # 4 = HDBLVT20_INV_SHSDB_4, 5 = HDBLVT22_INV_SHSDB_4, 6 = Reserved, 7 = HDBSVT22_INV_SHSDB_4
+        ("ring_length_sel", GRF_BIGCORE0_PVTPLL_CON0_H, (0, 5), "int", None, (0, 63)), #number of inventers = (n+5)*2
+    ]),
+    ("## b0pll configuration ##", "CRU_BIGCORE0_BASE", [
+        ("m_b0pll", BIGCORE0_B0PLL_CON0, (0, 9), "int", None, (64, 1023)),
+        ("p_b0pll", BIGCORE0_B0PLL_CON1, (0, 5), "int", None, (1, 63)),
+        ("s_b0pll", BIGCORE0_B0PLL_CON1, (6, 8), "int", None, (0, 6)),
+        ("clk_b0pll_mux", BIGCORE0_MODE_CON00, (0, 1), "enum",
+         {"xin_osc0_func": 0b00, "clk_b0pll": 0b01, "clk_deepslow": 0b10}),
+        ("b0pll_pll_reset", BIGCORE0_B0PLL_CON1, (13, 13), "int", None, (0, 1)),
+        ("b0pll_lock", BIGCORE0_B0PLL_CON6, (15, 15), "int", None, (0, 1)),
+    ]),
+    ("## bigcore0 mux configuration ##", "CRU_BIGCORE0_BASE", [
+        ("bigcore0_slow_sel", BIGCORE0_CLKSEL_CON00, (0, 0), "enum",
+         {"xin_osc0_func": 0b0, "clk_deepslow": 0b1}),
+        ("bigcore0_gpll_div", BIGCORE0_CLKSEL_CON00, (1, 5), "int", None, (0, 31)),
+        ("bigcore0_mux_sel", BIGCORE0_CLKSEL_CON00, (6, 7), "enum",
+         {"slow": 0b00, "gpll": 0b01, "b0pll": 0b10}),
+        # ("bigcore0_pvtpll_sel", BIGCORE0_CLKSEL_CON01, (14, 14), "enum",  // requires updating of cal_cnt register (0x8)
+        #  {"bigcore0_mux": 0b0, "xin_osc0_func": 0b1,}),                   // no logic implemented
+    ]),
+    ("## core configuration ##", "CRU_BIGCORE0_BASE", [
+        ("b0_uc_div", BIGCORE0_CLKSEL_CON00, (8, 12), "int", None, (0, 31)),
+        ("b0_clk_sel", BIGCORE0_CLKSEL_CON00, (13, 14), "enum",
+         {"UC_b0": 0b00, "Clean": 0b01, "PVTPLL": 0b10}),
+        ("b1_uc_div", BIGCORE0_CLKSEL_CON01, (0, 4), "int", None, (0, 31)),
+        ("b1_clk_sel", BIGCORE0_CLKSEL_CON01, (5, 6), "enum",
+         {"UC_b1": 0b00, "Clean": 0b01, "PVTPLL": 0b10}),
+    ]),
+]
+BIGCORE0_FLAT_FIELDS = flatten_fields(BIGCORE0_SECTIONS)
+BIGCORE0_FIELDS_BY_NAME = fields_by_name(BIGCORE0_FLAT_FIELDS)
+BIGCORE0_UNIQUE_REGS = unique_regs(BIGCORE0_FLAT_FIELDS)
+
+# CRU & GRF Offsets
+BIGCORE1_B1PLL_CON0 = 0x0020
+BIGCORE1_B1PLL_CON1 = 0x0024
+BIGCORE1_B1PLL_CON6 = 0x0038
+BIGCORE1_MODE_CON00 = 0x0280
+BIGCORE1_CLKSEL_CON00 = 0x0300
+BIGCORE1_CLKSEL_CON01 = 0x0304
+GRF_BIGCORE1_PVTPLL_CON0_L = 0x0000
+GRF_BIGCORE1_PVTPLL_CON0_H = 0x0004
+GRF_BIGCORE1_PVTPLL = 0x18
+
+# BigCore1 Clocking Parameters
+BIGCORE1_SECTIONS = [
+    ("## bigcore1 pvtpll configuration ##", "GRF_BIGCORE1_BASE", [
+        ("osc_ring_sel", GRF_BIGCORE1_PVTPLL_CON0_L, (8, 10), "int", None, (0, 7)),
+            # 0 = HDBLVT20_INV_S_4, 1 = HDBLVT22_INV_S_4, 2 = Reserved, 3 = HDBSVT22_INV_S_4
+            # 4 = HDBLVT20_INV_SHSDB_4, 5 = HDBLVT22_INV_SHSDB_4, 6 = Reserved, 7 = HDBSVT22_INV_SHSDB_4
+        ("ring_length_sel", GRF_BIGCORE1_PVTPLL_CON0_H, (0, 5), "int", None, (0, 63)), #number of inventers = (n+5)*2
+    ]),
+    ("## b1pll configuration ##", "CRU_BIGCORE1_BASE", [
+        ("m_b1pll", BIGCORE1_B1PLL_CON0, (0, 9), "int", None, (64, 1023)),
+        ("p_b1pll", BIGCORE1_B1PLL_CON1, (0, 5), "int", None, (1, 63)),
+        ("s_b1pll", BIGCORE1_B1PLL_CON1, (6, 8), "int", None, (0, 6)),
+        ("clk_b1pll_mux", BIGCORE1_MODE_CON00, (0, 1), "enum",
+         {"xin_osc0_func": 0b00, "clk_b1pll": 0b01, "clk_deepslow": 0b10}),
+        ("b1pll_pll_reset", BIGCORE1_B1PLL_CON1, (13, 13), "int", None, (0, 1)),
+        ("b1pll_lock", BIGCORE1_B1PLL_CON6, (15, 15), "int", None, (0, 1)),
+    ]),
+    ("## bigcore1 mux configuration ##", "CRU_BIGCORE1_BASE", [
+        ("bigcore1_slow_sel", BIGCORE1_CLKSEL_CON00, (0, 0), "enum",
+         {"xin_osc0_func": 0b0, "clk_deepslow": 0b1}),
+        ("bigcore1_gpll_div", BIGCORE1_CLKSEL_CON00, (1, 5), "int", None, (0, 31)),
+        ("bigcore1_mux_sel", BIGCORE1_CLKSEL_CON00, (6, 7), "enum",
+         {"slow": 0b00, "gpll": 0b01, "b1pll": 0b10}),
+        # ("bigcore1_pvtpll_sel", BIGCORE1_CLKSEL_CON01, (14, 14), "enum",  // requires updating of cal_cnt register (0x8)
+        #  {"bigcore1_mux": 0b0, "xin_osc0_func": 0b1,}),                   // no logic implemented
+    ]),
+    ("## core configuration ##", "CRU_BIGCORE1_BASE", [
+        ("b2_uc_div", BIGCORE1_CLKSEL_CON00, (8, 12), "int", None, (0, 31)),
+        ("b2_clk_sel", BIGCORE1_CLKSEL_CON00, (13, 14), "enum",
+         {"UC_b2": 0b00, "Clean": 0b01, "PVTPLL": 0b10}),
+        ("b3_uc_div", BIGCORE1_CLKSEL_CON01, (0, 4), "int", None, (0, 31)),
+        ("b3_clk_sel", BIGCORE1_CLKSEL_CON01, (5, 6), "enum",
+         {"UC_b3": 0b00, "Clean": 0b01, "PVTPLL": 0b10}),
+    ]),
+]
+BIGCORE1_FLAT_FIELDS = flatten_fields(BIGCORE1_SECTIONS)
+BIGCORE1_FIELDS_BY_NAME = fields_by_name(BIGCORE1_FLAT_FIELDS)
+BIGCORE1_UNIQUE_REGS = unique_regs(BIGCORE1_FLAT_FIELDS)
+
+# CRU & GRF Offsets
+DSU_LPLL_CON0 = 0x0040
+DSU_LPLL_CON1 = 0x0044
+DSU_LPLL_CON6 = 0x0058
+DSU_MODE_CON00 = 0x0280
+DSU_CLKSEL_CON00 = 0x0300
+DSU_CLKSEL_CON01 = 0x0304
+DSU_CLKSEL_CON02 = 0x0308
+DSU_CLKSEL_CON03 = 0x030C
+DSU_CLKSEL_CON04 = 0x0310
+DSU_CLKSEL_CON05 = 0x0314
+DSU_CLKSEL_CON06 = 0x0318
+DSU_CLKSEL_CON07 = 0x031C
+GRF_LITCORE_PVTPLL_CON0_L = 0x40
+GRF_LITCORE_PVTPLL_CON0_H = 0x44
+GRF_LITCORE_PVTPLL = 0x60
+
+# LittleCore Clocking Parameters
+LITTLECORE_SECTIONS = [
+    ("## littlecore pvtpll configuration ##", "GRF_LITCORE_BASE", [
+        ("ring_length_sel", GRF_LITCORE_PVTPLL_CON0_L, (8, 10), "int", None, (0, 7)),
+            # 0 = HDBLVT20_INV_S_4, 1 = HDBLVT22_INV_S_4, 2 = Reserved, 3 = HDBSVT22_INV_S_4
+            # 4 = HDBLVT20_INV_SHSDB_4, 5 = HDBLVT22_INV_SHSDB_4, 6 = Reserved, 7 = HDBSVT22_INV_SHSDB_4
+        ("ring_length_sel", GRF_LITCORE_PVTPLL_CON0_H, (0, 5), "int", None, (0, 63)), #number of inventers = (n+5)*2
+    ]),
+    ("## lpll configuration ##", "CRU_DSU_BASE", [
+        ("m_lpll", DSU_LPLL_CON0, (0, 9), "int", None, (64, 1023)),
+        ("p_lpll", DSU_LPLL_CON1, (0, 5), "int", None, (1, 63)),
+        ("s_lpll", DSU_LPLL_CON1, (6, 8), "int", None, (0, 6)),
+        ("clk_lpll_mux", DSU_MODE_CON00, (0, 1), "enum",
+         {"xin_osc0_func": 0b00, "clk_lpll": 0b01, "clk_deepslow": 0b10}),
+        ("lpll_pll_reset", DSU_LPLL_CON1, (13, 13), "int", None, (0, 1)),
+        ("lpll_lock", DSU_LPLL_CON6, (15, 15), "int", None, (0, 1)),
+    ]),
+    ("## littlecore mux configuration ##", "CRU_DSU_BASE", [
+        ("littlecore_slow_sel", DSU_CLKSEL_CON00, (0, 0), "enum",
+         {"xin_osc0_func": 0b0, "clk_deepslow": 0b1}),
+        ("littlecore_gpll_div", DSU_CLKSEL_CON05, (9, 13), "int", None, (0, 31)),
+        ("littlecore_mux_sel", DSU_CLKSEL_CON05, (14, 15), "enum",
+         {"slow": 0b00, "gpll": 0b01, "lpll": 0b10}),
+        # ("littlecore_pvtpll_sel", DSU_CLKSEL_CON04, (9, 9), "enum",   // requires updating of cal_cnt register (0x48)
+        #  {"littlecore_mux": 0b0, "xin_osc0_func": 0b1,}),             // no logic implemented
+    ]),
+    ("## core configuration ##", "CRU_DSU_BASE", [
+        ("l0_uc_div", DSU_CLKSEL_CON06, (0, 4), "int", None, (0, 31)),
+        ("l0_clk_sel", DSU_CLKSEL_CON06, (5, 6), "enum",
+         {"UC_l0": 0b00, "Clean": 0b01, "PVTPLL": 0b10}),
+        ("l1_uc_div", DSU_CLKSEL_CON06, (7, 11), "int", None, (0, 31)),
+        ("l1_clk_sel", DSU_CLKSEL_CON06, (12, 13), "enum",
+         {"UC_l1": 0b00, "Clean": 0b01, "PVTPLL": 0b10}),
+        ("l2_uc_div", DSU_CLKSEL_CON07, (0, 4), "int", None, (0, 31)),
+        ("l2_clk_sel", DSU_CLKSEL_CON07, (5, 6), "enum",
+         {"UC_l2": 0b00, "Clean": 0b01, "PVTPLL": 0b10}),
+        ("l3_uc_div", DSU_CLKSEL_CON07, (7, 11), "int", None, (0, 31)),
+        ("l3_clk_sel", DSU_CLKSEL_CON07, (12, 13), "enum",
+         {"UC_l3": 0b00, "Clean": 0b01, "PVTPLL": 0b10}),
+    ]),
+]
+
+LITTLECORE_FLAT_FIELDS = flatten_fields(LITTLECORE_SECTIONS)
+LITTLECORE_FIELDS_BY_NAME = fields_by_name(LITTLECORE_FLAT_FIELDS)
+LITTLECORE_UNIQUE_REGS = unique_regs(LITTLECORE_FLAT_FIELDS)
+
+# CRU & GRF Offsets
+GRF_DSU_PVTPLL_CON0_L = 0x60
+GRF_DSU_PVTPLL_CON0_H = 0x64
+GRF_DSU_PVTPLL = 0x80
+
+# DSU Clocking Parameters
+DSU_SECTIONS = [
+    ("## dsu pvtpll configuration ##", "GRF_DSU_BASE", [
+        ("ring_length_sel", GRF_DSU_PVTPLL_CON0_L, (8, 10), "int", None, (0, 7)),
+            # 0 = HDBLVT20_INV_S_4, 1 = HDBLVT22_INV_S_4, 2 = Reserved, 3 = HDBSVT22_INV_S_4
+            # 4 = HDBLVT20_INV_SHSDB_4, 5 = HDBLVT22_INV_SHSDB_4, 6 = Reserved, 7 = HDBSVT22_INV_SHSDB_4
+        ("ring_length_sel", GRF_DSU_PVTPLL_CON0_H, (0, 5), "int", None, (0, 63)), #number of inventers = (n+5)*2
+    ]),
+    ("## sclk_dsu configuration ##", "CRU_DSU_BASE", [
+        ("dsu_sclk_df_src_mux_sel", DSU_CLKSEL_CON00, (12, 13), "enum",
+         {"b0pll": 0b00, "b1pll": 0b01, "lpll": 0b10, "gpll": 0b11}),
+        ("dsu_sclk_df_src_mux_div", DSU_CLKSEL_CON00, (7, 11), "int", None, (0, 31)),
+        ("dsu_sclk_src_t_sel", DSU_CLKSEL_CON01, (0, 0), "enum",
+         {"dsu_src": 0b0, "PVTPLL": 0b01}),
+        #("dsu_pvtpll_sel", DSU_CLKSEL_CON04, (10, 10), "enum", // requires updating of cal_cnt register (0x70)
+        # {"dsu_sclk_df_src": 0b0, "xin_osc0_func": 0b1,}),     // no logic implemented
+    ]),
+    ("## pclk_dsu configuration ##", "CRU_DSU_BASE", [
+        ("dsu_pclk_root_mux_sel", DSU_CLKSEL_CON04, (5, 6), "enum",
+         {"b0pll": 0b00, "b1pll": 0b01, "lpll": 0b10, "gpll": 0b11}),
+        ("dsu_pclk_root_mux_div", DSU_CLKSEL_CON04, (0, 4), "int", None, (0, 31)),
+    ]),
+    ("## dsu_other configuration ##", "CRU_DSU_BASE", [
+        ("dsu_aclkm_div", DSU_CLKSEL_CON01, (1, 5), "int", None, (0, 31)),
+        ("dsu_aclks_div", DSU_CLKSEL_CON01, (6, 10), "int", None, (0, 31)),
+        ("dsu_aclkmp_div", DSU_CLKSEL_CON01, (11, 15), "int", None, (0, 31)),
+        ("dsu_periphclk_div", DSU_CLKSEL_CON02, (0, 4), "int", None, (0, 31)),
+        ("dsu_cntclk_div", DSU_CLKSEL_CON02, (5, 9), "int", None, (0, 31)),
+        ("dsu_tsclk_div", DSU_CLKSEL_CON02, (10, 14), "int", None, (0, 31)),
+        ("dsu_atclk_div", DSU_CLKSEL_CON03, (0, 4), "int", None, (0, 31)),
+        ("dsu_gicclk_t_div", DSU_CLKSEL_CON03, (5, 9), "int", None, (0, 31)),
+    ]),
+]
+
+DSU_FLAT_FIELDS = flatten_fields(DSU_SECTIONS)
+DSU_FIELDS_BY_NAME = fields_by_name(DSU_FLAT_FIELDS)
+DSU_UNIQUE_REGS = unique_regs(DSU_FLAT_FIELDS)
+
+# DSU branch clocks that all divide the SRC MUX clock, in display order
+DSU_BRANCH_DIV_FIELDS = (
+    "dsu_aclkm_div", "dsu_aclks_div", "dsu_aclkmp_div", "dsu_periphclk_div",
+    "dsu_cntclk_div", "dsu_tsclk_div", "dsu_atclk_div", "dsu_gicclk_t_div",
+)
+
+# CRU & GRF Offsets
+CRU_CLKSEL_CON158 = 0x0578
+CRU_CLKSEL_CON159 = 0x057C
+CRU_CLKSEL_CON160 = 0x0584
+CRU_CLKSEL_CON161 = 0x058C
+GRF_GPU_PVTPLL_CON0_L = 0x00
+GRF_GPU_PVTPLL_CON0_H = 0x04
+GRF_GPU_PVTPLL = 0x18
+
+# GPU Clocking Parameters
+GPU_SECTIONS = [
+    ("## gpu pvtpll configuration ##", "GRF_GPU_BASE", [
+        ("ring_length_sel", GRF_GPU_PVTPLL_CON0_L, (8, 10), "int", None, (0, 1)),
+            # 0 = UDBLVT20_INV_S_4, 1 = UDBSVT20_INV_S_4
+        ("ring_length_sel", GRF_GPU_PVTPLL_CON0_H, (0, 5), "int", None, (0, 63)) #number of inventers = (n+20)*2
+    ]),
+    ("## gpu mux configuration ##", "CRU_BASE", [
+        # ("gpu_pvtpll_sel", CRU_CLKSEL_CON158, (2, 2), "enum",     // requires updating of cal_cnt register (0x8)
+        #  {"clk_gpu_src": 0b0, "xin_osc0_func": 0b1}),             // no logic implemented
+        ("gpu_src_div", CRU_CLKSEL_CON158, (0, 4), "int", None, (0, 31)),
+        ("gpu_src_sel", CRU_CLKSEL_CON158, (5, 7), "enum",
+         {"gpll": 0b000, "cpll": 0b001, "aupll": 0b010, "npll": 0b011, "spll": 0b100}),            
+        ("gpu_src_mux_sel", CRU_CLKSEL_CON158, (14, 14), "enum",
+         {"gpu_src": 0b0, "PVTPLL": 0b1})
+    ]),
+]
+
+GPU_FLAT_FIELDS = flatten_fields(GPU_SECTIONS)
+GPU_FIELDS_BY_NAME = fields_by_name(GPU_FLAT_FIELDS)
+GPU_UNIQUE_REGS = unique_regs(GPU_FLAT_FIELDS)
+
+# CRU & GRF Offsets
+CRU_CLKSEL_CON73 = 0x0424
+CRU_CLKSEL_CON74 = 0x0428
+GRF_NPU_PVTPLL_CON0_L = 0x0C
+GRF_NPU_PVTPLL_CON0_H = 0x10
+GRF_NPU_PVTPLL = 0x24
+
+#def read_pvtpll_freq(mem_grf):
+#    freq_mhz = mem_grf.read32(GRF_NPU_PVTPLL)
+#    return freq_mhz
+
+# NPU Clocking Parameters
+NPU_SECTIONS = [
+    #("## npu pvtpll configuration ##", "GRF_NPU_BASE", [
+    #    ("ring_length_sel", GRF_NPU_PVTPLL_CON0_L, (8, 10), "int", None, (0, 1)),
+    #        # 0 = UDBLVT20_INV_S_4, 1 = UDBSVT20_INV_S_4
+    #    ("ring_length_sel", GRF_NPU_PVTPLL_CON0_H, (0, 5), "int", None, (0, 63)), #number of inventers = (n+20)*2
+    #]),
+    ("## npu mux configuration ##", "CRU_BASE", [
+        ("rknn_dsu0_src_sel", CRU_CLKSEL_CON73, (7, 9), "enum",
+         {"gpll": 0b000, "cpll": 0b001, "aupll": 0b010, "npll": 0b011, "spll": 0b100}),
+        ("rknn_dsu0_src_div", CRU_CLKSEL_CON73, (2, 6), "int", None, (0, 31)),
+        ("rknn_dsu0_mux_sel", CRU_CLKSEL_CON74, (0, 0), "enum",
+         {"dsu0_src": 0b0, "PVTPLL": 0b1}),
+        # ("npu_pvtpll_sel", CRU_CLKSEL_CON74, (4, 4), "enum",      // requires updating of cal_cnt register (0x14)
+        #  {"dsu0_src": 0b0, "xin_osc0_func": 0b1}),                // no logic implemented
+        ("npu_cm0_rtc_div", CRU_CLKSEL_CON74, (7, 11), "int", None, (0, 31)),
+    ]),
+]
+
+NPU_FLAT_FIELDS = flatten_fields(NPU_SECTIONS)
+NPU_FIELDS_BY_NAME = fields_by_name(NPU_FLAT_FIELDS)
+NPU_UNIQUE_REGS = unique_regs(NPU_FLAT_FIELDS)
+
+# CRU & GRF Offsets
+DDR0CRU_D0APLL_CON0 = 0x0000
+DDR0CRU_D0APLL_CON1 = 0x0004
+DDR0CRU_D0APLL_CON2 = 0x0008
+DDR0CRU_D0APLL_CON6 = 0x0018
+DDR0CRU_D0BPLL_CON0 = 0x0020
+DDR0CRU_D0BPLL_CON1 = 0x0024
+DDR0CRU_D0BPLL_CON2 = 0x0028
+DDR0CRU_D0BPLL_CON6 = 0x0038
+DDR0CRU_CLKSEL_CON00 = 0x0300
+
+DDR1CRU_D1APLL_CON0 = 0x0000
+DDR1CRU_D1APLL_CON1 = 0x0004
+DDR1CRU_D1APLL_CON2 = 0x0008
+DDR1CRU_D1APLL_CON6 = 0x0018
+DDR1CRU_D1BPLL_CON0 = 0x0020
+DDR1CRU_D1BPLL_CON1 = 0x0024
+DDR1CRU_D1BPLL_CON2 = 0x0028
+DDR1CRU_D1BPLL_CON6 = 0x0038
+DDR1CRU_CLKSEL_CON00 = 0x0300
+
+DDR2CRU_D2APLL_CON0 = 0x0000
+DDR2CRU_D2APLL_CON1 = 0x0004
+DDR2CRU_D2APLL_CON2 = 0x0008
+DDR2CRU_D2APLL_CON6 = 0x0018
+DDR2CRU_D2BPLL_CON0 = 0x0020
+DDR2CRU_D2BPLL_CON1 = 0x0024
+DDR2CRU_D2BPLL_CON2 = 0x0028
+DDR2CRU_D2BPLL_CON6 = 0x0038
+DDR2CRU_CLKSEL_CON00 = 0x0300
+
+DDR3CRU_D3APLL_CON0 = 0x0000
+DDR3CRU_D3APLL_CON1 = 0x0004
+DDR3CRU_D3APLL_CON2 = 0x0008
+DDR3CRU_D3APLL_CON6 = 0x0018
+DDR3CRU_D3BPLL_CON0 = 0x0020
+DDR3CRU_D3BPLL_CON1 = 0x0024
+DDR3CRU_D3BPLL_CON2 = 0x0028
+DDR3CRU_D3BPLL_CON6 = 0x0038
+DDR3CRU_CLKSEL_CON00 = 0x0300
+
+# Clocking Parameters
+DRAM_SECTIONS = [
+    ("## d0a pll configuration ##", "CRU_DDRPHY0_BASE", [
+        ("m_d0apll", DDR0CRU_D0APLL_CON0, (0, 9), "int", None, (64, 1023)),
+        ("p_d0apll", DDR0CRU_D0APLL_CON1, (0, 5), "int", None, (1, 63)),
+        ("s_d0apll", DDR0CRU_D0APLL_CON1, (6, 8), "int", None, (0, 6)),
+        ("k_d0apll", DDR0CRU_D0APLL_CON2, (0, 15), "int", None, (0, 1023)), 
+        ("d0apll_pll_reset", DDR0CRU_D0APLL_CON1, (13, 13), "int", None, (0, 1)),
+        ("d0apll_lock", DDR0CRU_D0APLL_CON6, (15, 15), "int", None, (0, 1))
+    ]),
+    ("## d0b pll configuration ##", "CRU_DDRPHY0_BASE", [
+        ("m_d0bpll", DDR0CRU_D0BPLL_CON0, (0, 9), "int", None, (64, 1023)),
+        ("p_d0bpll", DDR0CRU_D0BPLL_CON1, (0, 5), "int", None, (1, 63)),
+        ("s_d0bpll", DDR0CRU_D0BPLL_CON1, (6, 8), "int", None, (0, 6)),
+        ("k_d0bpll", DDR0CRU_D0BPLL_CON2, (0, 15), "int", None, (0, 1023)), 
+        ("d0bpll_pll_reset", DDR0CRU_D0BPLL_CON0, (13, 13), "int", None, (0, 1)),
+        ("d0bpll_lock", DDR0CRU_D0BPLL_CON6, (15, 15), "int", None, (0, 1))
+    ]),
+    ("## d1a pll configuration ##", "CRU_DDRPHY1_BASE", [
+        ("m_d1apll", DDR1CRU_D1APLL_CON0, (0, 9), "int", None, (64, 1023)),
+        ("p_d1apll", DDR1CRU_D1APLL_CON1, (0, 5), "int", None, (1, 63)),
+        ("s_d1apll", DDR1CRU_D1APLL_CON1, (6, 8), "int", None, (0, 6)),
+        ("k_d1apll", DDR1CRU_D1APLL_CON2, (0, 15), "int", None, (0, 1023)), 
+        ("d1apll_pll_reset", DDR1CRU_D1APLL_CON1, (13, 13), "int", None, (0, 1)),
+        ("d1apll_lock", DDR1CRU_D1APLL_CON6, (15, 15), "int", None, (0, 1))
+    ]),
+    ("## d1b pll configuration ##", "CRU_DDRPHY1_BASE", [
+        ("m_d1bpll", DDR1CRU_D1BPLL_CON0, (0, 9), "int", None, (64, 1023)),
+        ("p_d1bpll", DDR1CRU_D1BPLL_CON1, (0, 5), "int", None, (1, 63)),
+        ("s_d1bpll", DDR1CRU_D1BPLL_CON1, (6, 8), "int", None, (0, 6)),
+        ("k_d1bpll", DDR1CRU_D1BPLL_CON2, (0, 15), "int", None, (0, 1023)), 
+        ("d1bpll_pll_reset", DDR1CRU_D1BPLL_CON0, (13, 13), "int", None, (0, 1)),
+        ("d1bpll_lock", DDR1CRU_D1BPLL_CON6, (15, 15), "int", None, (0, 1))
+    ]),
+    ("## d2a pll configuration ##", "CRU_DDRPHY2_BASE", [
+        ("m_d2apll", DDR2CRU_D2APLL_CON0, (0, 9), "int", None, (64, 1023)),
+        ("p_d2apll", DDR2CRU_D2APLL_CON1, (0, 5), "int", None, (1, 63)),
+        ("s_d2apll", DDR2CRU_D2APLL_CON1, (6, 8), "int", None, (0, 6)),
+        ("k_d2apll", DDR2CRU_D2APLL_CON2, (0, 15), "int", None, (0, 1023)), 
+        ("d2apll_pll_reset", DDR2CRU_D2APLL_CON1, (13, 13), "int", None, (0, 1)),
+        ("d2apll_lock", DDR2CRU_D2APLL_CON6, (15, 15), "int", None, (0, 1))
+    ]),
+    ("## d2b pll configuration ##", "CRU_DDRPHY2_BASE", [
+        ("m_d2bpll", DDR2CRU_D2BPLL_CON0, (0, 9), "int", None, (64, 1023)),
+        ("p_d2bpll", DDR2CRU_D2BPLL_CON1, (0, 5), "int", None, (1, 63)),
+        ("s_d2bpll", DDR2CRU_D2BPLL_CON1, (6, 8), "int", None, (0, 6)),
+        ("k_d2bpll", DDR2CRU_D2BPLL_CON2, (0, 15), "int", None, (0, 1023)), 
+        ("d2bpll_pll_reset", DDR2CRU_D2BPLL_CON0, (13, 13), "int", None, (0, 1)),
+        ("d2bpll_lock", DDR2CRU_D2BPLL_CON6, (15, 15), "int", None, (0, 1))
+    ]),
+    ("## d3a pll configuration ##", "CRU_DDRPHY3_BASE", [
+        ("m_d3apll", DDR3CRU_D3APLL_CON0, (0, 9), "int", None, (64, 1023)),
+        ("p_d3apll", DDR3CRU_D3APLL_CON1, (0, 5), "int", None, (1, 63)),
+        ("s_d3apll", DDR3CRU_D3APLL_CON1, (6, 8), "int", None, (0, 6)),
+        ("k_d3apll", DDR3CRU_D3APLL_CON2, (0, 15), "int", None, (0, 1023)), 
+        ("d3apll_pll_reset", DDR3CRU_D3APLL_CON1, (13, 13), "int", None, (0, 1)),
+        ("d3apll_lock", DDR3CRU_D3APLL_CON6, (15, 15), "int", None, (0, 1))
+    ]),
+    ("## d3b pll configuration ##", "CRU_DDRPHY3_BASE", [
+        ("m_d3bpll", DDR3CRU_D3BPLL_CON0, (0, 9), "int", None, (64, 1023)),
+        ("p_d3bpll", DDR3CRU_D3BPLL_CON1, (0, 5), "int", None, (1, 63)),
+        ("s_d3bpll", DDR3CRU_D3BPLL_CON1, (6, 8), "int", None, (0, 6)),
+        ("k_d3bpll", DDR3CRU_D3BPLL_CON2, (0, 15), "int", None, (0, 1023)), 
+        ("d3bpll_pll_reset", DDR3CRU_D3BPLL_CON0, (13, 13), "int", None, (0, 1)),
+        ("d3bpll_lock", DDR3CRU_D3BPLL_CON6, (15, 15), "int", None, (0, 1))
+    ]),
+    ("## ddr0clk configuration ##", "CRU_DDRPHY0_BASE", [
+        ("ddrphy2x_ch0_sel", DDR0CRU_CLKSEL_CON00, (0, 0), "enum",
+         {"d0apll": 0b00, "d0bpll": 0b01})
+    ]),
+    ("## ddr1clk configuration ##", "CRU_DDRPHY1_BASE", [
+        ("ddrphy2x_ch1_sel", DDR1CRU_CLKSEL_CON00, (0, 0), "enum",
+         {"d1apll": 0b00, "d1bpll": 0b01})
+    ]),
+    ("## ddr2clk configuration ##", "CRU_DDRPHY2_BASE", [
+        ("ddrphy2x_ch2_sel", DDR2CRU_CLKSEL_CON00, (0, 0), "enum",
+         {"d2apll": 0b00, "d2bpll": 0b01})
+    ]),
+    ("## ddr3clk configuration ##", "CRU_DDRPHY3_BASE", [
+        ("ddrphy2x_ch3_sel", DDR3CRU_CLKSEL_CON00, (0, 0), "enum",
+         {"d3apll": 0b00, "d3bpll": 0b01}),
+    ]),
+]
+
+DRAM_FLAT_FIELDS = flatten_fields(DRAM_SECTIONS)
+DRAM_FIELDS_BY_NAME = fields_by_name(DRAM_FLAT_FIELDS)
+DRAM_UNIQUE_REGS = unique_regs(DRAM_FLAT_FIELDS)
+
+# Field rows use fixed column widths on every tab; the %-template is
+# compiled once so the per-row work is a single interpolation instead of
+# re-parsing the format-spec mini-language per field per frame
+FIELD_NAME_COL_WIDTH = 25
+VALUE_COL_WIDTH = 15
+INFO_COL_WIDTH = 35
+FIELD_ROW_TEMPLATE = "%%-%ds: %%-%ds %%-%ds" % (
+    FIELD_NAME_COL_WIDTH, VALUE_COL_WIDTH, INFO_COL_WIDTH)
+
+# Frequency display lines: the labels and widths never change, so the
+# %-templates are compiled once here and only the values are substituted
+# per frame. Lines whose value is a module constant are rendered outright.
+FREQ_SEP_LINE   = "--------------"
+GPLL_LINE_BIG   = "GPLL Frequency:       %.0f MHz" % GPLL_FREQ
+GPLL_LINE_WIDE  = "GPLL Frequency:           %.0f MHz" % GPLL_FREQ
+AUPLL_LINE      = "AUPLL Frequency:          %.0f MHz" % AUPLL_FREQ
+CPLL_LINE       = "CPLL Frequency:           %.0f MHz" % CPLL_FREQ
+NPLL_LINE       = "NPLL Frequency:           %.0f MHz" % NPLL_FREQ
+SPLL_LINE       = "SPLL Frequency:           %.0f MHz" % SPLL_FREQ
+
+BIGCORE0_FREQ_TEMPLATES = (
+    "B0PLL Frequency:      %.0f MHz",
+    "Bigcore0 MUX Freq:    %.0f MHz from %s",
+    "Bigcore0 PVTPLL Freq: %.0f MHz",
+    "B0 UC Frequency:      %.0f MHz",
+    "B1 UC Frequency:      %.0f MHz",
+    "B0 Clock Frequency:   %.0f MHz from %s",
+    "B1 Clock Frequency:   %.0f MHz from %s",
+)
+
+BIGCORE1_FREQ_TEMPLATES = (
+    "B1PLL Frequency:      %.0f MHz",
+    "Bigcore1 MUX Freq:    %.0f MHz from %s",
+    "Bigcore1 PVTPLL Freq: %.0f MHz",
+    "B2 UC Frequency:      %.0f MHz",
+    "B3 UC Frequency:      %.0f MHz",
+    "B2 Clock Frequency:   %.0f MHz from %s",
+    "B3 Clock Frequency:   %.0f MHz from %s",
+)
+
+LITTLECORE_FREQ_TEMPLATES = (
+    "LPLL Frequency:           %.0f MHz",
+    "Littlecore MUX Freq:      %.0f MHz from %s",
+    "Littlecore PVTPLL Freq:   %.0f MHz",
+    "L0 UC Frequency:          %.0f MHz",
+    "L1 UC Frequency:          %.0f MHz",
+    "L2 UC Frequency:          %.0f MHz",
+    "L3 UC Frequency:          %.0f MHz",
+    "L0 Clock Frequency:       %.0f MHz from %s",
+    "L1 Clock Frequency:       %.0f MHz from %s",
+    "L2 Clock Frequency:       %.0f MHz from %s",
+    "L3 Clock Frequency:       %.0f MHz from %s",
+)
+
+DSU_FREQ_TEMPLATES = (
+    "B0PLL Frequency:          %.0f MHz",
+    "B1PLL Frequency:          %.0f MHz",
+    "LPLL Frequency:           %.0f MHz",
+    "DSU SRC MUX Freq:         %.0f MHz from %s",
+    "DSU PCLK MUX Freq:        %.0f MHz from %s",
+    "DSU PVTPLL Freq:          %.0f MHz",
+    "DSU SCLK Frequency:       %.0f MHz from %s",
+    "DSU ACLK_M Frequency:     %.0f MHz",
+    "DSU ACLK_S Frequency:     %.0f MHz",
+    "DSU ACLK_MP Frequency:    %.0f MHz",
+    "DSU PERIPHCLK Frequency:  %.0f MHz",
+    "DSU CNTCLK Frequency:     %.0f MHz",
+    "DSU TSCLK Frequency:      %.0f MHz",
+    "DSU ATCLK Frequency:      %.0f MHz",
+    "DSU GICCLK Frequency:     %.0f MHz",
+    "DSU PCLK Frequency:       %.0f MHz",
+)
+
+GPU_FREQ_TEMPLATES = (
+    "GPU SRC MUX Freq:         %.0f MHz from %s",
+    "GPU PVTPLL Freq:          %.0f MHz",
+    "GPU Frequency:            %.0f MHz from %s",
+)
+
+NPU_FREQ_TEMPLATES = (
+    "NPU SRC MUX Freq:         %.0f MHz from %s",
+    "NPU Frequency:            %.0f MHz from %s",
+)
+
+def build_display_scaffold(sections):
+    # Static display rows for a register tab: the section headers, spacers
+    # and field slots never change, so they are built once at import and
+    # the draw code copies the list and appends the per-frame freq lines
+    rows = []
+    idx = 0
+    for section_title, base_tag, fields in sections:
+        rows.append(("", "spacer"))
+        rows.append((section_title, "section"))
+        for field in fields:
+            rows.append((None, "field", idx))
+            idx += 1
+    rows.append(("", "spacer"))
+    rows.append(("## frequency configuration ##", "section"))
+    return rows
+
+BIGCORE0_DISPLAY_SCAFFOLD = build_display_scaffold(BIGCORE0_SECTIONS)
+BIGCORE1_DISPLAY_SCAFFOLD = build_display_scaffold(BIGCORE1_SECTIONS)
+LITTLECORE_DISPLAY_SCAFFOLD = build_display_scaffold(LITTLECORE_SECTIONS)
+DSU_DISPLAY_SCAFFOLD = build_display_scaffold(DSU_SECTIONS)
+GPU_DISPLAY_SCAFFOLD = build_display_scaffold(GPU_SECTIONS)
+NPU_DISPLAY_SCAFFOLD = build_display_scaffold(NPU_SECTIONS)
+
+FIELDS_BY_NAME_BY_TAB = {
+    1: BIGCORE0_FIELDS_BY_NAME,
+    2: BIGCORE1_FIELDS_BY_NAME,
+    3: LITTLECORE_FIELDS_BY_NAME,
+    4: DSU_FIELDS_BY_NAME,
+    5: GPU_FIELDS_BY_NAME,
+    6: NPU_FIELDS_BY_NAME,
+}
 
-    # Check b0pll lock before switching bigcore0_mux to b0pll
-    if name == "bigcore0_mux_sel":
-        if user_input == "b0pll":
-            try:
-                pll_lock_field = next(f for f in flat_fields if f[1] == "b0pll_lock")
-                pll_locked = read_field(pll_lock_field)
-                if pll_locked != 1:
-                    message[0] = "WARNING: PLL not locked. Set b0pll_pll_reset first."
-                    return False
-            except StopIteration:
-                message[0] = "PLL lock field missing."
-                return False
+# Register snapshots are reused for up to SNAPSHOT_TTL seconds so held-down
+# navigation keys repaint from cached values instead of re-reading the SoC
+# registers at the key-repeat rate; writes flush the cache via
+# snapshot_invalidate()
+SNAPSHOT_TTL = 0.25
+
+_snap_cache = {}
+
+def snapshot_invalidate():
+    _snap_cache.clear()
+
+def snapshot(regs):
+    # One MMIO access per distinct register per frame; runs of adjacent
+    # registers are pulled in with a single bulk read. regs is the
+    # unique_regs() list for the panel, computed once at import.
+    cached = _snap_cache.get(id(regs))
+    now = time.monotonic()
+    if cached is not None and now - cached[1] < SNAPSHOT_TTL:
+        return cached[0]
+    by_mem = {}
+    for mem, offset in regs:
+        by_mem.setdefault(id(mem), (mem, set()))[1].add(offset)
+    snap = {}
+    for mem_id, (mem, offsets) in by_mem.items():
+        run_start = None
+        run_len = 0
+        for off in sorted(offsets):
+            if run_start is not None and off == run_start + 4 * run_len:
+                run_len += 1
+                continue
+            if run_start is not None:
+                for i, word in enumerate(mem.read_words(run_start, run_len)):
+                    snap[(mem_id, run_start + 4 * i)] = word
+            run_start = off
+            run_len = 1
+        if run_start is not None:
+            for i, word in enumerate(mem.read_words(run_start, run_len)):
+                snap[(mem_id, run_start + 4 * i)] = word
+    _snap_cache[id(regs)] = (snap, now)
+    return snap
+
+def read_field(field, snap=None):
+    mem, name, offset, lsb, mask, ftype, enum_map, enum_map_inv, value_range = field[:9]
+    if snap is not None:
+        val = snap[(id(mem), offset)]
+    else:
+        val = mem.read32(offset)
+    return (val >> lsb) & mask
+
+def pll_freq(by_name, snap, m_name, p_name, s_name):
+    # INTPLL: FFOUT = (m * FFIN) / p / 2^s  (see formula block at the top)
+    m = read_field(by_name[m_name], snap)
+    p = read_field(by_name[p_name], snap)
+    s = read_field(by_name[s_name], snap)
+    return (XIN_OSC0_FREQ * m) / p / (1 << s) if m and p else 0
+
+# m/p/s/k field tuples for the eight DDR PLLs, resolved from
+# DRAM_FIELDS_BY_NAME once at import so the per-frame kernel is just
+# mask/shift arithmetic over the snapshot
+DRAM_PLL_FIELDS = tuple(
+    (tag,
+     DRAM_FIELDS_BY_NAME["m_" + tag], DRAM_FIELDS_BY_NAME["p_" + tag],
+     DRAM_FIELDS_BY_NAME["s_" + tag], DRAM_FIELDS_BY_NAME["k_" + tag])
+    for tag in ("d0apll", "d0bpll", "d1apll", "d1bpll",
+                "d2apll", "d2bpll", "d3apll", "d3bpll"))
+
+def dram_pll_freqs(snap, _fields=DRAM_PLL_FIELDS):
+    # DDRPLL: FFOUT = ((m + k / 65536) * FFIN) / (p * 2^s)  (see formula
+    # block at the top). Note the shift: Python's ^ is XOR, not power.
+    # All eight PLLs are decoded in one pass over the frame snapshot.
+    freqs = {}
+    for tag, mf, pf, sf, kf in _fields:
+        m = snap[(id(mf[0]), mf[2])] >> mf[3] & mf[4]
+        p = snap[(id(pf[0]), pf[2])] >> pf[3] & pf[4]
+        s = snap[(id(sf[0]), sf[2])] >> sf[3] & sf[4]
+        k = snap[(id(kf[0]), kf[2])] >> kf[3] & kf[4]
+        freqs[tag] = (XIN_OSC0_FREQ * (m + k / 65536.0)) / (p << s) if p else 0
+    return freqs
+
+def core_clk_freqs(mux_clk, uc_divs, clk_sels, pvtpll_freq):
+    # Per-core UC divider and clock-source selection, shared by the
+    # bigcore/littlecore tabs (sel is the raw clk_sel code)
+    uc_clks = []
+    clk_freqs = []
+    for uc_div, sel in zip(uc_divs, clk_sels):
+        uc_clk = mux_clk / (uc_div + 1)
+        if sel == CLK_SEL_UC:
+            freq = uc_clk
+        elif sel == CLK_SEL_CLEAN:
+            freq = CLEAN_FREQ
+        elif sel == CLK_SEL_PVTPLL:
+            freq = pvtpll_freq
+        else:
+            freq = 0
+        uc_clks.append(uc_clk)
+        clk_freqs.append(freq)
+    return uc_clks, clk_freqs
+
+# Write safeguards (see TRM): resetting a PLL that a core mux is running
+# from, or switching a mux onto an unlocked PLL, locks the system.
+# field name -> (kind, dependency field, trigger value, error message)
+SAFEGUARDS = {
+    "b0pll_pll_reset": ("mux_on_pll", "bigcore0_mux_sel", "b0pll",
+        "ERROR: Cannot configure 'b0pll_pll_reset' while 'bigcore0_mux_sel' is set to 'b0pll' — system will lock."),
+    "bigcore0_mux_sel": ("pll_lock", "b0pll_lock", "b0pll",
+        "WARNING: PLL not locked. Set b0pll_pll_reset first."),
+    "b1pll_pll_reset": ("mux_on_pll", "bigcore1_mux_sel", "b1pll",
+        "ERROR: Cannot configure 'b1pll_pll_reset' while 'bigcore1_mux_sel' is set to 'b1pll' — system will lock."),
+    "bigcore1_mux_sel": ("pll_lock", "b1pll_lock", "b1pll",
+        "WARNING: PLL not locked. Set b1pll_pll_reset first."),
+    "lpll_pll_reset": ("mux_on_pll", "littlecore_mux_sel", "lpll",
+        "ERROR: Cannot configure 'lpll_pll_reset' while 'littlecore_mux_sel' is set to 'lpll' — system will lock."),
+    "littlecore_mux_sel": ("pll_lock", "lpll_lock", "lpll",
+        "WARNING: PLL not locked. Set lpll_pll_reset first."),
+}
 
-    # Safeguard: prevent changing b1pll_pll_reset if bigcore1_mux_sel == "b1pll"
-    if name == "b1pll_pll_reset":
-        bigcore1_mux_sel_field = next(f for f in flat_fields if f[1] == "bigcore1_mux_sel")
-        current_mux_sel = read_field(bigcore1_mux_sel_field)
-        if current_mux_sel == "b1pll":
-            message[0] = "ERROR: Cannot configure 'b1pll_pll_reset' while 'bigcore1_mux_sel' is set to 'b1pll' — system will lock."
+def _check_safeguard(name, user_input, flat_fields_by_name, message):
+    rule = SAFEGUARDS.get(name)
+    if rule is None:
+        return True
+    kind, dep_name, trigger, msg = rule
+    if kind == "mux_on_pll":
+        if get_val(dep_name, flat_fields_by_name) == trigger:
+            message[0] = msg
             return False
-
-    # Check b1pll lock before switching bigcore1_mux to b1pll
-    if name == "bigcore1_mux_sel":
-        if user_input == "b1pll":
-            try:
-                pll_lock_field = next(f for f in flat_fields if f[1] == "b1pll_lock")
-                pll_locked = read_field(pll_lock_field)
-                if pll_locked != 1:
-                    message[0] = "WARNING: PLL not locked. Set b1pll_pll_reset first."
-                    return False
-            except StopIteration:
-                message[0] = "PLL lock field missing."
-                return False
-
-    # Safeguard: prevent changing lpll_pll_reset if little_mux_sel == "lpll"
-    if name == "lpll_pll_reset":
-        littlecore_mux_sel_field = next(f for f in flat_fields if f[1] == "littlecore_mux_sel")
-        current_mux_sel = read_field(littlecore_mux_sel_field)
-        if current_mux_sel == "lpll":
-            message[0] = "ERROR: Cannot configure 'lpll_pll_reset' while 'littlecore_mux_sel' is set to 'b1pll' — system will lock."
+    elif kind == "pll_lock" and user_input == trigger:
+        lock_field = flat_fields_by_name.get(dep_name)
+        if lock_field is None:
+            message[0] = "PLL lock field missing."
             return False
+        if read_field(lock_field) != 1:
+            message[0] = msg
+            return False
+    return True
 
-    # Check lpll lock before switching littlecore_mux to lpll
-    if name == "littlecore_mux_sel":
-        if user_input == "lpll":
-            try:
-                pll_lock_field = next(f for f in flat_fields if f[1] == "lpll_lock")
-                pll_locked = read_field(pll_lock_field)
-                if pll_locked != 1:
-                    message[0] = "WARNING: PLL not locked. Set lpll_pll_reset first."
-                    return False
-            except StopIteration:
-                message[0] = "PLL lock field missing."
-                return False
+def write_field(field, user_input, message, flat_fields_by_name, _int=int):
+    mem, name, offset, lsb, mask, ftype, enum_map, enum_map_inv, value_range = field[:9]
+    user_input = user_input.strip()
+
+    if not _check_safeguard(name, user_input, flat_fields_by_name, message):
+        return False
 
     # Handle enum input:
     if ftype == "enum" and enum_map:
@@ -185,7 +879,7 @@ def write_field(mem, field, user_input, message, flat_fields):
         else:
             # Maybe user entered a number as string: try to parse and verify
             try:
-                int_val = int(user_input)
+                int_val = _int(user_input)
                 if int_val in enum_map.values():
                     value = int_val
                 else:
@@ -196,7 +890,7 @@ def write_field(mem, field, user_input, message, flat_fields):
                 return False
     else:
         try:
-            value = int(user_input)
+            value = _int(user_input)
         except ValueError:
             message[0] = f"ERROR: Invalid integer input: {user_input}"
             return False
@@ -208,56 +902,138 @@ def write_field(mem, field, user_input, message, flat_fields):
         else:
             value = value
 
-    current_val = mem.read32(offset)
-    new_val = set_bits(current_val, value, lsb, msb)
+    # Skip the MMIO write (and verify read) when the field already holds the
+    # requested value - no reason to touch the clock tree for a no-op
+    current = (mem.read32(offset) >> lsb) & mask
+    if current == value:
+        message[0] = f"{name} already = {user_input}"
+        return True
 
-    # General write-enable mask: bits 16..(16+(width-1))
-    width = msb - lsb + 1
-    write_mask = ((1 << width) - 1) << (lsb + 16)
-    masked_val = (new_val & 0xFFFF) | write_mask
+    # The upper 16 bits of every CRU/GRF register are a per-bit write-enable,
+    # so only the target field needs writing - no read-modify-write cycle
+    low = (value & mask) << lsb
+    write_mask = mask << (lsb + 16)
 
-    mem.write32(offset, masked_val)
+    mem.write32(offset, low | write_mask)
 
-    # Verify
-    verify = mem.read32(offset)
-    verify_val = get_bits(verify, lsb, msb)
+    if VERIFY_WRITES:
+        verify = mem.read32(offset)
+        verify_val = (verify >> lsb) & mask
+        if verify_val != value:
+            message[0] = f"ERROR: Failed to verify write for {name}"
+            return False
 
-    expected_val = value
+    message[0] = f"Successfully wrote {name} = {user_input}"
+    return True
 
-    if verify_val == expected_val:
-        message[0] = f"Successfully wrote {name} = {user_input}"
-        return True
+def get_val(name, fields, snap=None, _next=next):
+    if isinstance(fields, dict):
+        f = fields.get(name)
     else:
-        message[0] = f"ERROR: Failed to verify write for {name}"
-        return False
+        f = _next((x for x in fields if x[1] == name), None)
+    if f is None:
+        return None
+    raw = read_field(f, snap)
+    ftype = f[5]
+    enum_map_inv = f[7]
+    if ftype == "enum" and enum_map_inv is not None:
+        return enum_map_inv.get(raw, f"unknown({raw})")
+    return raw
 
-def get_val(name, flat_fields):
-    for f in flat_fields:
-        if f[1] == name:
-            raw = read_field(f)
-            ftype = f[5]
-            enum_map = f[6] if len(f) > 6 else None
-            if ftype == "enum" and enum_map is not None:
-                return next((k for k, v in enum_map.items() if v == raw), f"unknown({raw})")
-            else:
-                return raw
-    return None
+def get_code(name, fields, snap=None, _next=next):
+    # Like get_val but skips the enum decode: the clock-selection logic
+    # compares raw integer codes, strings are only built for display
+    if isinstance(fields, dict):
+        f = fields.get(name)
+    else:
+        f = _next((x for x in fields if x[1] == name), None)
+    return read_field(f, snap) if f is not None else None
+
+_GPU_POLICY_PATH = "/sys/devices/platform/fb000000.gpu/devfreq/fb000000.gpu/device/power_policy"
+
+# Keep the sysfs fd open across polls; pread/pwrite avoid the open/close
+# syscall pair on every check
+try:
+    _gpu_policy_fd = os.open(_GPU_POLICY_PATH, os.O_RDWR)
+except OSError:
+    _gpu_policy_fd = None
 
 def is_gpu_safe_to_read():
-    try:
-        with open("/sys/devices/platform/fb000000.gpu/devfreq/fb000000.gpu/device/power_policy", "r") as f:
-            return f.read().strip() == "coarse_demand [always_on]"
-    except FileNotFoundError:
+    if _gpu_policy_fd is None:
         return False  # If sysfs path doesn't exist, assume not safe
+    try:
+        policy = os.pread(_gpu_policy_fd, 128, 0)
+    except OSError:
+        return False
+    return policy.decode().strip() == "coarse_demand [always_on]"
+
+# Cache for the sysfs policy check: re-stat at most once per TTL second
+# instead of on every redraw; cleared on tab switch and after a policy
+# change so those paths re-check immediately
+_safe_cache = {}
+GPU_SAFE_TTL = 1.0
+
+# Composed curses attributes, resolved once in init_colors();
+# curses.color_pair is a Python-level call, so the draw loops use
+# these cached constants instead
+_SECTION_ATTR = curses.A_BOLD
+_FIELD_REVERSE = curses.A_REVERSE
+_FIELD_NORMAL = curses.A_NORMAL
+
+# Last text/attr drawn per (tab, row); lets a tab redraw only the rows whose
+# content or highlight actually changed between frames
+_row_cache = {}
+
+def draw_row_cached(stdscr, tab_tag, row, x, text, attr=curses.A_NORMAL, max_w=None):
+    key = (tab_tag, row)
+    if _row_cache.get(key) == (text, attr):
+        return
+    _row_cache[key] = (text, attr)
+    stdscr.move(row, x)
+    stdscr.clrtoeol()
+    if max_w is None:
+        stdscr.addstr(row, x, text, attr)
+    else:
+        # addnstr truncates in C instead of allocating a sliced copy
+        stdscr.addnstr(row, x, text, max_w, attr)
+
+# Off-screen pad the panel bodies render into; the main loop composes it
+# over stdscr with the frame's single doupdate
+PAD_ROWS, PAD_COLS = 200, 512
+_pad = None
+_pad_view = None
+_pad_panel = None
+
+def get_panel_pad(panel):
+    # The pad keeps the previous frame of the same panel so unchanged rows
+    # can be skipped; only wipe it when a different panel takes it over
+    global _pad, _pad_panel
+    if _pad is None:
+        _pad = curses.newpad(PAD_ROWS, PAD_COLS)
+    if _pad_panel != panel:
+        _pad.erase()
+        _row_cache.clear()
+        _pad_panel = panel
+    return _pad
+
+def is_gpu_safe_to_read_cached():
+    now = time.monotonic()
+    cached = _safe_cache.get("gpu")
+    if cached is not None and now - cached[1] < GPU_SAFE_TTL:
+        return cached[0]
+    ok = is_gpu_safe_to_read()
+    _safe_cache["gpu"] = (ok, now)
+    return ok
 
 def set_gpu_power_policy_always_on():
+    if _gpu_policy_fd is None:
+        return False
     try:
-        with open("/sys/devices/platform/fb000000.gpu/devfreq/fb000000.gpu/device/power_policy", "w") as f:
-            f.write("always_on\n")
+        os.pwrite(_gpu_policy_fd, b"always_on\n", 0)
         return True
     except PermissionError:
         return False  # Probably need root permissions
-    except FileNotFoundError:
+    except OSError:
         return False
 
 def draw_header(stdscr, current_tab, tabs):
@@ -265,9 +1041,6 @@ def draw_header(stdscr, current_tab, tabs):
     stdscr.addstr(0, 0, "RK3588 OC Tool by SkatterBencher, v0.8 - Press 'q' to quit | Left/Right to switch tabs")
     stdscr.attroff(curses.color_pair(1) | curses.A_BOLD)
 
-    stdscr.move(1, 0)
-    stdscr.clrtoeol()  # clear line just to be sure it's empty
-
     x = 0
     for i, tab_name in enumerate(tabs):
         tab_str = f" {tab_name} "
@@ -282,27 +1055,6 @@ def draw_header(stdscr, current_tab, tabs):
         x += len(tab_str)
     stdscr.hline(2, 0, curses.ACS_HLINE, curses.COLS)
 
-def draw_tab_content(stdscr, current_tab, mem, selected, scroll_offset, message, lpll_freq=0, b0pll_freq=0,b1pll_freq=0):
-    if current_tab == 0:
-        draw_general_info(stdscr, message="", offset=3)
-    elif current_tab == 1:
-        draw_bigcore0_ui(stdscr, mem, selected, message, scroll_offset)
-    elif current_tab == 2:
-        draw_bigcore1_ui(stdscr, mem, selected, message, scroll_offset)
-    elif current_tab == 3:
-        draw_littlecore_ui(stdscr, mem, selected, message, scroll_offset)
-    elif current_tab == 4:
-        draw_dsu_ui(stdscr, mem, selected, message, scroll_offset, lpll_freq, b0pll_freq, b1pll_freq)
-    elif current_tab == 5:
-        draw_gpu_ui(stdscr, mem, selected, message, scroll_offset)
-    elif current_tab == 6:
-        draw_npu_ui(stdscr, mem, selected, message, scroll_offset)
-    #elif current_tab == 7:
-    #    draw_dram_ui(stdscr, mem, selected, message, scroll_offset)     // devmem read bus errors cause system freeze
-    elif current_tab == 7:
-        draw_coming_soon(stdscr, message, offset=3)
-        return scroll_offset
-
 def draw_coming_soon(stdscr, message=None, offset=3):
     if message is None:
         message = ["Coming soon..."]
@@ -317,10 +1069,8 @@ def draw_coming_soon(stdscr, message=None, offset=3):
     stdscr.addstr(y, x, placeholder, curses.A_BOLD)
 
     stdscr.addstr(curses.LINES - 1, 0, message[0])
-    stdscr.clrtoeol()
 
-def draw_general_info(stdscr, message="", offset=3):
-    paragraphs = [
+GENERAL_INFO_PARAGRAPHS = [
         "",
         "------------------------------------",
         "## Welcome to the RK3588 OC Tool! ##",
@@ -341,1145 +1091,394 @@ def draw_general_info(stdscr, message="", offset=3):
         "",
         "Enjoy tuning your RK3588! - SkatterBencher",
         ""
-    ]
-
-    max_width = int(curses.COLS * 0.80)
-    start_row = offset
-    row = start_row
-
-    for paragraph in paragraphs:
-        if paragraph == "":
-            row += 1
-            continue
-
-        wrapped_lines = textwrap.wrap(paragraph, width=max_width)
-        
-        for line in wrapped_lines:
-            x = (curses.COLS - max_width) // 2 + max((max_width - len(line)) // 2, 0)
-            stdscr.addstr(row, x, line)
-            row += 1
-
-    stdscr.move(curses.LINES - 1, 0)
-    stdscr.clrtoeol()
-
-    if message:
-        stdscr.addstr(curses.LINES - 1, 0, str(message))
-
-def draw_bigcore0_ui(stdscr, mem, selected, message, scroll_offset):
-    FIELD_NAME_COL_WIDTH = 25
-    VALUE_COL_WIDTH = 15
-    INFO_COL_WIDTH = 35
-
-    start_row = 2
-    visible_rows = curses.LINES - start_row - 2
-
-    # CRU & GRF Offsets
-    BIGCORE0_B0PLL_CON0 = 0x0000
-    BIGCORE0_B0PLL_CON1 = 0x0004
-    BIGCORE0_B0PLL_CON6 = 0x0018
-    BIGCORE0_MODE_CON00 = 0x0280
-    BIGCORE0_CLKSEL_CON00 = 0x0300
-    BIGCORE0_CLKSEL_CON01 = 0x0304
-    GRF_BIGCORE0_PVTPLL_CON0_L = 0x0000
-    GRF_BIGCORE0_PVTPLL_CON0_H = 0x0004
-    GRF_BIGCORE0_PVTPLL = 0x18
-
-    def read_pvtpll_freq(mem_grf):
-        # Read 32-bit value at offset (0x18)
-        freq_mhz = mem_grf.read32(GRF_BIGCORE0_PVTPLL)
-        return freq_mhz
-
-    # Clocking Parameters
-    SECTIONS = [
-        ("## bigcore0 pvtpll configuration ##", "GRF_BIGCORE0_BASE", [
-            ("osc_ring_sel", GRF_BIGCORE0_PVTPLL_CON0_L, (8, 10), "int", None, (0, 7)),
-                # 0 = HDBLVT20_INV_S_4, 1 = HDBLVT22_INV_S_4, 2 = Reserved, 3 = HDBSVT22_INV_S_4
-                # 4 = HDBLVT20_INV_SHSDB_4, 5 = HDBLVT22_INV_SHSDB_4, 6 = Reserved, 7 = HDBSVT22_INV_SHSDB_4
-            ("ring_length_sel", GRF_BIGCORE0_PVTPLL_CON0_H, (0, 5), "int", None, (0, 63)), #number of inventers = (n+5)*2
-        ]),
-        ("## b0pll configuration ##", "CRU_BIGCORE0_BASE", [
-            ("m_b0pll", BIGCORE0_B0PLL_CON0, (0, 9), "int", None, (64, 1023)),
-            ("p_b0pll", BIGCORE0_B0PLL_CON1, (0, 5), "int", None, (1, 63)),
-            ("s_b0pll", BIGCORE0_B0PLL_CON1, (6, 8), "int", None, (0, 6)),
-            ("clk_b0pll_mux", BIGCORE0_MODE_CON00, (0, 1), "enum",
-             {"xin_osc0_func": 0b00, "clk_b0pll": 0b01, "clk_deepslow": 0b10}),
-            ("b0pll_pll_reset", BIGCORE0_B0PLL_CON1, (13, 13), "int", None, (0, 1)),
-            ("b0pll_lock", BIGCORE0_B0PLL_CON6, (15, 15), "int", None, (0, 1)),
-        ]),
-        ("## bigcore0 mux configuration ##", "CRU_BIGCORE0_BASE", [
-            ("bigcore0_slow_sel", BIGCORE0_CLKSEL_CON00, (0, 0), "enum",
-             {"xin_osc0_func": 0b0, "clk_deepslow": 0b1}),
-            ("bigcore0_gpll_div", BIGCORE0_CLKSEL_CON00, (1, 5), "int", None, (0, 31)),
-            ("bigcore0_mux_sel", BIGCORE0_CLKSEL_CON00, (6, 7), "enum",
-             {"slow": 0b00, "gpll": 0b01, "b0pll": 0b10}),
-            # ("bigcore0_pvtpll_sel", BIGCORE0_CLKSEL_CON01, (14, 14), "enum",  // requires updating of cal_cnt register (0x8)
-            #  {"bigcore0_mux": 0b0, "xin_osc0_func": 0b1,}),                   // no logic implemented
-        ]),
-        ("## core configuration ##", "CRU_BIGCORE0_BASE", [
-            ("b0_uc_div", BIGCORE0_CLKSEL_CON00, (8, 12), "int", None, (0, 31)),
-            ("b0_clk_sel", BIGCORE0_CLKSEL_CON00, (13, 14), "enum",
-             {"UC_b0": 0b00, "Clean": 0b01, "PVTPLL": 0b10}),
-            ("b1_uc_div", BIGCORE0_CLKSEL_CON01, (0, 4), "int", None, (0, 31)),
-            ("b1_clk_sel", BIGCORE0_CLKSEL_CON01, (5, 6), "enum",
-             {"UC_b1": 0b00, "Clean": 0b01, "PVTPLL": 0b10}),
-        ]),
-    ]
-
-    FLAT_FIELDS = []
-    for _, base_tag, fields in SECTIONS:
-        mem_obj = reg_mem[base_tag]
-        for entry in fields:
-            name, offset, bit_range, ftype = entry[:4]
-            enum_map = entry[4] if len(entry) > 4 else None
-            val_range = entry[5] if len(entry) > 5 else None
-            lsb, msb = bit_range
-            FLAT_FIELDS.append((mem_obj, name, offset, lsb, msb, ftype, enum_map, val_range))
-
-    # Gather fields to display
-    display_lines = []
-    idx = 0
-    for section_title, base_tag, fields in SECTIONS:
-        display_lines.append(("", "spacer"))
-        display_lines.append((section_title, "section"))
-        for field in fields:
-            name, offset, bit_range, ftype = field[:4]
-            enum_map = field[4] if len(field) > 4 else None
-            val_range = field[5] if len(field) > 5 else None
-            lsb, msb = bit_range
-
-            mem_obj = reg_mem[base_tag]
-            reg_val = mem_obj.read32(offset)
-            val = get_bits(reg_val, lsb, msb)
-
-            if ftype == "enum":
-                disp_val = next((k for k, v in enum_map.items() if v == val), f"unknown({val})")
-                extra = f"Options: {list(enum_map.keys())}"
-            else:
-                disp_val = str(val)
-                extra = f"Range: {val_range}" if val_range else ""
-
-            display_lines.append(((name, disp_val, extra), "field", idx))
-            idx += 1
-
-    m_b0 = get_val("m_b0pll", FLAT_FIELDS)
-    p_b0 = get_val("p_b0pll", FLAT_FIELDS)
-    s_b0 = get_val("s_b0pll", FLAT_FIELDS)
-
-    b0pll_freq = (XIN_OSC0_FREQ * m_b0) / p_b0 / (1 << s_b0) if m_b0 and p_b0 else 0
-
-    bigcore0_slow_sel = get_val("bigcore0_slow_sel", FLAT_FIELDS)
-    bigcore0_gpll_div = get_val("bigcore0_gpll_div", FLAT_FIELDS)
-    bigcore0_mux_sel = get_val("bigcore0_mux_sel", FLAT_FIELDS)
-
-    b0_uc_div = get_val("b0_uc_div", FLAT_FIELDS)
-    b1_uc_div = get_val("b1_uc_div", FLAT_FIELDS)
-
-    b0_clk_sel = get_val("b0_clk_sel", FLAT_FIELDS)
-    b1_clk_sel = get_val("b1_clk_sel", FLAT_FIELDS)
-
-    if bigcore0_mux_sel == "slow":
-        bigcore0_mux_clk = XIN_OSC0_FREQ if bigcore0_slow_sel == "xin_osc0_func" else DEEPSLOW_FREQ
-    elif bigcore0_mux_sel == "gpll":
-        bigcore0_mux_clk = GPLL_FREQ / (bigcore0_gpll_div + 1)
-    elif bigcore0_mux_sel == "b0pll":
-        bigcore0_mux_clk = b0pll_freq
-    else:
-        bigcore0_mux_clk = 0
-
-    b0_uc_clk = bigcore0_mux_clk / (b0_uc_div + 1)
-    b1_uc_clk = bigcore0_mux_clk / (b1_uc_div + 1)
-
-    mem_grf = Registers(GRF_BIGCORE0_BASE, 0x1000)
-    bigcore0_pvtpll_freq = read_pvtpll_freq(mem_grf)
-    mem_grf.close()
-
-    def get_clk_freq(sel, uc_clk):
-        if sel in ("UC_b0", "UC_b1"):
-            return uc_clk
-        elif sel == "Clean":
-            return CLEAN_FREQ
-        elif sel == "PVTPLL":
-            return bigcore0_pvtpll_freq
-        else:
-            return 0
-
-    b0_clk_freq = get_clk_freq(b0_clk_sel, b0_uc_clk)
-    b1_clk_freq = get_clk_freq(b1_clk_sel, b1_uc_clk)
-
-    freq_lines = [
-        f"GPLL Frequency:       {GPLL_FREQ:.0f} MHz",
-        f"B0PLL Frequency:      {b0pll_freq:.0f} MHz",
-        f"Bigcore0 MUX Freq:    {bigcore0_mux_clk:.0f} MHz from {bigcore0_mux_sel}",
-        f"Bigcore0 PVTPLL Freq: {bigcore0_pvtpll_freq:.0f} MHz",
-        f"B0 UC Frequency:      {b0_uc_clk:.0f} MHz",
-        f"B1 UC Frequency:      {b1_uc_clk:.0f} MHz",
-        f"--------------",
-        f"B0 Clock Frequency:   {b0_clk_freq:.0f} MHz from {b0_clk_sel}",
-        f"B1 Clock Frequency:   {b1_clk_freq:.0f} MHz from {b1_clk_sel}",
-    ]
-
-    # Add spacer before frequency section
-    display_lines.append(("", "spacer"))
-    display_lines.append(("## frequency configuration ##", "section"))
+]
 
-    # Add frequency lines as freq entries (no index needed)
-    for line in freq_lines:
-        display_lines.append(((None, line, ""), "freq"))
+# Wrapped/centered layout per terminal width; the text is static, so the
+# textwrap + centering work only reruns after a resize
+_wrap_cache = {}
 
-    # Clamp scroll_offset
-    if scroll_offset is None:
-        scroll_offset = 0
-    if selected < scroll_offset:
-        scroll_offset = selected
-    elif selected >= scroll_offset + visible_rows:
-        scroll_offset = selected - visible_rows + 1
-
-    # Render visible lines
-    for visible_idx, (entry, etype, *rest) in enumerate(display_lines[scroll_offset:scroll_offset + visible_rows]):
-        row = start_row + visible_idx 
-
-        if etype == "spacer":
-            continue
-        elif etype == "section":
-            stdscr.addstr(row, 0, entry, curses.color_pair(1) | curses.A_BOLD)
-        elif etype == "field":
-            name, disp_val, extra = entry
-            field_idx = rest[0]
-            highlight = curses.A_REVERSE if field_idx == selected else curses.A_NORMAL
-            line = f"{name:<{FIELD_NAME_COL_WIDTH}}: {disp_val:<{VALUE_COL_WIDTH}} {extra:<{INFO_COL_WIDTH}}"
-            stdscr.addstr(row, 2, line[:curses.COLS - 3], highlight)
-        elif etype == "freq":
-            _, line, _ = entry
-            stdscr.addstr(row, 2, line[:curses.COLS - 3])
-
-    return scroll_offset, FLAT_FIELDS, b0pll_freq
-
-def draw_bigcore1_ui(stdscr, mem, selected, message, scroll_offset):
-    FIELD_NAME_COL_WIDTH = 25
-    VALUE_COL_WIDTH = 15
-    INFO_COL_WIDTH = 35
-
-    start_row = 2
-    visible_rows = curses.LINES - start_row - 2
-
-    # CRU & GRF Offsets
-    BIGCORE1_B1PLL_CON0 = 0x0020
-    BIGCORE1_B1PLL_CON1 = 0x0024
-    BIGCORE1_B1PLL_CON6 = 0x0038
-    BIGCORE1_MODE_CON00 = 0x0280
-    BIGCORE1_CLKSEL_CON00 = 0x0300
-    BIGCORE1_CLKSEL_CON01 = 0x0304
-    GRF_BIGCORE1_PVTPLL_CON0_L = 0x0000
-    GRF_BIGCORE1_PVTPLL_CON0_H = 0x0004
-    GRF_BIGCORE1_PVTPLL = 0x18
-
-    def read_pvtpll_freq(mem_grf):
-        # Read 32-bit value at offset (0x18)
-        freq_mhz = mem_grf.read32(GRF_BIGCORE1_PVTPLL)
-        return freq_mhz
-
-    # Clocking Parameters
-    SECTIONS = [
-        ("## bigcore1 pvtpll configuration ##", "GRF_BIGCORE1_BASE", [
-            ("osc_ring_sel", GRF_BIGCORE1_PVTPLL_CON0_L, (8, 10), "int", None, (0, 7)),
-                # 0 = HDBLVT20_INV_S_4, 1 = HDBLVT22_INV_S_4, 2 = Reserved, 3 = HDBSVT22_INV_S_4
-                # 4 = HDBLVT20_INV_SHSDB_4, 5 = HDBLVT22_INV_SHSDB_4, 6 = Reserved, 7 = HDBSVT22_INV_SHSDB_4
-            ("ring_length_sel", GRF_BIGCORE1_PVTPLL_CON0_H, (0, 5), "int", None, (0, 63)), #number of inventers = (n+5)*2
-        ]),
-        ("## b1pll configuration ##", "CRU_BIGCORE1_BASE", [
-            ("m_b1pll", BIGCORE1_B1PLL_CON0, (0, 9), "int", None, (64, 1023)),
-            ("p_b1pll", BIGCORE1_B1PLL_CON1, (0, 5), "int", None, (1, 63)),
-            ("s_b1pll", BIGCORE1_B1PLL_CON1, (6, 8), "int", None, (0, 6)),
-            ("clk_b1pll_mux", BIGCORE1_MODE_CON00, (0, 1), "enum",
-             {"xin_osc0_func": 0b00, "clk_b1pll": 0b01, "clk_deepslow": 0b10}),
-            ("b1pll_pll_reset", BIGCORE1_B1PLL_CON1, (13, 13), "int", None, (0, 1)),
-            ("b1pll_lock", BIGCORE1_B1PLL_CON6, (15, 15), "int", None, (0, 1)),
-        ]),
-        ("## bigcore1 mux configuration ##", "CRU_BIGCORE1_BASE", [
-            ("bigcore1_slow_sel", BIGCORE1_CLKSEL_CON00, (0, 0), "enum",
-             {"xin_osc0_func": 0b0, "clk_deepslow": 0b1}),
-            ("bigcore1_gpll_div", BIGCORE1_CLKSEL_CON00, (1, 5), "int", None, (0, 31)),
-            ("bigcore1_mux_sel", BIGCORE1_CLKSEL_CON00, (6, 7), "enum",
-             {"slow": 0b00, "gpll": 0b01, "b1pll": 0b10}),
-            # ("bigcore1_pvtpll_sel", BIGCORE1_CLKSEL_CON01, (14, 14), "enum",  // requires updating of cal_cnt register (0x8)
-            #  {"bigcore1_mux": 0b0, "xin_osc0_func": 0b1,}),                   // no logic implemented
-        ]),
-        ("## core configuration ##", "CRU_BIGCORE1_BASE", [
-            ("b2_uc_div", BIGCORE1_CLKSEL_CON00, (8, 12), "int", None, (0, 31)),
-            ("b2_clk_sel", BIGCORE1_CLKSEL_CON00, (13, 14), "enum",
-             {"UC_b2": 0b00, "Clean": 0b01, "PVTPLL": 0b10}),
-            ("b3_uc_div", BIGCORE1_CLKSEL_CON01, (0, 4), "int", None, (0, 31)),
-            ("b3_clk_sel", BIGCORE1_CLKSEL_CON01, (5, 6), "enum",
-             {"UC_b3": 0b00, "Clean": 0b01, "PVTPLL": 0b10}),
-        ]),
-    ]
-
-    FLAT_FIELDS = []
-    for _, base_tag, fields in SECTIONS:
-        mem_obj = reg_mem[base_tag]
-        for entry in fields:
-            name, offset, bit_range, ftype = entry[:4]
-            enum_map = entry[4] if len(entry) > 4 else None
-            val_range = entry[5] if len(entry) > 5 else None
-            lsb, msb = bit_range
-            FLAT_FIELDS.append((mem_obj, name, offset, lsb, msb, ftype, enum_map, val_range))
-
-    # Gather fields to display
-    display_lines = []
-    idx = 0
-    for section_title, base_tag, fields in SECTIONS:
-        display_lines.append(("", "spacer"))
-        display_lines.append((section_title, "section"))
-        for field in fields:
-            name, offset, bit_range, ftype = field[:4]
-            enum_map = field[4] if len(field) > 4 else None
-            val_range = field[5] if len(field) > 5 else None
-            lsb, msb = bit_range
-
-            mem_obj = reg_mem[base_tag]
-            reg_val = mem_obj.read32(offset)
-            val = get_bits(reg_val, lsb, msb)
-
-            if ftype == "enum":
-                disp_val = next((k for k, v in enum_map.items() if v == val), f"unknown({val})")
-                extra = f"Options: {list(enum_map.keys())}"
-            else:
-                disp_val = str(val)
-                extra = f"Range: {val_range}" if val_range else ""
-
-            display_lines.append(((name, disp_val, extra), "field", idx))
-            idx += 1
-
-    m_b1 = get_val("m_b1pll", FLAT_FIELDS)
-    p_b1 = get_val("p_b1pll", FLAT_FIELDS)
-    s_b1 = get_val("s_b1pll", FLAT_FIELDS)
-
-    b1pll_freq = (XIN_OSC0_FREQ * m_b1) / p_b1 / (1 << s_b1) if m_b1 and p_b1 else 0
+def draw_general_info(stdscr, message="", offset=3):
+    layout = _wrap_cache.get((curses.COLS, offset))
+    if layout is None:
+        layout = []
+        max_width = int(curses.COLS * 0.80)
+        row = offset
 
-    bigcore1_slow_sel = get_val("bigcore1_slow_sel", FLAT_FIELDS)
-    bigcore1_gpll_div = get_val("bigcore1_gpll_div", FLAT_FIELDS)
-    bigcore1_mux_sel = get_val("bigcore1_mux_sel", FLAT_FIELDS)
+        for paragraph in GENERAL_INFO_PARAGRAPHS:
+            if paragraph == "":
+                row += 1
+                continue
 
-    b2_uc_div = get_val("b2_uc_div", FLAT_FIELDS)
-    b3_uc_div = get_val("b3_uc_div", FLAT_FIELDS)
+            for line in textwrap.wrap(paragraph, width=max_width):
+                x = (curses.COLS - max_width) // 2 + max((max_width - len(line)) // 2, 0)
+                layout.append((row, x, line))
+                row += 1
 
-    b2_clk_sel = get_val("b2_clk_sel", FLAT_FIELDS)
-    b3_clk_sel = get_val("b3_clk_sel", FLAT_FIELDS)
+        _wrap_cache[(curses.COLS, offset)] = layout
 
-    if bigcore1_mux_sel == "slow":
-        bigcore1_mux_clk = XIN_OSC0_FREQ if bigcore1_slow_sel == "xin_osc0_func" else DEEPSLOW_FREQ
-    elif bigcore1_mux_sel == "gpll":
-        bigcore1_mux_clk = GPLL_FREQ / (bigcore1_gpll_div + 1)
-    elif bigcore1_mux_sel == "b1pll":
-        bigcore1_mux_clk = b1pll_freq
-    else:
-        bigcore1_mux_clk = 0
-
-    b2_uc_clk = bigcore1_mux_clk / (b2_uc_div + 1)
-    b3_uc_clk = bigcore1_mux_clk / (b3_uc_div + 1)
-
-    mem_grf = Registers(GRF_BIGCORE1_BASE, 0x1000)
-    bigcore1_pvtpll_freq = read_pvtpll_freq(mem_grf)
-    mem_grf.close()
-
-    def get_clk_freq(sel, uc_clk):
-        if sel in ("UC_b2", "UC_b3"):
-            return uc_clk
-        elif sel == "Clean":
-            return CLEAN_FREQ
-        elif sel == "PVTPLL":
-            return bigcore1_pvtpll_freq
-        else:
-            return 0
+    for row, x, line in layout:
+        stdscr.addstr(row, x, line)
 
-    b2_clk_freq = get_clk_freq(b2_clk_sel, b2_uc_clk)
-    b3_clk_freq = get_clk_freq(b3_clk_sel, b3_uc_clk)
+    if message:
+        stdscr.addstr(curses.LINES - 1, 0, str(message))
 
-    freq_lines = [
-        f"GPLL Frequency:       {GPLL_FREQ:.0f} MHz",
-        f"B1PLL Frequency:      {b1pll_freq:.0f} MHz",
-        f"Bigcore1 MUX Freq:    {bigcore1_mux_clk:.0f} MHz from {bigcore1_mux_sel}",
-        f"Bigcore1 PVTPLL Freq: {bigcore1_pvtpll_freq:.0f} MHz",
-        f"B2 UC Frequency:      {b2_uc_clk:.0f} MHz",
-        f"B3 UC Frequency:      {b3_uc_clk:.0f} MHz",
-        f"--------------",
-        f"B2 Clock Frequency:   {b2_clk_freq:.0f} MHz from {b2_clk_sel}",
-        f"B3 Clock Frequency:   {b3_clk_freq:.0f} MHz from {b3_clk_sel}",
+def bigcore0_freq_lines(snap, pll_state):
+    b0pll_freq = pll_freq(BIGCORE0_FIELDS_BY_NAME, snap, "m_b0pll", "p_b0pll", "s_b0pll")
+    pll_state["b0pll"] = b0pll_freq
+
+    bigcore0_slow_code = get_code("bigcore0_slow_sel", BIGCORE0_FIELDS_BY_NAME, snap)
+    bigcore0_gpll_div = get_val("bigcore0_gpll_div", BIGCORE0_FIELDS_BY_NAME, snap)
+    bigcore0_mux_code = get_code("bigcore0_mux_sel", BIGCORE0_FIELDS_BY_NAME, snap)
+    bigcore0_mux_sel = get_val("bigcore0_mux_sel", BIGCORE0_FIELDS_BY_NAME, snap)
+
+    b0_uc_div = get_val("b0_uc_div", BIGCORE0_FIELDS_BY_NAME, snap)
+    b1_uc_div = get_val("b1_uc_div", BIGCORE0_FIELDS_BY_NAME, snap)
+
+    b0_clk_code = get_code("b0_clk_sel", BIGCORE0_FIELDS_BY_NAME, snap)
+    b1_clk_code = get_code("b1_clk_sel", BIGCORE0_FIELDS_BY_NAME, snap)
+    b0_clk_sel = get_val("b0_clk_sel", BIGCORE0_FIELDS_BY_NAME, snap)
+    b1_clk_sel = get_val("b1_clk_sel", BIGCORE0_FIELDS_BY_NAME, snap)
+
+    bigcore0_mux_clk = {
+        MUX_SEL_SLOW: XIN_OSC0_FREQ if bigcore0_slow_code == SLOW_SEL_XIN_OSC0 else DEEPSLOW_FREQ,
+        MUX_SEL_GPLL: GPLL_FREQ / (bigcore0_gpll_div + 1),
+        MUX_SEL_PLL: b0pll_freq,
+    }.get(bigcore0_mux_code, 0)
+
+    bigcore0_pvtpll_freq = reg_mem["GRF_BIGCORE0_BASE"].read32(GRF_BIGCORE0_PVTPLL)
+
+    (b0_uc_clk, b1_uc_clk), (b0_clk_freq, b1_clk_freq) = core_clk_freqs(
+        bigcore0_mux_clk, (b0_uc_div, b1_uc_div), (b0_clk_code, b1_clk_code),
+        bigcore0_pvtpll_freq)
+
+    t = BIGCORE0_FREQ_TEMPLATES
+    return [
+        GPLL_LINE_BIG,
+        t[0] % b0pll_freq,
+        t[1] % (bigcore0_mux_clk, bigcore0_mux_sel),
+        t[2] % bigcore0_pvtpll_freq,
+        t[3] % b0_uc_clk,
+        t[4] % b1_uc_clk,
+        FREQ_SEP_LINE,
+        t[5] % (b0_clk_freq, b0_clk_sel),
+        t[6] % (b1_clk_freq, b1_clk_sel),
     ]
 
-    # Add spacer before frequency section
-    display_lines.append(("", "spacer"))
-    display_lines.append(("## frequency configuration ##", "section"))
-
-    # Add frequency lines as freq entries (no index needed)
-    for line in freq_lines:
-        display_lines.append(((None, line, ""), "freq"))
-
-    # Clamp scroll_offset
-    if scroll_offset is None:
-        scroll_offset = 0
-    if selected < scroll_offset:
-        scroll_offset = selected
-    elif selected >= scroll_offset + visible_rows:
-        scroll_offset = selected - visible_rows + 1
-
-    # Render visible lines
-    for visible_idx, (entry, etype, *rest) in enumerate(display_lines[scroll_offset:scroll_offset + visible_rows]):
-        row = start_row + visible_idx 
-
-        if etype == "spacer":
-            continue
-        elif etype == "section":
-            stdscr.addstr(row, 0, entry, curses.color_pair(1) | curses.A_BOLD)
-        elif etype == "field":
-            name, disp_val, extra = entry
-            field_idx = rest[0]
-            highlight = curses.A_REVERSE if field_idx == selected else curses.A_NORMAL
-            line = f"{name:<{FIELD_NAME_COL_WIDTH}}: {disp_val:<{VALUE_COL_WIDTH}} {extra:<{INFO_COL_WIDTH}}"
-            stdscr.addstr(row, 2, line[:curses.COLS - 3], highlight)
-        elif etype == "freq":
-            _, line, _ = entry
-            stdscr.addstr(row, 2, line[:curses.COLS - 3])
-
-    return scroll_offset, FLAT_FIELDS, b1pll_freq
-
-def draw_littlecore_ui(stdscr, mem, selected, message, scroll_offset):
-    FIELD_NAME_COL_WIDTH = 25
-    VALUE_COL_WIDTH = 15
-    INFO_COL_WIDTH = 35
-
-    start_row = 2
-    visible_rows = curses.LINES - start_row - 2
-
-    # CRU & GRF Offsets
-    DSU_LPLL_CON0 = 0x0040
-    DSU_LPLL_CON1 = 0x0044
-    DSU_LPLL_CON6 = 0x0058
-    DSU_MODE_CON00 = 0x0280
-    DSU_CLKSEL_CON00 = 0x0300
-    DSU_CLKSEL_CON01 = 0x0304
-    DSU_CLKSEL_CON02 = 0x0308
-    DSU_CLKSEL_CON03 = 0x030C
-    DSU_CLKSEL_CON04 = 0x0310
-    DSU_CLKSEL_CON05 = 0x0314
-    DSU_CLKSEL_CON06 = 0x0318
-    DSU_CLKSEL_CON07 = 0x031C
-    GRF_LITCORE_PVTPLL_CON0_L = 0x40
-    GRF_LITCORE_PVTPLL_CON0_H = 0x44
-    GRF_LITCORE_PVTPLL = 0x60
-
-    def read_pvtpll_freq(mem_grf):
-        freq_mhz = mem_grf.read32(GRF_LITCORE_PVTPLL)
-        return freq_mhz
-
-    # Clocking Parameters
-    SECTIONS = [
-        ("## littlecore pvtpll configuration ##", "GRF_LITCORE_BASE", [
-            ("ring_length_sel", GRF_LITCORE_PVTPLL_CON0_L, (8, 10), "int", None, (0, 7)),
-                # 0 = HDBLVT20_INV_S_4, 1 = HDBLVT22_INV_S_4, 2 = Reserved, 3 = HDBSVT22_INV_S_4
-                # 4 = HDBLVT20_INV_SHSDB_4, 5 = HDBLVT22_INV_SHSDB_4, 6 = Reserved, 7 = HDBSVT22_INV_SHSDB_4
-            ("ring_length_sel", GRF_LITCORE_PVTPLL_CON0_H, (0, 5), "int", None, (0, 63)), #number of inventers = (n+5)*2
-        ]),
-        ("## lpll configuration ##", "CRU_DSU_BASE", [
-            ("m_lpll", DSU_LPLL_CON0, (0, 9), "int", None, (64, 1023)),
-            ("p_lpll", DSU_LPLL_CON1, (0, 5), "int", None, (1, 63)),
-            ("s_lpll", DSU_LPLL_CON1, (6, 8), "int", None, (0, 6)),
-            ("clk_lpll_mux", DSU_MODE_CON00, (0, 1), "enum",
-             {"xin_osc0_func": 0b00, "clk_lpll": 0b01, "clk_deepslow": 0b10}),
-            ("lpll_pll_reset", DSU_LPLL_CON1, (13, 13), "int", None, (0, 1)),
-            ("lpll_lock", DSU_LPLL_CON6, (15, 15), "int", None, (0, 1)),
-        ]),
-        ("## littlecore mux configuration ##", "CRU_DSU_BASE", [
-            ("littlecore_slow_sel", DSU_CLKSEL_CON00, (0, 0), "enum",
-             {"xin_osc0_func": 0b0, "clk_deepslow": 0b1}),
-            ("littlecore_gpll_div", DSU_CLKSEL_CON05, (9, 13), "int", None, (0, 31)),
-            ("littlecore_mux_sel", DSU_CLKSEL_CON05, (14, 15), "enum",
-             {"slow": 0b00, "gpll": 0b01, "lpll": 0b10}),
-            # ("littlecore_pvtpll_sel", DSU_CLKSEL_CON04, (9, 9), "enum",   // requires updating of cal_cnt register (0x48)
-            #  {"littlecore_mux": 0b0, "xin_osc0_func": 0b1,}),             // no logic implemented
-        ]),
-        ("## core configuration ##", "CRU_DSU_BASE", [
-            ("l0_uc_div", DSU_CLKSEL_CON06, (0, 4), "int", None, (0, 31)),
-            ("l0_clk_sel", DSU_CLKSEL_CON06, (5, 6), "enum",
-             {"UC_l0": 0b00, "Clean": 0b01, "PVTPLL": 0b10}),
-            ("l1_uc_div", DSU_CLKSEL_CON06, (7, 11), "int", None, (0, 31)),
-            ("l1_clk_sel", DSU_CLKSEL_CON06, (12, 13), "enum",
-             {"UC_l1": 0b00, "Clean": 0b01, "PVTPLL": 0b10}),
-            ("l2_uc_div", DSU_CLKSEL_CON07, (0, 4), "int", None, (0, 31)),
-            ("l2_clk_sel", DSU_CLKSEL_CON07, (5, 6), "enum",
-             {"UC_l2": 0b00, "Clean": 0b01, "PVTPLL": 0b10}),
-            ("l3_uc_div", DSU_CLKSEL_CON07, (7, 11), "int", None, (0, 31)),
-            ("l3_clk_sel", DSU_CLKSEL_CON07, (12, 13), "enum",
-             {"UC_l3": 0b00, "Clean": 0b01, "PVTPLL": 0b10}),
-        ]),
+def bigcore1_freq_lines(snap, pll_state):
+    b1pll_freq = pll_freq(BIGCORE1_FIELDS_BY_NAME, snap, "m_b1pll", "p_b1pll", "s_b1pll")
+    pll_state["b1pll"] = b1pll_freq
+
+    bigcore1_slow_code = get_code("bigcore1_slow_sel", BIGCORE1_FIELDS_BY_NAME, snap)
+    bigcore1_gpll_div = get_val("bigcore1_gpll_div", BIGCORE1_FIELDS_BY_NAME, snap)
+    bigcore1_mux_code = get_code("bigcore1_mux_sel", BIGCORE1_FIELDS_BY_NAME, snap)
+    bigcore1_mux_sel = get_val("bigcore1_mux_sel", BIGCORE1_FIELDS_BY_NAME, snap)
+
+    b2_uc_div = get_val("b2_uc_div", BIGCORE1_FIELDS_BY_NAME, snap)
+    b3_uc_div = get_val("b3_uc_div", BIGCORE1_FIELDS_BY_NAME, snap)
+
+    b2_clk_code = get_code("b2_clk_sel", BIGCORE1_FIELDS_BY_NAME, snap)
+    b3_clk_code = get_code("b3_clk_sel", BIGCORE1_FIELDS_BY_NAME, snap)
+    b2_clk_sel = get_val("b2_clk_sel", BIGCORE1_FIELDS_BY_NAME, snap)
+    b3_clk_sel = get_val("b3_clk_sel", BIGCORE1_FIELDS_BY_NAME, snap)
+
+    bigcore1_mux_clk = {
+        MUX_SEL_SLOW: XIN_OSC0_FREQ if bigcore1_slow_code == SLOW_SEL_XIN_OSC0 else DEEPSLOW_FREQ,
+        MUX_SEL_GPLL: GPLL_FREQ / (bigcore1_gpll_div + 1),
+        MUX_SEL_PLL: b1pll_freq,
+    }.get(bigcore1_mux_code, 0)
+
+    bigcore1_pvtpll_freq = reg_mem["GRF_BIGCORE1_BASE"].read32(GRF_BIGCORE1_PVTPLL)
+
+    (b2_uc_clk, b3_uc_clk), (b2_clk_freq, b3_clk_freq) = core_clk_freqs(
+        bigcore1_mux_clk, (b2_uc_div, b3_uc_div), (b2_clk_code, b3_clk_code),
+        bigcore1_pvtpll_freq)
+
+    t = BIGCORE1_FREQ_TEMPLATES
+    return [
+        GPLL_LINE_BIG,
+        t[0] % b1pll_freq,
+        t[1] % (bigcore1_mux_clk, bigcore1_mux_sel),
+        t[2] % bigcore1_pvtpll_freq,
+        t[3] % b2_uc_clk,
+        t[4] % b3_uc_clk,
+        FREQ_SEP_LINE,
+        t[5] % (b2_clk_freq, b2_clk_sel),
+        t[6] % (b3_clk_freq, b3_clk_sel),
     ]
 
-    FLAT_FIELDS = []
-    for _, base_tag, fields in SECTIONS:
-        mem_obj = reg_mem[base_tag]
-        for entry in fields:
-            name, offset, bit_range, ftype = entry[:4]
-            enum_map = entry[4] if len(entry) > 4 else None
-            val_range = entry[5] if len(entry) > 5 else None
-            lsb, msb = bit_range
-            FLAT_FIELDS.append((mem_obj, name, offset, lsb, msb, ftype, enum_map, val_range))
-
-    # Gather fields to display
-    display_lines = []
-    idx = 0
-    for section_title, base_tag, fields in SECTIONS:
-        display_lines.append(("", "spacer"))
-        display_lines.append((section_title, "section"))
-        for field in fields:
-            name, offset, bit_range, ftype = field[:4]
-            enum_map = field[4] if len(field) > 4 else None
-            val_range = field[5] if len(field) > 5 else None
-            lsb, msb = bit_range
-
-            mem_obj = reg_mem[base_tag]
-            reg_val = mem_obj.read32(offset)
-            val = get_bits(reg_val, lsb, msb)
-
-            if ftype == "enum":
-                disp_val = next((k for k, v in enum_map.items() if v == val), f"unknown({val})")
-                extra = f"Options: {list(enum_map.keys())}"
-            else:
-                disp_val = str(val)
-                extra = f"Range: {val_range}" if val_range else ""
-
-            display_lines.append(((name, disp_val, extra), "field", idx))
-            idx += 1
-
+def littlecore_freq_lines(snap, pll_state):
     # Gather GRF data
-    mem_grf = Registers(GRF_LITCORE_BASE, 0x1000)
-    littlecore_pvtpll_freq = read_pvtpll_freq(mem_grf)
-    mem_grf.close()
+    littlecore_pvtpll_freq = reg_mem["GRF_LITCORE_BASE"].read32(GRF_LITCORE_PVTPLL)
 
     # Gather CRU data
-    m_l = get_val("m_lpll", FLAT_FIELDS)
-    p_l = get_val("p_lpll", FLAT_FIELDS)
-    s_l = get_val("s_lpll", FLAT_FIELDS)
-
-    lpll_freq = (XIN_OSC0_FREQ * m_l) / p_l / (1 << s_l) if m_l and p_l else 0
-
-    littlecore_slow_sel = get_val("littlecore_slow_sel", FLAT_FIELDS)
-    littlecore_gpll_div = get_val("littlecore_gpll_div", FLAT_FIELDS)
-    littlecore_mux_sel = get_val("littlecore_mux_sel", FLAT_FIELDS)
-
-    l0_uc_div = get_val("l0_uc_div", FLAT_FIELDS)
-    l1_uc_div = get_val("l1_uc_div", FLAT_FIELDS)
-    l2_uc_div = get_val("l2_uc_div", FLAT_FIELDS)
-    l3_uc_div = get_val("l3_uc_div", FLAT_FIELDS)
-
-    l0_clk_sel = get_val("l0_clk_sel", FLAT_FIELDS)
-    l1_clk_sel = get_val("l1_clk_sel", FLAT_FIELDS)
-    l2_clk_sel = get_val("l2_clk_sel", FLAT_FIELDS)
-    l3_clk_sel = get_val("l3_clk_sel", FLAT_FIELDS)
-
-    if littlecore_mux_sel == "slow":
-        littlecore_mux_clk = XIN_OSC0_FREQ if littlecore_slow_sel == "xin_osc0_func" else DEEPSLOW_FREQ
-    elif littlecore_mux_sel == "gpll":
-        littlecore_mux_clk = GPLL_FREQ / (littlecore_gpll_div + 1)
-    elif littlecore_mux_sel == "lpll":
-        littlecore_mux_clk = lpll_freq
-    else:
-        littlecore_mux_clk = 0
-
-    l0_uc_clk = littlecore_mux_clk / (l0_uc_div + 1)
-    l1_uc_clk = littlecore_mux_clk / (l1_uc_div + 1)
-    l2_uc_clk = littlecore_mux_clk / (l2_uc_div + 1)
-    l3_uc_clk = littlecore_mux_clk / (l3_uc_div + 1)
-
-    def get_clk_freq(sel, uc_clk):
-        if sel in ("UC_l0", "UC_l1", "UC_l2", "UC_l3"):
-            return uc_clk
-        elif sel == "Clean":
-            return CLEAN_FREQ
-        elif sel == "PVTPLL":
-            return littlecore_pvtpll_freq
-        else:
-            return 0
-
-    l0_clk_freq = get_clk_freq(l0_clk_sel, l0_uc_clk)
-    l1_clk_freq = get_clk_freq(l1_clk_sel, l1_uc_clk)
-    l2_clk_freq = get_clk_freq(l2_clk_sel, l2_uc_clk)
-    l3_clk_freq = get_clk_freq(l3_clk_sel, l3_uc_clk)
-
-    freq_lines = [
-        f"GPLL Frequency:           {GPLL_FREQ:.0f} MHz",
-        f"LPLL Frequency:           {lpll_freq:.0f} MHz",
-        f"Littlecore MUX Freq:      {littlecore_mux_clk:.0f} MHz from {littlecore_mux_sel}",
-        f"Littlecore PVTPLL Freq:   {littlecore_pvtpll_freq:.0f} MHz",
-        f"L0 UC Frequency:          {l0_uc_clk:.0f} MHz",
-        f"L1 UC Frequency:          {l1_uc_clk:.0f} MHz",
-        f"L2 UC Frequency:          {l2_uc_clk:.0f} MHz",
-        f"L3 UC Frequency:          {l3_uc_clk:.0f} MHz",
-        f"--------------",
-        f"L0 Clock Frequency:       {l0_clk_freq:.0f} MHz from {l0_clk_sel}",
-        f"L1 Clock Frequency:       {l1_clk_freq:.0f} MHz from {l1_clk_sel}",
-        f"L2 Clock Frequency:       {l2_clk_freq:.0f} MHz from {l2_clk_sel}",
-        f"L3 Clock Frequency:       {l3_clk_freq:.0f} MHz from {l3_clk_sel}",
+    lpll_freq = pll_freq(LITTLECORE_FIELDS_BY_NAME, snap, "m_lpll", "p_lpll", "s_lpll")
+    pll_state["lpll"] = lpll_freq
+
+    littlecore_slow_code = get_code("littlecore_slow_sel", LITTLECORE_FIELDS_BY_NAME, snap)
+    littlecore_gpll_div = get_val("littlecore_gpll_div", LITTLECORE_FIELDS_BY_NAME, snap)
+    littlecore_mux_code = get_code("littlecore_mux_sel", LITTLECORE_FIELDS_BY_NAME, snap)
+    littlecore_mux_sel = get_val("littlecore_mux_sel", LITTLECORE_FIELDS_BY_NAME, snap)
+
+    l0_uc_div = get_val("l0_uc_div", LITTLECORE_FIELDS_BY_NAME, snap)
+    l1_uc_div = get_val("l1_uc_div", LITTLECORE_FIELDS_BY_NAME, snap)
+    l2_uc_div = get_val("l2_uc_div", LITTLECORE_FIELDS_BY_NAME, snap)
+    l3_uc_div = get_val("l3_uc_div", LITTLECORE_FIELDS_BY_NAME, snap)
+
+    l0_clk_code = get_code("l0_clk_sel", LITTLECORE_FIELDS_BY_NAME, snap)
+    l1_clk_code = get_code("l1_clk_sel", LITTLECORE_FIELDS_BY_NAME, snap)
+    l2_clk_code = get_code("l2_clk_sel", LITTLECORE_FIELDS_BY_NAME, snap)
+    l3_clk_code = get_code("l3_clk_sel", LITTLECORE_FIELDS_BY_NAME, snap)
+    l0_clk_sel = get_val("l0_clk_sel", LITTLECORE_FIELDS_BY_NAME, snap)
+    l1_clk_sel = get_val("l1_clk_sel", LITTLECORE_FIELDS_BY_NAME, snap)
+    l2_clk_sel = get_val("l2_clk_sel", LITTLECORE_FIELDS_BY_NAME, snap)
+    l3_clk_sel = get_val("l3_clk_sel", LITTLECORE_FIELDS_BY_NAME, snap)
+
+    littlecore_mux_clk = {
+        MUX_SEL_SLOW: XIN_OSC0_FREQ if littlecore_slow_code == SLOW_SEL_XIN_OSC0 else DEEPSLOW_FREQ,
+        MUX_SEL_GPLL: GPLL_FREQ / (littlecore_gpll_div + 1),
+        MUX_SEL_PLL: lpll_freq,
+    }.get(littlecore_mux_code, 0)
+
+    ((l0_uc_clk, l1_uc_clk, l2_uc_clk, l3_uc_clk),
+     (l0_clk_freq, l1_clk_freq, l2_clk_freq, l3_clk_freq)) = core_clk_freqs(
+        littlecore_mux_clk,
+        (l0_uc_div, l1_uc_div, l2_uc_div, l3_uc_div),
+        (l0_clk_code, l1_clk_code, l2_clk_code, l3_clk_code),
+        littlecore_pvtpll_freq)
+
+    t = LITTLECORE_FREQ_TEMPLATES
+    return [
+        GPLL_LINE_WIDE,
+        t[0] % lpll_freq,
+        t[1] % (littlecore_mux_clk, littlecore_mux_sel),
+        t[2] % littlecore_pvtpll_freq,
+        t[3] % l0_uc_clk,
+        t[4] % l1_uc_clk,
+        t[5] % l2_uc_clk,
+        t[6] % l3_uc_clk,
+        FREQ_SEP_LINE,
+        t[7] % (l0_clk_freq, l0_clk_sel),
+        t[8] % (l1_clk_freq, l1_clk_sel),
+        t[9] % (l2_clk_freq, l2_clk_sel),
+        t[10] % (l3_clk_freq, l3_clk_sel),
     ]
 
-    # Add spacer before frequency section
-    display_lines.append(("", "spacer"))
-    display_lines.append(("## frequency configuration ##", "section"))
+def dsu_freq_lines(snap, pll_state):
+    # The DSU muxes source from PLLs owned by the core tabs; reuse the
+    # frequencies recorded there (0 until the tab has been visited)
+    lpll_freq = pll_state["lpll"]
+    b0pll_freq = pll_state["b0pll"]
+    b1pll_freq = pll_state["b1pll"]
 
-    # Add frequency lines as freq entries (no index needed)
-    for line in freq_lines:
-        display_lines.append(((None, line, ""), "freq"))
+    dsu_sclk_df_src_mux_sel = get_val("dsu_sclk_df_src_mux_sel", DSU_FIELDS_BY_NAME, snap)
+    dsu_sclk_df_src_mux_div = get_val("dsu_sclk_df_src_mux_div", DSU_FIELDS_BY_NAME, snap)
+    dsu_sclk_src_t_sel = get_val("dsu_sclk_src_t_sel", DSU_FIELDS_BY_NAME, snap)
 
-    # Clamp scroll_offset
-    if scroll_offset is None:
-        scroll_offset = 0
-    if selected < scroll_offset:
-        scroll_offset = selected
-    elif selected >= scroll_offset + visible_rows:
-        scroll_offset = selected - visible_rows + 1
-
-    # Render visible lines
-    for visible_idx, (entry, etype, *rest) in enumerate(display_lines[scroll_offset:scroll_offset + visible_rows]):
-        row = start_row + visible_idx 
-
-        if etype == "spacer":
-            continue
-        elif etype == "section":
-            stdscr.addstr(row, 0, entry, curses.color_pair(1) | curses.A_BOLD)
-        elif etype == "field":
-            name, disp_val, extra = entry
-            field_idx = rest[0]
-            highlight = curses.A_REVERSE if field_idx == selected else curses.A_NORMAL
-            line = f"{name:<{FIELD_NAME_COL_WIDTH}}: {disp_val:<{VALUE_COL_WIDTH}} {extra:<{INFO_COL_WIDTH}}"
-            stdscr.addstr(row, 2, line[:curses.COLS - 3], highlight)
-        elif etype == "freq":
-            _, line, _ = entry
-            stdscr.addstr(row, 2, line[:curses.COLS - 3])
+    # Both DSU root muxes pick from the same four PLLs; the 2-bit codes
+    # (b0pll=0, b1pll=1, lpll=2, gpll=3) index this tuple directly
+    dsu_pll_by_code = (b0pll_freq, b1pll_freq, lpll_freq, GPLL_FREQ)
 
-    return scroll_offset, FLAT_FIELDS, lpll_freq
+    dsu_sclk_df_src_mux_clk = dsu_pll_by_code[
+        get_code("dsu_sclk_df_src_mux_sel", DSU_FIELDS_BY_NAME, snap)]
 
-def draw_dsu_ui(stdscr, mem, selected, message, scroll_offset, lpll_freq=0, b0pll_freq=0, b1pll_freq=0):
-    FIELD_NAME_COL_WIDTH = 25
-    VALUE_COL_WIDTH = 15
-    INFO_COL_WIDTH = 35
+    dsu_pvtpll_freq = reg_mem["GRF_DSU_BASE"].read32(GRF_DSU_PVTPLL)
 
-    start_row = 2
-    visible_rows = curses.LINES - start_row - 2
-
-    # CRU & GRF Offsets
-    DSU_LPLL_CON0 = 0x0040
-    DSU_LPLL_CON1 = 0x0044
-    DSU_LPLL_CON6 = 0x0058
-    DSU_MODE_CON00 = 0x0280
-    DSU_CLKSEL_CON00 = 0x0300
-    DSU_CLKSEL_CON01 = 0x0304
-    DSU_CLKSEL_CON02 = 0x0308
-    DSU_CLKSEL_CON03 = 0x030C
-    DSU_CLKSEL_CON04 = 0x0310
-    DSU_CLKSEL_CON05 = 0x0314
-    DSU_CLKSEL_CON06 = 0x0318
-    DSU_CLKSEL_CON07 = 0x031C
-    GRF_DSU_PVTPLL_CON0_L = 0x60
-    GRF_DSU_PVTPLL_CON0_H = 0x64
-    GRF_DSU_PVTPLL = 0x80
-
-    def read_pvtpll_freq(mem_grf):
-        freq_mhz = mem_grf.read32(GRF_DSU_PVTPLL)
-        return freq_mhz
-
-    # Clocking Parameters
-    SECTIONS = [
-        ("## dsu pvtpll configuration ##", "GRF_DSU_BASE", [
-            ("ring_length_sel", GRF_DSU_PVTPLL_CON0_L, (8, 10), "int", None, (0, 7)),
-                # 0 = HDBLVT20_INV_S_4, 1 = HDBLVT22_INV_S_4, 2 = Reserved, 3 = HDBSVT22_INV_S_4
-                # 4 = HDBLVT20_INV_SHSDB_4, 5 = HDBLVT22_INV_SHSDB_4, 6 = Reserved, 7 = HDBSVT22_INV_SHSDB_4
-            ("ring_length_sel", GRF_DSU_PVTPLL_CON0_H, (0, 5), "int", None, (0, 63)), #number of inventers = (n+5)*2
-        ]),
-        ("## sclk_dsu configuration ##", "CRU_DSU_BASE", [
-            ("dsu_sclk_df_src_mux_sel", DSU_CLKSEL_CON00, (12, 13), "enum",
-             {"b0pll": 0b00, "b1pll": 0b01, "lpll": 0b10, "gpll": 0b11}),
-            ("dsu_sclk_df_src_mux_div", DSU_CLKSEL_CON00, (7, 11), "int", None, (0, 31)),
-            ("dsu_sclk_src_t_sel", DSU_CLKSEL_CON01, (0, 0), "enum",
-             {"dsu_src": 0b0, "PVTPLL": 0b01}),
-            #("dsu_pvtpll_sel", DSU_CLKSEL_CON04, (10, 10), "enum", // requires updating of cal_cnt register (0x70)
-            # {"dsu_sclk_df_src": 0b0, "xin_osc0_func": 0b1,}),     // no logic implemented
-        ]),
-        ("## pclk_dsu configuration ##", "CRU_DSU_BASE", [
-            ("dsu_pclk_root_mux_sel", DSU_CLKSEL_CON04, (5, 6), "enum",
-             {"b0pll": 0b00, "b1pll": 0b01, "lpll": 0b10, "gpll": 0b11}),
-            ("dsu_pclk_root_mux_div", DSU_CLKSEL_CON04, (0, 4), "int", None, (0, 31)),
-        ]),
-        ("## dsu_other configuration ##", "CRU_DSU_BASE", [
-            ("dsu_aclkm_div", DSU_CLKSEL_CON01, (1, 5), "int", None, (0, 31)),
-            ("dsu_aclks_div", DSU_CLKSEL_CON01, (6, 10), "int", None, (0, 31)),
-            ("dsu_aclkmp_div", DSU_CLKSEL_CON01, (11, 15), "int", None, (0, 31)),
-            ("dsu_periphclk_div", DSU_CLKSEL_CON02, (0, 4), "int", None, (0, 31)),
-            ("dsu_cntclk_div", DSU_CLKSEL_CON02, (5, 9), "int", None, (0, 31)),
-            ("dsu_tsclk_div", DSU_CLKSEL_CON02, (10, 14), "int", None, (0, 31)),
-            ("dsu_atclk_div", DSU_CLKSEL_CON03, (0, 4), "int", None, (0, 31)),
-            ("dsu_gicclk_t_div", DSU_CLKSEL_CON03, (5, 9), "int", None, (0, 31)),
-        ]),
-    ]
-
-    FLAT_FIELDS = []
-    for _, base_tag, fields in SECTIONS:
-        mem_obj = reg_mem[base_tag]
-        for entry in fields:
-            name, offset, bit_range, ftype = entry[:4]
-            enum_map = entry[4] if len(entry) > 4 else None
-            val_range = entry[5] if len(entry) > 5 else None
-            lsb, msb = bit_range
-            FLAT_FIELDS.append((mem_obj, name, offset, lsb, msb, ftype, enum_map, val_range))
-
-    # Gather fields to display
-    display_lines = []
-    idx = 0
-    for section_title, base_tag, fields in SECTIONS:
-        display_lines.append(("", "spacer"))
-        display_lines.append((section_title, "section"))
-        for field in fields:
-            name, offset, bit_range, ftype = field[:4]
-            enum_map = field[4] if len(field) > 4 else None
-            val_range = field[5] if len(field) > 5 else None
-            lsb, msb = bit_range
-
-            mem_obj = reg_mem[base_tag]
-            reg_val = mem_obj.read32(offset)
-            val = get_bits(reg_val, lsb, msb)
-
-            if ftype == "enum":
-                disp_val = next((k for k, v in enum_map.items() if v == val), f"unknown({val})")
-                extra = f"Options: {list(enum_map.keys())}"
-            else:
-                disp_val = str(val)
-                extra = f"Range: {val_range}" if val_range else ""
-
-            display_lines.append(((name, disp_val, extra), "field", idx))
-            idx += 1
-
-    dsu_sclk_df_src_mux_sel = get_val("dsu_sclk_df_src_mux_sel", FLAT_FIELDS)
-    dsu_sclk_df_src_mux_div = get_val("dsu_sclk_df_src_mux_div", FLAT_FIELDS)
-    dsu_sclk_src_t_sel = get_val("dsu_sclk_src_t_sel", FLAT_FIELDS) 
-
-    if dsu_sclk_df_src_mux_sel == "b0pll":
-        dsu_sclk_df_src_mux_clk = b0pll_freq
-    elif dsu_sclk_df_src_mux_sel == "b1pll":
-        dsu_sclk_df_src_mux_clk = b1pll_freq
-    elif dsu_sclk_df_src_mux_sel == "lpll":
-        dsu_sclk_df_src_mux_clk = lpll_freq
-    elif dsu_sclk_df_src_mux_sel == "gpll":
-        dsu_sclk_df_src_mux_clk = GPLL_FREQ
-    else:
-        dsu_sclk_df_src_mux_clk = 0
-
-    mem_grf = Registers(GRF_DSU_BASE, 0x1000)
-    dsu_pvtpll_freq = read_pvtpll_freq(mem_grf)
-    mem_grf.close() 
-
-    if dsu_sclk_src_t_sel == "dsu_src":
+    dsu_sclk_src_t_code = get_code("dsu_sclk_src_t_sel", DSU_FIELDS_BY_NAME, snap)
+    if dsu_sclk_src_t_code == SRC_MUX_SRC:
         sclk_clk_freq = dsu_sclk_df_src_mux_clk / (dsu_sclk_df_src_mux_div + 1)
-    elif dsu_sclk_src_t_sel == "PVTPLL":
+    elif dsu_sclk_src_t_code == SRC_MUX_PVTPLL:
         sclk_clk_freq = dsu_pvtpll_freq
     else:
         sclk_clk_freq = 0
 
-    dsu_pclk_root_mux_sel = get_val("dsu_pclk_root_mux_sel", FLAT_FIELDS)
-    dsu_pclk_root_mux_div = get_val("dsu_pclk_root_mux_div", FLAT_FIELDS)
-
-    if dsu_pclk_root_mux_sel == "b0pll":
-        dsu_pclk_root_mux_clk = b0pll_freq
-    elif dsu_pclk_root_mux_sel == "b1pll":
-        dsu_pclk_root_mux_clk = b1pll_freq
-    elif dsu_pclk_root_mux_sel == "lpll":
-        dsu_pclk_root_mux_clk = lpll_freq
-    elif dsu_pclk_root_mux_sel == "gpll":
-        dsu_pclk_root_mux_clk = GPLL_FREQ
-    else:
-        dsu_pclk_root_mux_clk = 0
-
-    pclk_clk_freq = dsu_pclk_root_mux_clk / (dsu_pclk_root_mux_div + 1)
+    dsu_pclk_root_mux_sel = get_val("dsu_pclk_root_mux_sel", DSU_FIELDS_BY_NAME, snap)
+    dsu_pclk_root_mux_div = get_val("dsu_pclk_root_mux_div", DSU_FIELDS_BY_NAME, snap)
 
-    dsu_aclkm_div = get_val("dsu_aclkm_div", FLAT_FIELDS)
-    dsu_aclks_div = get_val("dsu_aclks_div", FLAT_FIELDS)
-    dsu_aclkmp_div = get_val("dsu_aclkmp_div", FLAT_FIELDS)
-    dsu_periphclk_div = get_val("dsu_periphclk_div", FLAT_FIELDS)
-    dsu_cntclk_div = get_val("dsu_cntclk_div", FLAT_FIELDS)
-    dsu_tsclk_div = get_val("dsu_tsclk_div", FLAT_FIELDS)
-    dsu_atclk_div = get_val("dsu_atclk_div", FLAT_FIELDS)
-    dsu_gicclk_div = get_val("dsu_gicclk_t_div", FLAT_FIELDS)
-
-    aclkm_clk_freq = dsu_sclk_df_src_mux_clk / (dsu_aclkm_div + 1)
-    aclks_clk_freq = dsu_sclk_df_src_mux_clk / (dsu_aclks_div + 1)
-    aclkmp_clk_freq = dsu_sclk_df_src_mux_clk / (dsu_aclkmp_div + 1)
-    periphclk_clk_freq = dsu_sclk_df_src_mux_clk / (dsu_periphclk_div + 1)
-    cntclk_clk_freq = dsu_sclk_df_src_mux_clk / (dsu_cntclk_div + 1)
-    tsclk_clk_freq = dsu_sclk_df_src_mux_clk / (dsu_tsclk_div + 1)
-    atclk_clk_freq = dsu_sclk_df_src_mux_clk / (dsu_atclk_div + 1)
-    gicclk_clk_freq = dsu_sclk_df_src_mux_clk / (dsu_gicclk_div + 1)
+    dsu_pclk_root_mux_clk = dsu_pll_by_code[
+        get_code("dsu_pclk_root_mux_sel", DSU_FIELDS_BY_NAME, snap)]
 
-    freq_lines = [
-        f"GPLL Frequency:           {GPLL_FREQ:.0f} MHz",
-        f"B0PLL Frequency:          {b0pll_freq:.0f} MHz",
-        f"B1PLL Frequency:          {b1pll_freq:.0f} MHz",
-        f"LPLL Frequency:           {lpll_freq:.0f} MHz",
-        f"DSU SRC MUX Freq:         {dsu_sclk_df_src_mux_clk:.0f} MHz from {dsu_sclk_df_src_mux_sel}",
-        f"DSU PCLK MUX Freq:        {dsu_pclk_root_mux_clk:.0f} MHz from {dsu_pclk_root_mux_sel}",
-        f"DSU PVTPLL Freq:          {dsu_pvtpll_freq:.0f} MHz",
-        f"--------------",
-        f"DSU SCLK Frequency:       {sclk_clk_freq:.0f} MHz from {dsu_sclk_src_t_sel}",
-        f"DSU ACLK_M Frequency:     {aclkm_clk_freq:.0f} MHz",
-        f"DSU ACLK_S Frequency:     {aclks_clk_freq:.0f} MHz",
-        f"DSU ACLK_MP Frequency:    {aclkmp_clk_freq:.0f} MHz",
-        f"DSU PERIPHCLK Frequency:  {periphclk_clk_freq:.0f} MHz",
-        f"DSU CNTCLK Frequency:     {cntclk_clk_freq:.0f} MHz",
-        f"DSU TSCLK Frequency:      {tsclk_clk_freq:.0f} MHz",
-        f"DSU ATCLK Frequency:      {atclk_clk_freq:.0f} MHz",
-        f"DSU GICCLK Frequency:     {gicclk_clk_freq:.0f} MHz",
-        f"DSU PCLK Frequency:       {pclk_clk_freq:.0f} MHz",
-    ]
-
-    # Add spacer before frequency section
-    display_lines.append(("", "spacer"))
-    display_lines.append(("## frequency configuration ##", "section"))
-
-    # Add frequency lines as freq entries (no index needed)
-    for line in freq_lines:
-        display_lines.append(((None, line, ""), "freq"))
-
-    # Clamp scroll_offset
-    if scroll_offset is None:
-        scroll_offset = 0
-    if selected < scroll_offset:
-        scroll_offset = selected
-    elif selected >= scroll_offset + visible_rows:
-        scroll_offset = selected - visible_rows + 1
-
-    # Render visible lines
-    for visible_idx, (entry, etype, *rest) in enumerate(display_lines[scroll_offset:scroll_offset + visible_rows]):
-        row = start_row + visible_idx 
-
-        if etype == "spacer":
-            continue
-        elif etype == "section":
-            stdscr.addstr(row, 0, entry, curses.color_pair(1) | curses.A_BOLD)
-        elif etype == "field":
-            name, disp_val, extra = entry
-            field_idx = rest[0]
-            highlight = curses.A_REVERSE if field_idx == selected else curses.A_NORMAL
-            line = f"{name:<{FIELD_NAME_COL_WIDTH}}: {disp_val:<{VALUE_COL_WIDTH}} {extra:<{INFO_COL_WIDTH}}"
-            stdscr.addstr(row, 2, line[:curses.COLS - 3], highlight)
-        elif etype == "freq":
-            _, line, _ = entry
-            stdscr.addstr(row, 2, line[:curses.COLS - 3])
-
-    return scroll_offset, FLAT_FIELDS
-
-def draw_gpu_ui(stdscr, mem, selected, message, scroll_offset):
-    FIELD_NAME_COL_WIDTH = 25
-    VALUE_COL_WIDTH = 15
-    INFO_COL_WIDTH = 35
-
-    start_row = 2
-    visible_rows = curses.LINES - start_row - 2
+    pclk_clk_freq = dsu_pclk_root_mux_clk / (dsu_pclk_root_mux_div + 1)
 
-    # CRU & GRF Offsets
-    CRU_CLKSEL_CON158 = 0x0578
-    CRU_CLKSEL_CON159 = 0x057C
-    CRU_CLKSEL_CON160 = 0x0584
-    CRU_CLKSEL_CON161 = 0x058C
-    GRF_GPU_PVTPLL_CON0_L = 0x00
-    GRF_GPU_PVTPLL_CON0_H = 0x04
-    GRF_GPU_PVTPLL = 0x18
-
-    # Clocking Parameters
-    SECTIONS = [
-        ("## gpu pvtpll configuration ##", "GRF_GPU_BASE", [
-            ("ring_length_sel", GRF_GPU_PVTPLL_CON0_L, (8, 10), "int", None, (0, 1)),
-                # 0 = UDBLVT20_INV_S_4, 1 = UDBSVT20_INV_S_4
-            ("ring_length_sel", GRF_GPU_PVTPLL_CON0_H, (0, 5), "int", None, (0, 63)) #number of inventers = (n+20)*2
-        ]),
-        ("## gpu mux configuration ##", "CRU_BASE", [
-            # ("gpu_pvtpll_sel", CRU_CLKSEL_CON158, (2, 2), "enum",     // requires updating of cal_cnt register (0x8)
-            #  {"clk_gpu_src": 0b0, "xin_osc0_func": 0b1}),             // no logic implemented
-            ("gpu_src_div", CRU_CLKSEL_CON158, (0, 4), "int", None, (0, 31)),
-            ("gpu_src_sel", CRU_CLKSEL_CON158, (5, 7), "enum",
-             {"gpll": 0b000, "cpll": 0b001, "aupll": 0b010, "npll": 0b011, "spll": 0b100}),            
-            ("gpu_src_mux_sel", CRU_CLKSEL_CON158, (14, 14), "enum",
-             {"gpu_src": 0b0, "PVTPLL": 0b1})
-        ]),
+    # All eight branch clocks divide the same SRC MUX clock, so compute
+    # them in one pass over the field list
+    (aclkm_clk_freq, aclks_clk_freq, aclkmp_clk_freq, periphclk_clk_freq,
+     cntclk_clk_freq, tsclk_clk_freq, atclk_clk_freq, gicclk_clk_freq) = [
+        dsu_sclk_df_src_mux_clk / (get_val(name, DSU_FIELDS_BY_NAME, snap) + 1)
+        for name in DSU_BRANCH_DIV_FIELDS]
+
+    t = DSU_FREQ_TEMPLATES
+    return [
+        GPLL_LINE_WIDE,
+        t[0] % b0pll_freq,
+        t[1] % b1pll_freq,
+        t[2] % lpll_freq,
+        t[3] % (dsu_sclk_df_src_mux_clk, dsu_sclk_df_src_mux_sel),
+        t[4] % (dsu_pclk_root_mux_clk, dsu_pclk_root_mux_sel),
+        t[5] % dsu_pvtpll_freq,
+        FREQ_SEP_LINE,
+        t[6] % (sclk_clk_freq, dsu_sclk_src_t_sel),
+        t[7] % aclkm_clk_freq,
+        t[8] % aclks_clk_freq,
+        t[9] % aclkmp_clk_freq,
+        t[10] % periphclk_clk_freq,
+        t[11] % cntclk_clk_freq,
+        t[12] % tsclk_clk_freq,
+        t[13] % atclk_clk_freq,
+        t[14] % gicclk_clk_freq,
+        t[15] % pclk_clk_freq,
     ]
 
-    FLAT_FIELDS = []
-    for _, base_tag, fields in SECTIONS:
-        mem_obj = reg_mem[base_tag]
-        for entry in fields:
-            name, offset, bit_range, ftype = entry[:4]
-            enum_map = entry[4] if len(entry) > 4 else None
-            val_range = entry[5] if len(entry) > 5 else None
-            lsb, msb = bit_range
-            FLAT_FIELDS.append((mem_obj, name, offset, lsb, msb, ftype, enum_map, val_range))
-
-    if not is_gpu_safe_to_read():
-        message[0] = "GPU not powered (set power_policy to always_on)"
-        # Prompt user to enable always_on
-        display_lines = []
-        idx = 0
-        display_lines.append((("GPU power_policy is not 'always_on'. Enable it now? (y/n):", "", ""), "field", idx))
-        idx += 1
-
-        # Draw prompt before asking
-        row = 3
-        for line, kind, _ in display_lines:
-            if kind == "field":
-                name, val, extra = line
-                stdscr.addstr(row, 2, f"{name:<40}{val:<15}{extra}")
-            row += 1
-        stdscr.refresh()
-
-        c = stdscr.getch()
-        if c in (ord('y'), ord('Y')):
-            if set_gpu_power_policy_always_on():
-                message[0] = "GPU power_policy set to always_on."
-            else:
-                message[0] = "Failed to set power_policy. Root permissions needed?"
-        else:
-            message[0] = "GPU remains not powered."
-
-        display_lines.append(((message[0], "", ""), "field", idx))
-        idx += 1
-
-        # Draw result message
-        stdscr.addstr(row, 2, f"{message[0]}")
-        stdscr.refresh()
-
-        return scroll_offset, []
-
-    def read_pvtpll_freq(mem_grf):
-        freq_mhz = mem_grf.read32(GRF_GPU_PVTPLL)
-        return freq_mhz
+def gpu_freq_lines(snap, pll_state):
+    gpu_pvtpll_freq = reg_mem["GRF_GPU_BASE"].read32(GRF_GPU_PVTPLL)
 
-    # Gather fields to display
-    display_lines = []
-    idx = 0
-    for section_title, base_tag, fields in SECTIONS:
-        display_lines.append(("", "spacer"))
-        display_lines.append((section_title, "section"))
-        for field in fields:
-            name, offset, bit_range, ftype = field[:4]
-            enum_map = field[4] if len(field) > 4 else None
-            val_range = field[5] if len(field) > 5 else None
-            lsb, msb = bit_range
+    gpu_src_sel = get_val("gpu_src_sel", GPU_FIELDS_BY_NAME, snap)
+    gpu_src_div = get_val("gpu_src_div", GPU_FIELDS_BY_NAME, snap)
+    gpu_src_mux_sel = get_val("gpu_src_mux_sel", GPU_FIELDS_BY_NAME, snap)
 
-            mem_obj = reg_mem[base_tag]
-            reg_val = mem_obj.read32(offset)
-            val = get_bits(reg_val, lsb, msb)
+    gpu_src_code = get_code("gpu_src_sel", GPU_FIELDS_BY_NAME, snap)
+    gpu_src_mux_clk = (PLL_FREQ_BY_CODE[gpu_src_code]
+                       if gpu_src_code < len(PLL_FREQ_BY_CODE) else 0) / (gpu_src_div + 1)
 
-            if ftype == "enum":
-                disp_val = next((k for k, v in enum_map.items() if v == val), f"unknown({val})")
-                extra = f"Options: {list(enum_map.keys())}"
-            else:
-                disp_val = str(val)
-                extra = f"Range: {val_range}" if val_range else ""
-
-            display_lines.append(((name, disp_val, extra), "field", idx))
-            idx += 1
-
-    mem_grf = Registers(GRF_GPU_BASE, 0x1000)
-    gpu_pvtpll_freq = read_pvtpll_freq(mem_grf)
-    mem_grf.close() 
-
-    gpu_src_sel = get_val("gpu_src_sel", FLAT_FIELDS)
-    gpu_src_div = get_val("gpu_src_div", FLAT_FIELDS)
-    gpu_src_mux_sel = get_val("gpu_src_mux_sel", FLAT_FIELDS)
-
-    if gpu_src_sel == "aupll":
-        gpu_src_mux_clk = AUPLL_FREQ / (gpu_src_div + 1)
-    elif gpu_src_sel == "cpll":
-        gpu_src_mux_clk = CPLL_FREQ / (gpu_src_div + 1)
-    elif gpu_src_sel == "gpll":
-        gpu_src_mux_clk = GPLL_FREQ / (gpu_src_div + 1)
-    elif gpu_src_sel == "npll":
-        gpu_src_mux_clk = NPLL_FREQ / (gpu_src_div + 1)
-    elif gpu_src_sel == "spll":
-        gpu_src_mux_clk = SPLL_FREQ / (gpu_src_div + 1)
-    else:
-        gpu_src_mux_clk = 0
-
-    if gpu_src_mux_sel == "gpu_src":
+    gpu_src_mux_code = get_code("gpu_src_mux_sel", GPU_FIELDS_BY_NAME, snap)
+    if gpu_src_mux_code == SRC_MUX_SRC:
         gpu_clk_freq = gpu_src_mux_clk
-    elif gpu_src_mux_sel == "PVTPLL":
+    elif gpu_src_mux_code == SRC_MUX_PVTPLL:
         gpu_clk_freq = gpu_pvtpll_freq
     else:
         gpu_clk_freq = 0
 
-    freq_lines = [
-        f"AUPLL Frequency:          {AUPLL_FREQ:.0f} MHz",
-        f"CPLL Frequency:           {CPLL_FREQ:.0f} MHz",
-        f"GPLL Frequency:           {GPLL_FREQ:.0f} MHz",
-        f"NPLL Frequency:           {NPLL_FREQ:.0f} MHz",
-        f"SPLL Frequency:           {SPLL_FREQ:.0f} MHz",
-        f"GPU SRC MUX Freq:         {gpu_src_mux_clk:.0f} MHz from {gpu_src_sel}",
-        f"GPU PVTPLL Freq:          {gpu_pvtpll_freq:.0f} MHz",
-        f"--------------",
-        f"GPU Frequency:            {gpu_clk_freq:.0f} MHz from {gpu_src_mux_sel}",        
-    ]
-
-    # Add spacer before frequency section
-    display_lines.append(("", "spacer"))
-    display_lines.append(("## frequency configuration ##", "section"))
-
-    # Add frequency lines as freq entries (no index needed)
-    for line in freq_lines:
-        display_lines.append(((None, line, ""), "freq"))
-
-    # Clamp scroll_offset
-    if scroll_offset is None:
-        scroll_offset = 0
-    if selected < scroll_offset:
-        scroll_offset = selected
-    elif selected >= scroll_offset + visible_rows:
-        scroll_offset = selected - visible_rows + 1
-
-    # Render visible lines
-    for visible_idx, (entry, etype, *rest) in enumerate(display_lines[scroll_offset:scroll_offset + visible_rows]):
-        row = start_row + visible_idx 
-
-        if etype == "spacer":
-            continue
-        elif etype == "section":
-            stdscr.addstr(row, 0, entry, curses.color_pair(1) | curses.A_BOLD)
-        elif etype == "field":
-            name, disp_val, extra = entry
-            field_idx = rest[0]
-            highlight = curses.A_REVERSE if field_idx == selected else curses.A_NORMAL
-            line = f"{name:<{FIELD_NAME_COL_WIDTH}}: {disp_val:<{VALUE_COL_WIDTH}} {extra:<{INFO_COL_WIDTH}}"
-            stdscr.addstr(row, 2, line[:curses.COLS - 3], highlight)
-        elif etype == "freq":
-            _, line, _ = entry
-            stdscr.addstr(row, 2, line[:curses.COLS - 3])
-
-    return scroll_offset, FLAT_FIELDS
-
-def draw_npu_ui(stdscr, mem, selected, message, scroll_offset):
-    FIELD_NAME_COL_WIDTH = 25
-    VALUE_COL_WIDTH = 15
-    INFO_COL_WIDTH = 35
-
-    start_row = 2
-    visible_rows = curses.LINES - start_row - 2
-
-    # CRU & GRF Offsets
-    CRU_CLKSEL_CON73 = 0x0424
-    CRU_CLKSEL_CON74 = 0x0428
-    GRF_NPU_PVTPLL_CON0_L = 0x0C
-    GRF_NPU_PVTPLL_CON0_H = 0x10
-    GRF_NPU_PVTPLL = 0x24
-
-    #def read_pvtpll_freq(mem_grf):
-    #    freq_mhz = mem_grf.read32(GRF_NPU_PVTPLL)
-    #    return freq_mhz
-
-    # Clocking Parameters
-    SECTIONS = [
-        #("## npu pvtpll configuration ##", "GRF_NPU_BASE", [
-        #    ("ring_length_sel", GRF_NPU_PVTPLL_CON0_L, (8, 10), "int", None, (0, 1)),
-        #        # 0 = UDBLVT20_INV_S_4, 1 = UDBSVT20_INV_S_4
-        #    ("ring_length_sel", GRF_NPU_PVTPLL_CON0_H, (0, 5), "int", None, (0, 63)), #number of inventers = (n+20)*2
-        #]),
-        ("## npu mux configuration ##", "CRU_BASE", [
-            ("rknn_dsu0_src_sel", CRU_CLKSEL_CON73, (7, 9), "enum",
-             {"gpll": 0b000, "cpll": 0b001, "aupll": 0b010, "npll": 0b011, "spll": 0b100}),
-            ("rknn_dsu0_src_div", CRU_CLKSEL_CON73, (2, 6), "int", None, (0, 31)),
-            ("rknn_dsu0_mux_sel", CRU_CLKSEL_CON74, (0, 0), "enum",
-             {"dsu0_src": 0b0, "PVTPLL": 0b1}),
-            # ("npu_pvtpll_sel", CRU_CLKSEL_CON74, (4, 4), "enum",      // requires updating of cal_cnt register (0x14)
-            #  {"dsu0_src": 0b0, "xin_osc0_func": 0b1}),                // no logic implemented
-            ("npu_cm0_rtc_div", CRU_CLKSEL_CON74, (7, 11), "int", None, (0, 31)),
-        ]),
+    t = GPU_FREQ_TEMPLATES
+    return [
+        AUPLL_LINE,
+        CPLL_LINE,
+        GPLL_LINE_WIDE,
+        NPLL_LINE,
+        SPLL_LINE,
+        t[0] % (gpu_src_mux_clk, gpu_src_sel),
+        t[1] % gpu_pvtpll_freq,
+        FREQ_SEP_LINE,
+        t[2] % (gpu_clk_freq, gpu_src_mux_sel),
     ]
 
-    FLAT_FIELDS = []
-    for _, base_tag, fields in SECTIONS:
-        mem_obj = reg_mem[base_tag]
-        for entry in fields:
-            name, offset, bit_range, ftype = entry[:4]
-            enum_map = entry[4] if len(entry) > 4 else None
-            val_range = entry[5] if len(entry) > 5 else None
-            lsb, msb = bit_range
-            FLAT_FIELDS.append((mem_obj, name, offset, lsb, msb, ftype, enum_map, val_range))
-
-    # Gather fields to display
-    display_lines = []
-    idx = 0
-    for section_title, base_tag, fields in SECTIONS:
-        display_lines.append(("", "spacer"))
-        display_lines.append((section_title, "section"))
-        for field in fields:
-            name, offset, bit_range, ftype = field[:4]
-            enum_map = field[4] if len(field) > 4 else None
-            val_range = field[5] if len(field) > 5 else None
-            lsb, msb = bit_range
-
-            mem_obj = reg_mem[base_tag]
-            reg_val = mem_obj.read32(offset)
-            val = get_bits(reg_val, lsb, msb)
-
-            if ftype == "enum":
-                disp_val = next((k for k, v in enum_map.items() if v == val), f"unknown({val})")
-                extra = f"Options: {list(enum_map.keys())}"
-            else:
-                disp_val = str(val)
-                extra = f"Range: {val_range}" if val_range else ""
-
-            display_lines.append(((name, disp_val, extra), "field", idx))
-            idx += 1
-
+def npu_freq_lines(snap, pll_state):
     #mem_grf = Registers(GRF_NPU_BASE, 0x1000)
     #npu_pvtpll_freq = read_pvtpll_freq(mem_grf)
-    #mem_grf.close() 
-
-    dsu0_src_sel = get_val("rknn_dsu0_src_sel", FLAT_FIELDS)
-    dsu0_src_div = get_val("rknn_dsu0_src_div", FLAT_FIELDS)
-    dsu0_src_mux_sel = get_val("rknn_dsu0_mux_sel", FLAT_FIELDS)
-
-    if dsu0_src_sel == "aupll":
-        dsu0_src_mux_clk = AUPLL_FREQ / (dsu0_src_div + 1)
-    elif dsu0_src_sel == "cpll":
-        dsu0_src_mux_clk = CPLL_FREQ / (dsu0_src_div + 1)
-    elif dsu0_src_sel == "gpll":
-        dsu0_src_mux_clk = GPLL_FREQ / (dsu0_src_div + 1)
-    elif dsu0_src_sel == "npll":
-        dsu0_src_mux_clk = NPLL_FREQ / (dsu0_src_div + 1)
-    elif dsu0_src_sel == "spll":
-        dsu0_src_mux_clk = SPLL_FREQ / (dsu0_src_div + 1)
-    else:
-        dsu0_src_mux_clk = 0
+    #mem_grf.close()
+
+    dsu0_src_sel = get_val("rknn_dsu0_src_sel", NPU_FIELDS_BY_NAME, snap)
+    dsu0_src_div = get_val("rknn_dsu0_src_div", NPU_FIELDS_BY_NAME, snap)
+    dsu0_src_mux_sel = get_val("rknn_dsu0_mux_sel", NPU_FIELDS_BY_NAME, snap)
+
+    dsu0_src_code = get_code("rknn_dsu0_src_sel", NPU_FIELDS_BY_NAME, snap)
+    dsu0_src_mux_clk = (PLL_FREQ_BY_CODE[dsu0_src_code]
+                        if dsu0_src_code < len(PLL_FREQ_BY_CODE) else 0) / (dsu0_src_div + 1)
+
+    dsu0_src_mux_code = get_code("rknn_dsu0_mux_sel", NPU_FIELDS_BY_NAME, snap)
+    # Indexed by mux code (src=0, pvtpll=1); -1 stands in for the PVTPLL
+    # frequency until pvtpll can be read
+    src_mux_freqs = (dsu0_src_mux_clk, -1)
+    npu_clk_freq = (src_mux_freqs[dsu0_src_mux_code]
+                    if dsu0_src_mux_code < len(src_mux_freqs) else 0)
+
+    t = NPU_FREQ_TEMPLATES
+    return [
+        AUPLL_LINE,
+        CPLL_LINE,
+        GPLL_LINE_WIDE,
+        NPLL_LINE,
+        SPLL_LINE,
+        t[0] % (dsu0_src_mux_clk, dsu0_src_sel),
+        #f"NPU PVTPLL Freq:          {npu_pvtpll_freq:.0f} MHz",
+        FREQ_SEP_LINE,
+        t[1] % (npu_clk_freq, dsu0_src_mux_sel),
+    ]
 
-    if dsu0_src_mux_sel == "dsu0_src":
-        npu_clk_freq = dsu0_src_mux_clk
-    elif dsu0_src_mux_sel == "PVTPLL":
-        npu_clk_freq = -1 # replace with npu_clk_freq = npu_pvtpll_freq when pvtpll can be read
+def gpu_power_guard(stdscr, message, scroll_offset):
+    # Interactive prompt shown while the GPU power domain is off; returns
+    # a (scroll_offset, fields) result to short-circuit draw_panel, or
+    # None when the GPU registers are safe to read
+    if is_gpu_safe_to_read_cached():
+        return None
+
+    message[0] = "GPU not powered (set power_policy to always_on)"
+    stdscr.addstr(3, 2, "GPU power_policy is not 'always_on'. Enable it now? (y/n):")
+    stdscr.refresh()
+
+    stdscr.timeout(-1)  # block for the answer; the poll timeout would pick 'n'
+    c = stdscr.getch()
+    stdscr.timeout(250)
+    if c in (ord('y'), ord('Y')):
+        if set_gpu_power_policy_always_on():
+            message[0] = "GPU power_policy set to always_on."
+            _safe_cache.clear()
+        else:
+            message[0] = "Failed to set power_policy. Root permissions needed?"
     else:
-        npu_clk_freq = 0
+        message[0] = "GPU remains not powered."
+
+    stdscr.addstr(4, 2, message[0])
+    stdscr.refresh()
+
+    return scroll_offset, []
+
+class PanelSpec:
+    # Immutable per-tab bundle of everything draw_panel needs: the field
+    # tables built at import, the prebuilt display scaffold and the
+    # panel-specific frequency math
+    __slots__ = ("tag", "flat_fields", "fields_by_name", "unique_regs",
+                 "scaffold", "freq_fn", "use_pad", "guard_fn")
+
+    def __init__(self, tag, flat_fields, fields_by_name, unique_regs,
+                 scaffold, freq_fn, use_pad, guard_fn=None):
+        self.tag = tag
+        self.flat_fields = flat_fields
+        self.fields_by_name = fields_by_name
+        self.unique_regs = unique_regs
+        self.scaffold = scaffold
+        self.freq_fn = freq_fn
+        self.use_pad = use_pad
+        self.guard_fn = guard_fn
+
+PANEL_SPECS = {
+    1: PanelSpec("bigcore0", BIGCORE0_FLAT_FIELDS, BIGCORE0_FIELDS_BY_NAME,
+                 BIGCORE0_UNIQUE_REGS, BIGCORE0_DISPLAY_SCAFFOLD,
+                 bigcore0_freq_lines, use_pad=False),
+    2: PanelSpec("bigcore1", BIGCORE1_FLAT_FIELDS, BIGCORE1_FIELDS_BY_NAME,
+                 BIGCORE1_UNIQUE_REGS, BIGCORE1_DISPLAY_SCAFFOLD,
+                 bigcore1_freq_lines, use_pad=False),
+    3: PanelSpec("littlecore", LITTLECORE_FLAT_FIELDS, LITTLECORE_FIELDS_BY_NAME,
+                 LITTLECORE_UNIQUE_REGS, LITTLECORE_DISPLAY_SCAFFOLD,
+                 littlecore_freq_lines, use_pad=True),
+    4: PanelSpec("dsu", DSU_FLAT_FIELDS, DSU_FIELDS_BY_NAME,
+                 DSU_UNIQUE_REGS, DSU_DISPLAY_SCAFFOLD,
+                 dsu_freq_lines, use_pad=True),
+    5: PanelSpec("gpu", GPU_FLAT_FIELDS, GPU_FIELDS_BY_NAME,
+                 GPU_UNIQUE_REGS, GPU_DISPLAY_SCAFFOLD,
+                 gpu_freq_lines, use_pad=True, guard_fn=gpu_power_guard),
+    6: PanelSpec("npu", NPU_FLAT_FIELDS, NPU_FIELDS_BY_NAME,
+                 NPU_UNIQUE_REGS, NPU_DISPLAY_SCAFFOLD,
+                 npu_freq_lines, use_pad=True),
+}
 
-    freq_lines = [
-        f"AUPLL Frequency:          {AUPLL_FREQ:.0f} MHz",
-        f"CPLL Frequency:           {CPLL_FREQ:.0f} MHz",
-        f"GPLL Frequency:           {GPLL_FREQ:.0f} MHz",
-        f"NPLL Frequency:           {NPLL_FREQ:.0f} MHz",
-        f"SPLL Frequency:           {SPLL_FREQ:.0f} MHz",
-        f"NPU SRC MUX Freq:         {dsu0_src_mux_clk:.0f} MHz from {dsu0_src_sel}",
-        #f"NPU PVTPLL Freq:          {npu_pvtpll_freq:.0f} MHz",
-        f"--------------",
-        f"NPU Frequency:            {npu_clk_freq:.0f} MHz from {dsu0_src_mux_sel}",        
-    ]
+def draw_panel(spec, stdscr, selected, message, scroll_offset, pll_state):
+    start_row = 2
+    visible_rows = curses.LINES - start_row - 2
 
-    # Add spacer before frequency section
-    display_lines.append(("", "spacer"))
-    display_lines.append(("## frequency configuration ##", "section"))
+    if spec.guard_fn is not None:
+        blocked = spec.guard_fn(stdscr, message, scroll_offset)
+        if blocked is not None:
+            return blocked
 
-    # Add frequency lines as freq entries (no index needed)
-    for line in freq_lines:
-        display_lines.append(((None, line, ""), "freq"))
+    FLAT_FIELDS = spec.flat_fields
+    tab_tag = spec.tag
+    snap = snapshot(spec.unique_regs)
+
+    # Static rows (sections, spacers, field slots) come prebuilt; only
+    # the freq lines change per frame (the scaffold already ends with
+    # the frequency section header)
+    display_lines = list(spec.scaffold)
+    for line in spec.freq_fn(snap, pll_state):
+        display_lines.append((line, "freq"))
 
     # Clamp scroll_offset
     if scroll_offset is None:
@@ -1489,286 +1488,106 @@ def draw_npu_ui(stdscr, mem, selected, message, scroll_offset):
     elif selected >= scroll_offset + visible_rows:
         scroll_offset = selected - visible_rows + 1
 
-    # Render visible lines
-    for visible_idx, (entry, etype, *rest) in enumerate(display_lines[scroll_offset:scroll_offset + visible_rows]):
-        row = start_row + visible_idx 
+    max_w = curses.COLS - 3
 
+    # One attribute per field, picked by index in the loop instead of
+    # comparing every row against the selection
+    field_attrs = [_FIELD_NORMAL] * len(FLAT_FIELDS)
+    if 0 <= selected < len(FLAT_FIELDS):
+        field_attrs[selected] = _FIELD_REVERSE
+
+    # Render visible lines; only rows whose content or highlight changed
+    # since the last frame are repainted
+    global _pad_view
+    if spec.use_pad:
+        target = get_panel_pad(tab_tag)
+        row_base = 0
+    else:
+        target = stdscr
+        row_base = start_row
+    # islice walks the window in place; *-unpacking would copy the slice
+    # and allocate a rest list per row
+    for visible_idx, item in enumerate(islice(display_lines,
+                                              scroll_offset,
+                                              scroll_offset + visible_rows)):
+        entry, etype = item[0], item[1]
+        row = row_base + visible_idx
         if etype == "spacer":
-            continue
+            if spec.use_pad:
+                draw_row_cached(target, tab_tag, row, 0, "")
         elif etype == "section":
-            stdscr.addstr(row, 0, entry, curses.color_pair(1) | curses.A_BOLD)
+            draw_row_cached(target, tab_tag, row, 0, entry, _SECTION_ATTR)
         elif etype == "field":
-            name, disp_val, extra = entry
-            field_idx = rest[0]
-            highlight = curses.A_REVERSE if field_idx == selected else curses.A_NORMAL
-            line = f"{name:<{FIELD_NAME_COL_WIDTH}}: {disp_val:<{VALUE_COL_WIDTH}} {extra:<{INFO_COL_WIDTH}}"
-            stdscr.addstr(row, 2, line[:curses.COLS - 3], highlight)
+            field_idx = item[2]
+            mem_obj, name, offset, lsb, mask, ftype, enum_map, enum_map_inv, val_range, extra = FLAT_FIELDS[field_idx]
+            val = (snap[(id(mem_obj), offset)] >> lsb) & mask
+            if ftype == "enum":
+                disp_val = enum_map_inv.get(val, f"unknown({val})")
+            else:
+                disp_val = f"{val}"
+            line = FIELD_ROW_TEMPLATE % (name, disp_val, extra)
+            draw_row_cached(target, tab_tag, row, 2, line,
+                            field_attrs[field_idx], max_w)
         elif etype == "freq":
-            _, line, _ = entry
-            stdscr.addstr(row, 2, line[:curses.COLS - 3])
+            draw_row_cached(target, tab_tag, row, 2, entry, max_w=max_w)
+    if spec.use_pad:
+        _pad_view = (start_row, start_row + visible_rows - 1)
 
     return scroll_offset, FLAT_FIELDS
 
-def draw_dram_ui(stdscr, mem, selected, message, scroll_offset):
-    FIELD_NAME_COL_WIDTH = 25
-    VALUE_COL_WIDTH = 15
-    INFO_COL_WIDTH = 35
-
+def draw_dram_ui(stdscr, selected, message, scroll_offset):
     start_row = 2
     visible_rows = curses.LINES - start_row - 2
 
-    # CRU & GRF Offsets
-    DDR0CRU_D0APLL_CON0 = 0x0000
-    DDR0CRU_D0APLL_CON1 = 0x0004
-    DDR0CRU_D0APLL_CON2 = 0x0008
-    DDR0CRU_D0APLL_CON6 = 0x0018
-    DDR0CRU_D0BPLL_CON0 = 0x0020
-    DDR0CRU_D0BPLL_CON1 = 0x0024
-    DDR0CRU_D0BPLL_CON2 = 0x0028
-    DDR0CRU_D0BPLL_CON6 = 0x0038
-    DDR0CRU_CLKSEL_CON00 = 0x0300
-    
-    DDR1CRU_D1APLL_CON0 = 0x0000
-    DDR1CRU_D1APLL_CON1 = 0x0004
-    DDR1CRU_D1APLL_CON2 = 0x0008
-    DDR1CRU_D1APLL_CON6 = 0x0018
-    DDR1CRU_D1BPLL_CON0 = 0x0020
-    DDR1CRU_D1BPLL_CON1 = 0x0024
-    DDR1CRU_D1BPLL_CON2 = 0x0028
-    DDR1CRU_D1BPLL_CON6 = 0x0038
-    DDR1CRU_CLKSEL_CON00 = 0x0300
-
-    DDR2CRU_D2APLL_CON0 = 0x0000
-    DDR2CRU_D2APLL_CON1 = 0x0004
-    DDR2CRU_D2APLL_CON2 = 0x0008
-    DDR2CRU_D2APLL_CON6 = 0x0018
-    DDR2CRU_D2BPLL_CON0 = 0x0020
-    DDR2CRU_D2BPLL_CON1 = 0x0024
-    DDR2CRU_D2BPLL_CON2 = 0x0028
-    DDR2CRU_D2BPLL_CON6 = 0x0038
-    DDR2CRU_CLKSEL_CON00 = 0x0300
-
-    DDR3CRU_D3APLL_CON0 = 0x0000
-    DDR3CRU_D3APLL_CON1 = 0x0004
-    DDR3CRU_D3APLL_CON2 = 0x0008
-    DDR3CRU_D3APLL_CON6 = 0x0018
-    DDR3CRU_D3BPLL_CON0 = 0x0020
-    DDR3CRU_D3BPLL_CON1 = 0x0024
-    DDR3CRU_D3BPLL_CON2 = 0x0028
-    DDR3CRU_D3BPLL_CON6 = 0x0038
-    DDR3CRU_CLKSEL_CON00 = 0x0300
-
-    # Clocking Parameters
-    SECTIONS = [
-        ("## d0a pll configuration ##", "CRU_DDRPHY0_BASE", [
-            ("m_d0apll", DDR0CRU_D0APLL_CON0, (0, 9), "int", None, (64, 1023)),
-            ("p_d0apll", DDR0CRU_D0APLL_CON1, (0, 5), "int", None, (1, 63)),
-            ("s_d0apll", DDR0CRU_D0APLL_CON1, (6, 8), "int", None, (0, 6)),
-            ("k_d0apll", DDR0CRU_D0APLL_CON2, (0, 15), "int", None, (0, 1023)), 
-            ("d0apll_pll_reset", DDR0CRU_D0APLL_CON1, (13, 13), "int", None, (0, 1)),
-            ("d0apll_lock", DDR0CRU_D0APLL_CON6, (15, 15), "int", None, (0, 1))
-        ]),
-        ("## d0b pll configuration ##", "CRU_DDRPHY0_BASE", [
-            ("m_d0bpll", DDR0CRU_D0BPLL_CON0, (0, 9), "int", None, (64, 1023)),
-            ("p_d0bpll", DDR0CRU_D0BPLL_CON1, (0, 5), "int", None, (1, 63)),
-            ("s_d0bpll", DDR0CRU_D0BPLL_CON1, (6, 8), "int", None, (0, 6)),
-            ("k_d0bpll", DDR0CRU_D0BPLL_CON2, (0, 15), "int", None, (0, 1023)), 
-            ("d0bpll_pll_reset", DDR0CRU_D0BPLL_CON0, (13, 13), "int", None, (0, 1)),
-            ("d0bpll_lock", DDR0CRU_D0BPLL_CON6, (15, 15), "int", None, (0, 1))
-        ]),
-        ("## d1a pll configuration ##", "CRU_DDRPHY1_BASE", [
-            ("m_d1apll", DDR1CRU_D1APLL_CON0, (0, 9), "int", None, (64, 1023)),
-            ("p_d1apll", DDR1CRU_D1APLL_CON1, (0, 5), "int", None, (1, 63)),
-            ("s_d1apll", DDR1CRU_D1APLL_CON1, (6, 8), "int", None, (0, 6)),
-            ("k_d1apll", DDR1CRU_D1APLL_CON2, (0, 15), "int", None, (0, 1023)), 
-            ("d1apll_pll_reset", DDR1CRU_D1APLL_CON1, (13, 13), "int", None, (0, 1)),
-            ("d1apll_lock", DDR1CRU_D1APLL_CON6, (15, 15), "int", None, (0, 1))
-        ]),
-        ("## d1b pll configuration ##", "CRU_DDRPHY1_BASE", [
-            ("m_d1bpll", DDR1CRU_D1BPLL_CON0, (0, 9), "int", None, (64, 1023)),
-            ("p_d1bpll", DDR1CRU_D1BPLL_CON1, (0, 5), "int", None, (1, 63)),
-            ("s_d1bpll", DDR1CRU_D1BPLL_CON1, (6, 8), "int", None, (0, 6)),
-            ("k_d1bpll", DDR1CRU_D1BPLL_CON2, (0, 15), "int", None, (0, 1023)), 
-            ("d1bpll_pll_reset", DDR1CRU_D1BPLL_CON0, (13, 13), "int", None, (0, 1)),
-            ("d1bpll_lock", DDR1CRU_D1BPLL_CON6, (15, 15), "int", None, (0, 1))
-        ]),
-        ("## d2a pll configuration ##", "CRU_DDRPHY2_BASE", [
-            ("m_d2apll", DDR2CRU_D2APLL_CON0, (0, 9), "int", None, (64, 1023)),
-            ("p_d2apll", DDR2CRU_D2APLL_CON1, (0, 5), "int", None, (1, 63)),
-            ("s_d2apll", DDR2CRU_D2APLL_CON1, (6, 8), "int", None, (0, 6)),
-            ("k_d2apll", DDR2CRU_D2APLL_CON2, (0, 15), "int", None, (0, 1023)), 
-            ("d2apll_pll_reset", DDR2CRU_D2APLL_CON1, (13, 13), "int", None, (0, 1)),
-            ("d2apll_lock", DDR2CRU_D2APLL_CON6, (15, 15), "int", None, (0, 1))
-        ]),
-        ("## d2b pll configuration ##", "CRU_DDRPHY2_BASE", [
-            ("m_d2bpll", DDR2CRU_D2BPLL_CON0, (0, 9), "int", None, (64, 1023)),
-            ("p_d2bpll", DDR2CRU_D2BPLL_CON1, (0, 5), "int", None, (1, 63)),
-            ("s_d2bpll", DDR2CRU_D2BPLL_CON1, (6, 8), "int", None, (0, 6)),
-            ("k_d2bpll", DDR2CRU_D2BPLL_CON2, (0, 15), "int", None, (0, 1023)), 
-            ("d2bpll_pll_reset", DDR2CRU_D2BPLL_CON0, (13, 13), "int", None, (0, 1)),
-            ("d2bpll_lock", DDR2CRU_D2BPLL_CON6, (15, 15), "int", None, (0, 1))
-        ]),
-        ("## d3a pll configuration ##", "CRU_DDRPHY3_BASE", [
-            ("m_d3apll", DDR3CRU_D3APLL_CON0, (0, 9), "int", None, (64, 1023)),
-            ("p_d3apll", DDR3CRU_D3APLL_CON1, (0, 5), "int", None, (1, 63)),
-            ("s_d3apll", DDR3CRU_D3APLL_CON1, (6, 8), "int", None, (0, 6)),
-            ("k_d3apll", DDR3CRU_D3APLL_CON2, (0, 15), "int", None, (0, 1023)), 
-            ("d3apll_pll_reset", DDR3CRU_D3APLL_CON1, (13, 13), "int", None, (0, 1)),
-            ("d3apll_lock", DDR3CRU_D3APLL_CON6, (15, 15), "int", None, (0, 1))
-        ]),
-        ("## d3b pll configuration ##", "CRU_DDRPHY3_BASE", [
-            ("m_d3bpll", DDR3CRU_D3BPLL_CON0, (0, 9), "int", None, (64, 1023)),
-            ("p_d3bpll", DDR3CRU_D3BPLL_CON1, (0, 5), "int", None, (1, 63)),
-            ("s_d3bpll", DDR3CRU_D3BPLL_CON1, (6, 8), "int", None, (0, 6)),
-            ("k_d3bpll", DDR3CRU_D3BPLL_CON2, (0, 15), "int", None, (0, 1023)), 
-            ("d3bpll_pll_reset", DDR3CRU_D3BPLL_CON0, (13, 13), "int", None, (0, 1)),
-            ("d3bpll_lock", DDR3CRU_D3BPLL_CON6, (15, 15), "int", None, (0, 1))
-        ]),
-        ("## ddr0clk configuration ##", "CRU_DDRPHY0_BASE", [
-            ("ddrphy2x_ch0_sel", DDR0CRU_CLKSEL_CON00, (0, 0), "enum",
-             {"d0apll": 0b00, "d0bpll": 0b01})
-        ]),
-        ("## ddr1clk configuration ##", "CRU_DDRPHY1_BASE", [
-            ("ddrphy2x_ch1_sel", DDR1CRU_CLKSEL_CON00, (0, 0), "enum",
-             {"d1apll": 0b00, "d1bpll": 0b01})
-        ]),
-        ("## ddr2clk configuration ##", "CRU_DDRPHY2_BASE", [
-            ("ddrphy2x_ch2_sel", DDR2CRU_CLKSEL_CON00, (0, 0), "enum",
-             {"d2apll": 0b00, "d3bpll": 0b01})
-        ]),
-        ("## ddr3clk configuration ##", "CRU_DDRPHY3_BASE", [
-            ("ddrphy2x_ch3_sel", DDR3CRU_CLKSEL_CON00, (0, 0), "enum",
-             {"d3apll": 0b00, "d3bpll": 0b01}),
-        ]),
-    ]
+    FLAT_FIELDS = DRAM_FLAT_FIELDS
 
-    FLAT_FIELDS = []
-    for _, base_tag, fields in SECTIONS:
-        mem_obj = reg_mem[base_tag]
-        for entry in fields:
-            name, offset, bit_range, ftype = entry[:4]
-            enum_map = entry[4] if len(entry) > 4 else None
-            val_range = entry[5] if len(entry) > 5 else None
-            lsb, msb = bit_range
-            FLAT_FIELDS.append((mem_obj, name, offset, lsb, msb, ftype, enum_map, val_range))
+    # One bulk read per frame: every field decode below shares the same
+    # register snapshot instead of re-reading /dev/mem per field
+    snap = snapshot(DRAM_UNIQUE_REGS)
 
-    # Gather fields to display
+    # Gather fields to display; decoded values double as a side table so
+    # the clock math below reuses them instead of decoding the snapshot again
     display_lines = []
+    decoded = {}
     idx = 0
-    for section_title, base_tag, fields in SECTIONS:
+    for section_title, base_tag, fields in DRAM_SECTIONS:
         display_lines.append(("", "spacer"))
         display_lines.append((section_title, "section"))
         for field in fields:
-            name, offset, bit_range, ftype = field[:4]
-            enum_map = field[4] if len(field) > 4 else None
-            val_range = field[5] if len(field) > 5 else None
-            lsb, msb = bit_range
-
-            mem_obj = reg_mem[base_tag]
-            reg_val = mem_obj.read32(offset)
-            val = get_bits(reg_val, lsb, msb)
+            mem_obj, name, offset, lsb, mask, ftype, enum_map, enum_map_inv, val_range, extra = FLAT_FIELDS[idx]
+            reg_val = snap[(id(mem_obj), offset)]
+            val = (reg_val >> lsb) & mask
 
             if ftype == "enum":
-                disp_val = next((k for k, v in enum_map.items() if v == val), f"unknown({val})")
-                extra = f"Options: {list(enum_map.keys())}"
+                disp_val = enum_map_inv.get(val, f"unknown({val})")
             else:
-                disp_val = str(val)
-                extra = f"Range: {val_range}" if val_range else ""
+                disp_val = f"{val}"
 
+            decoded[name] = disp_val
             display_lines.append(((name, disp_val, extra), "field", idx))
             idx += 1
 
-    m_d0a = get_val("m_d0apll", FLAT_FIELDS)
-    p_d0a = get_val("p_d0apll", FLAT_FIELDS)
-    s_d0a = get_val("s_d0apll", FLAT_FIELDS)
-    k_d0a = get_val("k_d0apll", FLAT_FIELDS)
-    d0apll = (XIN_OSC0_FREQ * ((m_d0a + (k_d0a / 2^16)) / (p_d0a * 2^s_d0a)))
-
-    m_d0b = get_val("m_d0bpll", FLAT_FIELDS)
-    p_d0b = get_val("p_d0bpll", FLAT_FIELDS)
-    s_d0b = get_val("s_d0bpll", FLAT_FIELDS)
-    k_d0b = get_val("k_d0bpll", FLAT_FIELDS)
-    d0bpll = (XIN_OSC0_FREQ * ((m_d0b + (k_d0b / 2^16)) / (p_d0b * 2^s_d0b)))
-
-    m_d1a = get_val("m_d1apll", FLAT_FIELDS)
-    p_d1a = get_val("p_d1apll", FLAT_FIELDS)
-    s_d1a = get_val("s_d1apll", FLAT_FIELDS)
-    k_d1a = get_val("k_d1apll", FLAT_FIELDS)
-    d1apll = (XIN_OSC0_FREQ * ((m_d1a + (k_d1a / 2^16)) / (p_d1a * 2^s_d1a)))
-
-    m_d1b = get_val("m_d1bpll", FLAT_FIELDS)
-    p_d1b = get_val("p_d1bpll", FLAT_FIELDS)
-    s_d1b = get_val("s_d1bpll", FLAT_FIELDS)
-    k_d1b = get_val("k_d1bpll", FLAT_FIELDS)
-    d1bpll = (XIN_OSC0_FREQ * ((m_d1b + (k_d1b / 2^16)) / (p_d1b * 2^s_d1b)))
-
-    m_d2a = get_val("m_d2apll", FLAT_FIELDS)
-    p_d2a = get_val("p_d2apll", FLAT_FIELDS)
-    s_d2a = get_val("s_d2apll", FLAT_FIELDS)
-    k_d2a = get_val("k_d2apll", FLAT_FIELDS)
-    d2apll = (XIN_OSC0_FREQ * ((m_d2a + (k_d2a / 2^16)) / (p_d2a * 2^s_d2a)))
-
-    m_d2b = get_val("m_d2bpll", FLAT_FIELDS)
-    p_d2b = get_val("p_d2bpll", FLAT_FIELDS)
-    s_d2b = get_val("s_d2bpll", FLAT_FIELDS)
-    k_d2b = get_val("k_d2bpll", FLAT_FIELDS)
-    d2bpll = (XIN_OSC0_FREQ * ((m_d2b + (k_d2b / 2^16)) / (p_d2b * 2^s_d2b)))
-
-    m_d3a = get_val("m_d3apll", FLAT_FIELDS)
-    p_d3a = get_val("p_d3apll", FLAT_FIELDS)
-    s_d3a = get_val("s_d3apll", FLAT_FIELDS)
-    k_d3a = get_val("k_d3apll", FLAT_FIELDS)
-    d3apll = (XIN_OSC0_FREQ * ((m_d3a + (k_d3a / 2^16)) / (p_d3a * 2^s_d3a)))
-
-    m_d3b = get_val("m_d3bpll", FLAT_FIELDS)
-    p_d3b = get_val("p_d3bpll", FLAT_FIELDS)
-    s_d3b = get_val("s_d3bpll", FLAT_FIELDS)
-    k_d3b = get_val("k_d3bpll", FLAT_FIELDS)
-    d3bpll = (XIN_OSC0_FREQ * ((m_d3b + (k_d3b / 2^16)) / (p_d3b * 2^s_d3b)))
-
-    ddrphy2x_ch0_sel = get_val("ddrphy2x_ch0_sel", FLAT_FIELDS)
-    ddrphy2x_ch1_sel = get_val("ddrphy2x_ch1_sel", FLAT_FIELDS)
-    ddrphy2x_ch2_sel = get_val("ddrphy2x_ch2_sel", FLAT_FIELDS)
-    ddrphy2x_ch3_sel = get_val("ddrphy2x_ch3_sel", FLAT_FIELDS)
-
-    if ddrphy2x_ch0_sel == "d0apll":
-        ddrphy2x_ch0_clk_freq = d0apll
-    elif ddrphy2x_ch0_sel == "d0bpll":
-        ddrphy2x_ch0_clk_freq = d0bpll
-    else:
-        ddrphy2x_ch0_clk_freq = 0
-
-    if ddrphy2x_ch1_sel == "d1apll":
-        ddrphy2x_ch1_clk_freq = d1apll
-    elif ddrphy2x_ch1_sel == "d1bpll":
-        ddrphy2x_ch1_clk_freq = d1bpll
-    else:
-        ddrphy2x_ch1_clk_freq = 0
+    pll = dram_pll_freqs(snap)
 
-    if ddrphy2x_ch2_sel == "d2apll":
-        ddrphy2x_ch2_clk_freq = d2apll
-    elif ddrphy2x_ch2_sel == "d2bpll":
-        ddrphy2x_ch2_clk_freq = d2bpll
-    else:
-        ddrphy2x_ch2_clk_freq = 0
+    ddrphy2x_ch0_sel = decoded["ddrphy2x_ch0_sel"]
+    ddrphy2x_ch1_sel = decoded["ddrphy2x_ch1_sel"]
+    ddrphy2x_ch2_sel = decoded["ddrphy2x_ch2_sel"]
+    ddrphy2x_ch3_sel = decoded["ddrphy2x_ch3_sel"]
 
-    if ddrphy2x_ch3_sel == "d2apll":
-        ddrphy2x_ch3_clk_freq = d2apll
-    elif ddrphy2x_ch3_sel == "d2bpll":
-        ddrphy2x_ch3_clk_freq = d2bpll
-    else:
-        ddrphy2x_ch3_clk_freq = 0
+    # The sel enum strings name the PLL directly, so a dict lookup replaces
+    # the per-channel compare chains (and can't repeat the old copy-paste
+    # bug where channel 3 was compared against the channel 2 PLL names)
+    ddrphy2x_ch0_clk_freq = pll.get(ddrphy2x_ch0_sel, 0)
+    ddrphy2x_ch1_clk_freq = pll.get(ddrphy2x_ch1_sel, 0)
+    ddrphy2x_ch2_clk_freq = pll.get(ddrphy2x_ch2_sel, 0)
+    ddrphy2x_ch3_clk_freq = pll.get(ddrphy2x_ch3_sel, 0)
 
     freq_lines = [
-        f"DDR D0A PLL Frequency:    {d0apll:.0f} MHz",
-        f"DDR D0B PLL Frequency:    {d0bpll:.0f} MHz",
-        f"DDR D1A PLL Frequency:    {d1apll:.0f} MHz",
-        f"DDR D1B PLL Frequency:    {d1bpll:.0f} MHz",
-        f"DDR D2A PLL Frequency:    {d2apll:.0f} MHz",
-        f"DDR D2B PLL Frequency:    {d2bpll:.0f} MHz",
-        f"DDR D3A PLL Frequency:    {d3apll:.0f} MHz",
-        f"DDR D3B PLL Frequency:    {d3bpll:.0f} MHz",
-        f"--------------",
+        "DDR %s PLL Frequency:    %.0f MHz" % (tag[:3].upper(), freq)
+        for tag, freq in pll.items()
+    ]
+    freq_lines += [
+        FREQ_SEP_LINE,
         f"DDR Channel0 Frequency:   {ddrphy2x_ch0_clk_freq:.0f} MHz from {ddrphy2x_ch0_sel}",        
         f"DDR Channel1 Frequency:   {ddrphy2x_ch1_clk_freq:.0f} MHz from {ddrphy2x_ch1_sel}",        
         f"DDR Channel2 Frequency:   {ddrphy2x_ch2_clk_freq:.0f} MHz from {ddrphy2x_ch2_sel}",        
@@ -1791,23 +1610,37 @@ def draw_dram_ui(stdscr, mem, selected, message, scroll_offset):
     elif selected >= scroll_offset + visible_rows:
         scroll_offset = selected - visible_rows + 1
 
-    # Render visible lines
-    for visible_idx, (entry, etype, *rest) in enumerate(display_lines[scroll_offset:scroll_offset + visible_rows]):
-        row = start_row + visible_idx 
+    max_w = curses.COLS - 3
+    target = get_panel_pad("dram")
+
+    field_attrs = [_FIELD_NORMAL] * len(FLAT_FIELDS)
+    if 0 <= selected < len(FLAT_FIELDS):
+        field_attrs[selected] = _FIELD_REVERSE
+
+    # Render visible lines into the shared pad; only rows whose content or
+    # highlight changed since the last frame are repainted
+    for visible_idx, item in enumerate(islice(display_lines,
+                                              scroll_offset,
+                                              scroll_offset + visible_rows)):
+        entry, etype = item[0], item[1]
+        row = visible_idx
 
         if etype == "spacer":
             continue
         elif etype == "section":
-            stdscr.addstr(row, 0, entry, curses.color_pair(1) | curses.A_BOLD)
+            draw_row_cached(target, "dram", row, 0, entry, _SECTION_ATTR)
         elif etype == "field":
             name, disp_val, extra = entry
-            field_idx = rest[0]
-            highlight = curses.A_REVERSE if field_idx == selected else curses.A_NORMAL
-            line = f"{name:<{FIELD_NAME_COL_WIDTH}}: {disp_val:<{VALUE_COL_WIDTH}} {extra:<{INFO_COL_WIDTH}}"
-            stdscr.addstr(row, 2, line[:curses.COLS - 3], highlight)
+            field_idx = item[2]
+            line = FIELD_ROW_TEMPLATE % (name, disp_val, extra)
+            draw_row_cached(target, "dram", row, 2, line,
+                            field_attrs[field_idx], max_w)
         elif etype == "freq":
             _, line, _ = entry
-            stdscr.addstr(row, 2, line[:curses.COLS - 3])
+            draw_row_cached(target, "dram", row, 2, line, max_w=max_w)
+
+    global _pad_view
+    _pad_view = (start_row, start_row + visible_rows - 1)
 
     return scroll_offset, FLAT_FIELDS
 
@@ -1818,9 +1651,16 @@ def init_colors():
     curses.init_pair(2, curses.COLOR_YELLOW, curses.COLOR_BLACK)  # Tab normal: yellow on black
     curses.init_pair(3, curses.COLOR_BLACK, curses.COLOR_YELLOW)  # Tab selected: black on yellow
 
+    global _SECTION_ATTR
+    _SECTION_ATTR = curses.color_pair(1) | curses.A_BOLD
+
 def tui(stdscr):
+    global _pad_view
     curses.curs_set(0)
     init_colors()
+    # Wake up every 250 ms so the display tracks the hardware without a
+    # keypress; register reads are rate-limited separately by SNAPSHOT_TTL
+    stdscr.timeout(250)
 
     # Message placeholder
     message = [""]
@@ -1833,24 +1673,6 @@ def tui(stdscr):
     scroll_offsets = [0] * NUM_TABS
     selected_idx = [0] * NUM_TABS
 
-    mem_map = {
-        1: Registers(CRU_BIGCORE0_BASE, REG_SIZE),  # Bigcore0
-        1: Registers(GRF_BIGCORE0_BASE, REG_SIZE),  # Bigcore0
-        2: Registers(CRU_BIGCORE1_BASE, REG_SIZE),  # Bigcore1
-        2: Registers(GRF_BIGCORE1_BASE, REG_SIZE),  # Bigcore1
-        3: Registers(CRU_DSU_BASE, REG_SIZE),       # Littlecore
-        3: Registers(GRF_LITCORE_BASE, REG_SIZE),   # Littlecore
-        4: Registers(CRU_DSU_BASE, REG_SIZE),       # DSU
-        4: Registers(GRF_DSU_BASE, REG_SIZE),       # DSU
-        5: Registers(CRU_BASE, REG_SIZE),           # GPU
-        5: Registers(GRF_GPU_BASE, REG_SIZE),       # GPU
-        6: Registers(GRF_NPU_BASE, REG_SIZE),       # NPU
-        7: Registers(CRU_DDRPHY0_BASE, REG_SIZE),   # DRAM
-        7: Registers(CRU_DDRPHY1_BASE, REG_SIZE),   # DRAM
-        7: Registers(CRU_DDRPHY2_BASE, REG_SIZE),   # DRAM
-        7: Registers(CRU_DDRPHY3_BASE, REG_SIZE),   # DRAM
-    }
-
     FLAT_FIELDS_BY_TAB = {
         1: [],  # Bigcore0
         2: [],  # Bigcore1
@@ -1863,10 +1685,22 @@ def tui(stdscr):
 
     MIN_ROWS, MIN_COLS = 34, 80
 
+    # PLL frequencies observed on the core tabs, reused by the DSU tab
+    pll_state = {"lpll": 0, "b0pll": 0, "b1pll": 0}
+    last_frame_key = None
+
     try:
         while True:
-            stdscr.clear()
             height, width = stdscr.getmaxyx()
+            # The register tabs diff-render against _row_cache and the info
+            # tabs repaint the same static text in place, so a full clear is
+            # only needed when the tab or terminal size changes
+            frame_key = (current_tab, height, width)
+            _pad_view = None
+            if frame_key != last_frame_key:
+                stdscr.erase()
+                _row_cache.clear()
+            last_frame_key = frame_key
 
             if height < MIN_ROWS or width < MIN_COLS:
                 warning = f"Terminal too small! Min size: {MIN_COLS}x{MIN_ROWS}"
@@ -1882,45 +1716,37 @@ def tui(stdscr):
             # Draw header and tab bar
             draw_header(stdscr, current_tab, tabs)
 
-            # Get mem object for current tab if exists
-            mem = mem_map.get(current_tab)
-            
             # Draw tab content and update scroll
-            new_scroll_offset = draw_tab_content(
-                stdscr,
-                current_tab,
-                mem,
-                selected,
-                scroll_offset,
-                message
-            )
-
-            # Save new scroll offset
-            if current_tab == 1:
-                scroll_offsets[current_tab], FLAT_FIELDS_BY_TAB[current_tab], b0pll_freq = draw_bigcore0_ui(stdscr, mem, selected, message, scroll_offset)
-            elif current_tab == 2:
-                scroll_offsets[current_tab], FLAT_FIELDS_BY_TAB[current_tab], b1pll_freq = draw_bigcore1_ui(stdscr, mem, selected, message, scroll_offset)
-            elif current_tab == 3:
-                scroll_offsets[current_tab], FLAT_FIELDS_BY_TAB[current_tab], lpll_freq = draw_littlecore_ui(stdscr, mem, selected, message, scroll_offset)
-            elif current_tab == 4:
-                scroll_offsets[current_tab], FLAT_FIELDS_BY_TAB[current_tab] = draw_dsu_ui(stdscr, mem, selected, message, scroll_offset, lpll_freq=0, b0pll_freq=0, b1pll_freq=0)
-            elif current_tab == 5:
-                scroll_offsets[current_tab], FLAT_FIELDS_BY_TAB[current_tab] = draw_gpu_ui(stdscr, mem, selected, message, scroll_offset)
-            elif current_tab == 6:
-                scroll_offsets[current_tab], FLAT_FIELDS_BY_TAB[current_tab] = draw_npu_ui(stdscr, mem, selected, message, scroll_offset)
+            if current_tab == 0:
+                draw_general_info(stdscr, message="", offset=3)
+            elif current_tab in PANEL_SPECS:
+                scroll_offsets[current_tab], FLAT_FIELDS_BY_TAB[current_tab] = draw_panel(
+                    PANEL_SPECS[current_tab], stdscr, selected, message,
+                    scroll_offset, pll_state)
             #elif current_tab == 7:
-            #    scroll_offsets[current_tab], FLAT_FIELDS_BY_TAB[current_tab] = draw_dram_ui(stdscr, mem, selected, message, scroll_offset) // devmem read bus errors cause system freeze
-            elif current_tab == 7:
-                draw_coming_soon(stdscr, current_tab, offset=3)
+            #    draw_dram_ui(stdscr, selected, message, scroll_offset)     // devmem read bus errors cause system freeze
+            else:
+                draw_coming_soon(stdscr, message, offset=3)
 
             stdscr.move(curses.LINES - 1, 0) 
             stdscr.clrtoeol() 
 
             stdscr.addstr(curses.LINES - 1, 0, message[0])
 
-            stdscr.refresh()
+            # One composed update per frame; the diff engine emits a single
+            # optimized write sequence to the terminal
+            stdscr.noutrefresh()
+            if _pad_view is not None:
+                top, bottom = _pad_view
+                _pad.noutrefresh(0, 0, top, 0, min(bottom, curses.LINES - 1), curses.COLS - 1)
+            curses.doupdate()
             key = stdscr.getch()
 
+            if key == -1:
+                # Poll timeout: fall through and redraw so the register
+                # values refresh even when no key is pressed
+                continue
+
             if key == ord('q'):
                 break
 
@@ -1932,6 +1758,7 @@ def tui(stdscr):
                 selected = 0
                 scroll_offset = 0
                 message[0] = ""
+                _safe_cache.clear()
 
             elif current_tab in FLAT_FIELDS_BY_TAB:
                 fields = FLAT_FIELDS_BY_TAB[current_tab]
@@ -1952,6 +1779,7 @@ def tui(stdscr):
                     scroll_offset = selected - visible_lines + 1
                 elif key == ord('\n'):
                     curses.echo()
+                    stdscr.timeout(-1)  # block while the user types a value
                     prompt_row = curses.LINES - 2
                     if prompt_row > 0:
                         field_label = fields[selected][1]
@@ -1960,18 +1788,24 @@ def tui(stdscr):
                         stdscr.refresh()
                         try:
                             value = stdscr.getstr().decode('utf-8').strip()
-                            current_flat_fields = FLAT_FIELDS_BY_TAB.get(current_tab, [])
-                            success = write_field(mem, fields[selected], value, message, current_flat_fields)
+                            by_name = FIELDS_BY_NAME_BY_TAB.get(current_tab)
+                            if by_name is None:
+                                by_name = fields_by_name(FLAT_FIELDS_BY_TAB.get(current_tab, []))
+                            success = write_field(fields[selected], value, message, by_name)
+                            snapshot_invalidate()
                             if not success:
                                 # Show error in message box or log
                                 pass
                         except Exception as e:
                             message[0] = f"Error: {e}"
                         curses.noecho()
+                        stdscr.timeout(250)
+                        stdscr.move(prompt_row, 0)
+                        stdscr.clrtoeol()
 
             # Save updated selected and scroll_offset for current tab
             selected_idx[current_tab] = selected
-            scroll_offsets[current_tab] = new_scroll_offset
+            scroll_offsets[current_tab] = scroll_offset
 
     except KeyboardInterrupt:
         stdscr.clear()
@@ -1981,7 +1815,7 @@ def tui(stdscr):
         stdscr.getch()
 
     finally:
-        for mem in mem_map.values():
+        for mem in _clusters.values():
             mem.close()
         curses.nocbreak()
         curses.echo()
@@ -8,7 +8,6 @@ import csv
 import re
 import struct
 import mmap
-from collections import OrderedDict
 import threading
 import curses
 
@@ -24,36 +23,58 @@ def show_header(title):
     print(f"\n## {title} ##")
 
 # === BASIC CLOCK FREQUENCIES ===
-CLK_ORDERED = OrderedDict([
-    ("armclk_l",            "armclk_A55_0-3"),
-    ("armclk_b01",          "armclk_A76_0-1"),      
-    ("armclk_b23",          "armclk_A75_2-3"),
-    ("scmi_clk_cpul",       "scmi_clk_A55_0-3"),
-    ("scmi_clk_cpub01",     "scmi_clk_A76_0-1"),
-    ("scmi_clk_cpub23",     "scmi_clk_A76_2-3"),
-    ("scmi_clk_dsu",        "scmi_clk_DSU"),
-    ("scmi_clk_ddr",        "scmi_clk_DMC"),
-    ("scmi_clk_npu",        "scmi_clk_NPU"),
-    ("scmi_clk_gpu",        "scmi_clk_GPU"),
-    ("clk_gpu",             "clk_GPU"),
-    ("clk_gpu_stacks",      "clk_GPU_STACKS"),
-    ("clk_gpu_coregroup",   "clk_GPU_COREGROUP"),
-    ("dclk_vop3",           "dclk_VOP3"),
-    ("dclk_vop2",           "dclk_VOP2"),
-    ("dclk_vop1",           "dclk_VOP1"),
-])
+# Plain dicts keep insertion order; no OrderedDict machinery needed
+CLK_ORDERED = {
+    "armclk_l":             "armclk_A55_0-3",
+    "armclk_b01":           "armclk_A76_0-1",
+    "armclk_b23":           "armclk_A75_2-3",
+    "scmi_clk_cpul":        "scmi_clk_A55_0-3",
+    "scmi_clk_cpub01":      "scmi_clk_A76_0-1",
+    "scmi_clk_cpub23":      "scmi_clk_A76_2-3",
+    "scmi_clk_dsu":         "scmi_clk_DSU",
+    "scmi_clk_ddr":         "scmi_clk_DMC",
+    "scmi_clk_npu":         "scmi_clk_NPU",
+    "scmi_clk_gpu":         "scmi_clk_GPU",
+    "clk_gpu":              "clk_GPU",
+    "clk_gpu_stacks":       "clk_GPU_STACKS",
+    "clk_gpu_coregroup":    "clk_GPU_COREGROUP",
+    "dclk_vop3":            "dclk_VOP3",
+    "dclk_vop2":            "dclk_VOP2",
+    "dclk_vop1":            "dclk_VOP1",
+}
+
+# clk_summary is a multi-kB debugfs file; keep one fd open and pread the
+# whole file once per sample instead of reopening and rescanning it for
+# each of the clocks in CLK_ORDERED
+try:
+    _CLK_SUMMARY_FD = os.open("/sys/kernel/debug/clk/clk_summary", os.O_RDONLY)
+except OSError:
+    _CLK_SUMMARY_FD = None
+
+_clk_freqs = {}
+
+# One compiled alternation matches any CLK_ORDERED name at the start of a
+# line and captures the rate column, so the sweep below does a single
+# C-level match per line instead of one substring search per clock.
+# Longest names first so a shorter name can never shadow a longer one.
+_CLK_RE = re.compile(
+    r"^\s*(" + "|".join(sorted(map(re.escape, CLK_ORDERED), key=len, reverse=True))
+    + r")\s+\S+\s+\S+\s+\S+\s+(\d+)", re.M)
+
+def refresh_clk_summary():
+    _clk_freqs.clear()
+    if _CLK_SUMMARY_FD is None:
+        return
+    try:
+        buf = os.pread(_CLK_SUMMARY_FD, 1 << 20, 0).decode(errors="replace")
+    except OSError:
+        return
+    # One multiline finditer sweep: no splitlines list, no per-line Python
+    for m in _CLK_RE.finditer(buf):
+        _clk_freqs[m.group(1)] = round(int(m.group(2)) / 1_000_000, 1)
 
 def get_clk_frequency(keyword):
-    try:
-        with open("/sys/kernel/debug/clk/clk_summary") as f:
-            for line in f:
-                if keyword in line:
-                    parts = line.strip().split()
-                    if len(parts) >= 4:
-                        return round(int(parts[4]) / 1_000_000, 1)
-    except:
-        pass
-    return None
+    return _clk_freqs.get(keyword)
 
 # === ADVANCED CLOCK FREQUENCIES ===
 CRU_SIZE = 0x1000
@@ -76,6 +97,18 @@ GRF_NPU_BASE        = 0xFD5A2000 # reading locks device // pvtpll possibly not e
 GRF_DDR01_BASE      = 0xFD59C000 # reading locks device
 GRF_DDR23_BASE      = 0xFD59D000 # reading locks device
 
+# Bases whose registers hang the SoC when read (see comments above); never
+# mapped, even if a field is ever added to SECTIONS against one of them
+_UNSAFE_BASES = {
+    CRU_DDRPHY0_BASE,
+    CRU_DDRPHY1_BASE,
+    CRU_DDRPHY2_BASE,
+    CRU_DDRPHY3_BASE,
+    GRF_NPU_BASE,
+    GRF_DDR01_BASE,
+    GRF_DDR23_BASE,
+}
+
 CRU_CLKSEL_CON73 = 0x0424
 CRU_CLKSEL_CON74 = 0x0428
 CRU_CLKSEL_CON158 = 0x0578
@@ -182,23 +215,37 @@ def get_bits(value, lsb, msb):
     mask = (1 << (msb - lsb + 1)) - 1
     return (value >> lsb) & mask
 
+_U32 = struct.Struct("<I")
+
+# One /dev/mem fd shared by every mapping; opened on the first CRUMemory
+# so a PermissionError still surfaces through ClockMonitor's check
+_DEV_MEM_FD = None
+
+def _dev_mem_fd():
+    global _DEV_MEM_FD
+    if _DEV_MEM_FD is None:
+        _DEV_MEM_FD = os.open("/dev/mem", os.O_RDWR | os.O_SYNC)
+    return _DEV_MEM_FD
+
 class CRUMemory:
-    def __init__(self, base, size):
-        self.mem_fd = os.open("/dev/mem", os.O_RDWR | os.O_SYNC)
-        self.mem = mmap.mmap(self.mem_fd, size, mmap.MAP_SHARED,
-                             mmap.PROT_READ | mmap.PROT_WRITE, offset=base)
+    def __init__(self, base, size, writable=False):
+        # This tool only monitors, so mappings default to read-only: cheaper
+        # to establish and no way to accidentally poke a latch register
+        prot = mmap.PROT_READ | mmap.PROT_WRITE if writable else mmap.PROT_READ
+        self.mem = mmap.mmap(_dev_mem_fd(), size, mmap.MAP_SHARED,
+                             prot, offset=base)
 
-    def read32(self, offset):
-        self.mem.seek(offset)
-        return struct.unpack("<I", self.mem.read(4))[0]
+    def read32(self, offset, _unpack_from=_U32.unpack_from):
+        # unpack_from reads the mmap buffer in place: no seek, no 4-byte
+        # bytes object per fetch
+        return _unpack_from(self.mem, offset)[0]
 
-    def write32(self, offset, value):
-        self.mem.seek(offset)
-        self.mem.write(struct.pack("<I", value))
+    def write32(self, offset, value, _pack_into=_U32.pack_into):
+        _pack_into(self.mem, offset, value)
 
     def close(self):
+        # The shared /dev/mem fd stays open for other mappings
         self.mem.close()
-        os.close(self.mem_fd)
 
 def read_field(mem, field):
     name, offset, lsb, msb, ftype, enum_map, value_range = field
@@ -215,12 +262,24 @@ def read_field(mem, field):
         return f"unknown({raw})"
     return raw
 
+# The GPU power policy rarely changes between samples, so cache the
+# check for a second instead of reopening the sysfs node every update()
+_GPU_POLICY_TTL = 1.0
+_gpu_policy_cache = (-_GPU_POLICY_TTL, False)
+
 def is_gpu_pvtpll_safe_to_read():
+    global _gpu_policy_cache
+    ts, safe = _gpu_policy_cache
+    now = time.monotonic()
+    if now - ts < _GPU_POLICY_TTL:
+        return safe
     try:
         with open("/sys/devices/platform/fb000000.gpu/devfreq/fb000000.gpu/device/power_policy", "r") as f:
-            return f.read().strip() == "coarse_demand [always_on]"
+            safe = f.read().strip() == "coarse_demand [always_on]"
     except FileNotFoundError:
-        return False  # If sysfs path doesn't exist, assume not safe
+        safe = False  # If sysfs path doesn't exist, assume not safe
+    _gpu_policy_cache = (now, safe)
+    return safe
 
 SECTIONS = [
             (GRF_BIGCORE0_BASE, [
@@ -346,192 +405,154 @@ for base_addr, fields in SECTIONS:
         enum_map = entry[4] if len(entry) > 4 else None
         vrange = entry[5] if len(entry) > 5 else None
         lsb, msb = bit_range
-        FLAT_FIELDS.append((name, base_addr, addr, lsb, msb, ftype, enum_map, vrange))
+        # Shift and mask are constants per field; bake them in here so the
+        # per-sample extraction is a bare shift-and-mask
+        mask = (1 << (msb - lsb + 1)) - 1
+        # Inverted enum map: decoding becomes a dict hit instead of a scan
+        # over enum_map.items() per read
+        enum_map_inv = {v: k for k, v in enum_map.items()} if enum_map else None
+        FLAT_FIELDS.append((name, base_addr, addr, lsb, mask, ftype,
+                            enum_map, enum_map_inv, vrange))
+
+# Name-keyed index over FLAT_FIELDS: update() resolves ~60 fields per
+# sample, so a hash lookup replaces a linear scan per call
+FLAT_FIELDS_BY_NAME = {f[0]: f for f in FLAT_FIELDS}
+
+# Distinct (base, offset) registers behind the fields above; several
+# fields share one CLKSEL register, so update() reads each word once per
+# sample and decodes all of its fields from that value. The GPU PVTPLL
+# counter hangs the SoC when the GPU policy is not always_on, so it is
+# excluded here and only fetched behind is_gpu_pvtpll_safe_to_read()
+_GPU_PVTPLL_REG = (GRF_GPU_BASE, GRF_GPU_PVTPLL)
+UNIQUE_REGS = sorted({(f[1], f[2]) for f in FLAT_FIELDS} - {_GPU_PVTPLL_REG})
+
+def _uc_freq(sel, uc_clk, pvtpll_freq):
+    # Core clock selection shared by the bigcore0/bigcore1/littlecore
+    # blocks in update(); the UC_* selector name differs per core, so
+    # match on the prefix
+    if sel == "Clean":
+        return CLEAN_FREQ
+    if sel == "PVTPLL":
+        return pvtpll_freq
+    if isinstance(sel, str) and sel.startswith("UC_"):
+        return uc_clk
+    return 0
+
+# The three core clusters run the same PLL/mux/divider pipeline over
+# different field names; update() walks this table instead of carrying
+# three copied code blocks
+_CORE_CLUSTERS = (
+    ("b0pll", "bigcore0_slow_sel", "bigcore0_gpll_div", "bigcore0_mux_sel",
+     "bigcore0_pvtpll_freq",
+     (("b0", "b0_uc_div", "b0_clk_sel"), ("b1", "b1_uc_div", "b1_clk_sel"))),
+    ("b1pll", "bigcore1_slow_sel", "bigcore1_gpll_div", "bigcore1_mux_sel",
+     "bigcore1_pvtpll_freq",
+     (("b2", "b2_uc_div", "b2_clk_sel"), ("b3", "b3_uc_div", "b3_clk_sel"))),
+    ("lpll", "littlecore_slow_sel", "littlecore_gpll_div", "littlecore_mux_sel",
+     "litcore_pvtpll_freq",
+     (("l0", "l0_uc_div", "l0_clk_sel"), ("l1", "l1_uc_div", "l1_clk_sel"),
+      ("l2", "l2_uc_div", "l2_clk_sel"), ("l3", "l3_uc_div", "l3_clk_sel"))),
+)
 
 class ClockMonitor:
     def __init__(self):
         self.data = {}
         self.mem_map = {}
         for base_addr, _ in SECTIONS:
+            if base_addr in _UNSAFE_BASES:
+                continue
             try:
                 self.mem_map[base_addr] = CRUMemory(base_addr, CRU_SIZE)
             except PermissionError:
                 print(f"Permission denied: cannot open /dev/mem at base {base_addr:#x}. Run as root.")
                 exit(1)
 
-    def read_reg(self, mem, offset):
-        mem.seek(offset)
-        data = mem.read(4)
-        return struct.unpack('<I', data)[0]
-
-    def read_freq(self, base, avg_cnt_offset):
-        with open("/dev/mem", "rb") as f:
-            mem = mmap.mmap(f.fileno(), GRF_SIZE, mmap.MAP_SHARED, mmap.PROT_READ, offset=base)
-            try:
-                return read_reg(mem, avg_cnt_offset)
-            finally:
-                mem.close()
-
-    def get_val(self, name, flat_fields):
-        for f in flat_fields:
-            f_name, base_addr, offset, lsb, msb, ftype, enum_map, vrange = f
-            if f_name == name:
-                mem = self.mem_map.get(base_addr)
-                if mem is None:
-                    raise ValueError(f"No memory mapped for base address {base_addr:#x}")
-                reg_val = mem.read32(offset)
-                width = msb - lsb + 1
-                mask = (1 << width) - 1
-                raw = (reg_val >> lsb) & mask
-                if ftype == "enum" and enum_map is not None:
-                    return next((k for k, v in enum_map.items() if v == raw), f"unknown({raw})")
-                else:
-                    return raw
-        return None
-
-    def update(self):
-        # bigCore0 Calculations
-        m_b0 = self.get_val("m_b0pll", FLAT_FIELDS)
-        p_b0 = self.get_val("p_b0pll", FLAT_FIELDS)
-        s_b0 = self.get_val("s_b0pll", FLAT_FIELDS)
-        b0pll_freq = (XIN_OSC0_FREQ * m_b0) / p_b0 / (1 << s_b0) if m_b0 and p_b0 else 0
-
-        bigcore0_slow_sel = self.get_val("bigcore0_slow_sel", FLAT_FIELDS)
-        bigcore0_gpll_div = self.get_val("bigcore0_gpll_div", FLAT_FIELDS)
-        bigcore0_mux_sel = self.get_val("bigcore0_mux_sel", FLAT_FIELDS)
-
-        b0_uc_div = self.get_val("b0_uc_div", FLAT_FIELDS)
-        b1_uc_div = self.get_val("b1_uc_div", FLAT_FIELDS)
-
-        b0_clk_sel = self.get_val("b0_clk_sel", FLAT_FIELDS)
-        b1_clk_sel = self.get_val("b1_clk_sel", FLAT_FIELDS)
-
-        if bigcore0_mux_sel == "slow":
-            bigcore0_mux_clk = XIN_OSC0_FREQ if bigcore0_slow_sel == "xin_osc0_func" else DEEPSLOW_FREQ
-        elif bigcore0_mux_sel == "gpll":
-            bigcore0_mux_clk = GPLL_FREQ / (bigcore0_gpll_div + 1)
-        elif bigcore0_mux_sel == "b0pll":
-            bigcore0_mux_clk = b0pll_freq
+    def get_val(self, name, regs=None):
+        field = FLAT_FIELDS_BY_NAME.get(name)
+        if field is None:
+            return None
+        f_name, base_addr, offset, lsb, mask, ftype, enum_map, enum_map_inv, vrange = field
+        if regs is not None:
+            reg_val = regs[(base_addr, offset)]
         else:
-            bigcore0_mux_clk = 0
-
-        b0_uc_clk = bigcore0_mux_clk / (b0_uc_div + 1)
-        b1_uc_clk = bigcore0_mux_clk / (b1_uc_div + 1)
-
-        bigcore0_pvtpll_freq = self.get_val("bigcore0_pvtpll_freq", FLAT_FIELDS)
-
-        def get_clk_freq(sel, uc_clk, pvtpll_freq):
-            if sel in ("UC_b0", "UC_b1"):
-                return uc_clk
-            elif sel == "Clean":
-                return CLEAN_FREQ
-            elif sel == "PVTPLL":
-                return pvtpll_freq
-            else:
-                return 0
-
-        b0_clk_freq = get_clk_freq(b0_clk_sel, b0_uc_clk, bigcore0_pvtpll_freq)
-        b1_clk_freq = get_clk_freq(b1_clk_sel, b1_uc_clk, bigcore0_pvtpll_freq)
-
-        # BigCore1 Calculations
-        m_b1 = self.get_val("m_b1pll", FLAT_FIELDS)
-        p_b1 = self.get_val("p_b1pll", FLAT_FIELDS)
-        s_b1 = self.get_val("s_b1pll", FLAT_FIELDS)
-        b1pll_freq = (XIN_OSC0_FREQ * m_b1) / p_b1 / (1 << s_b1) if m_b1 and p_b1 else 0
-
-        bigcore1_slow_sel = self.get_val("bigcore1_slow_sel", FLAT_FIELDS)
-        bigcore1_gpll_div = self.get_val("bigcore1_gpll_div", FLAT_FIELDS)
-        bigcore1_mux_sel = self.get_val("bigcore1_mux_sel", FLAT_FIELDS)
-
-        b2_uc_div = self.get_val("b2_uc_div", FLAT_FIELDS)
-        b3_uc_div = self.get_val("b3_uc_div", FLAT_FIELDS)
-
-        b2_clk_sel = self.get_val("b2_clk_sel", FLAT_FIELDS)
-        b3_clk_sel = self.get_val("b3_clk_sel", FLAT_FIELDS)
-
-        if bigcore1_mux_sel == "slow":
-            bigcore1_mux_clk = XIN_OSC0_FREQ if bigcore1_slow_sel == "xin_osc0_func" else DEEPSLOW_FREQ
-        elif bigcore1_mux_sel == "gpll":
-            bigcore1_mux_clk = GPLL_FREQ / (bigcore1_gpll_div + 1)
-        elif bigcore1_mux_sel == "b1pll":
-            bigcore1_mux_clk = b1pll_freq
+            mem = self.mem_map.get(base_addr)
+            if mem is None:
+                raise ValueError(f"No memory mapped for base address {base_addr:#x}")
+            reg_val = mem.read32(offset)
+        raw = (reg_val >> lsb) & mask
+        if ftype == "enum" and enum_map_inv is not None:
+            return enum_map_inv.get(raw, f"unknown({raw})")
         else:
-            bigcore1_mux_clk = 0
-
-        b2_uc_clk = bigcore1_mux_clk / (b2_uc_div + 1)
-        b3_uc_clk = bigcore1_mux_clk / (b3_uc_div + 1)
-
-        bigcore1_pvtpll_freq = self.get_val("bigcore1_pvtpll_freq", FLAT_FIELDS)
+            return raw
+
+    def decode_all(self, regs):
+        # Bulk bitfield extraction: one tight loop shifts and masks every
+        # field out of the register snapshot, so the calculations below are
+        # plain dict lookups instead of per-field method calls
+        vals = {}
+        for name, base, off, lsb, mask, ftype, em, emi, vr in FLAT_FIELDS:
+            reg_val = regs.get((base, off))
+            if reg_val is None:
+                # Register not in this snapshot (guarded GPU PVTPLL read)
+                continue
+            raw = (reg_val >> lsb) & mask
+            vals[name] = emi.get(raw, f"unknown({raw})") if emi is not None else raw
+        return vals
 
-        def get_clk_freq(sel, uc_clk, pvtpll_freq):
-            if sel in ("UC_b2", "UC_b3"):
-                return uc_clk
-            elif sel == "Clean":
-                return CLEAN_FREQ
-            elif sel == "PVTPLL":
-                return pvtpll_freq
-            else:
-                return 0
-
-        b2_clk_freq = get_clk_freq(b2_clk_sel, b2_uc_clk, bigcore1_pvtpll_freq)
-        b3_clk_freq = get_clk_freq(b3_clk_sel, b3_uc_clk, bigcore1_pvtpll_freq)
-
-        # LittleCore Calculations
-        m_l = self.get_val("m_lpll", FLAT_FIELDS)
-        p_l = self.get_val("p_lpll", FLAT_FIELDS)
-        s_l = self.get_val("s_lpll", FLAT_FIELDS)
-
-        lpll_freq = (XIN_OSC0_FREQ * m_l) / p_l / (1 << s_l) if m_l and p_l else 0
-
-        littlecore_slow_sel = self.get_val("littlecore_slow_sel", FLAT_FIELDS)
-        littlecore_gpll_div = self.get_val("littlecore_gpll_div", FLAT_FIELDS)
-        littlecore_mux_sel = self.get_val("littlecore_mux_sel", FLAT_FIELDS)
-
-        l0_uc_div = self.get_val("l0_uc_div", FLAT_FIELDS)
-        l1_uc_div = self.get_val("l1_uc_div", FLAT_FIELDS)
-        l2_uc_div = self.get_val("l2_uc_div", FLAT_FIELDS)
-        l3_uc_div = self.get_val("l3_uc_div", FLAT_FIELDS)
-
-        l0_clk_sel = self.get_val("l0_clk_sel", FLAT_FIELDS)
-        l1_clk_sel = self.get_val("l1_clk_sel", FLAT_FIELDS)
-        l2_clk_sel = self.get_val("l2_clk_sel", FLAT_FIELDS)
-        l3_clk_sel = self.get_val("l3_clk_sel", FLAT_FIELDS)
-
-        if littlecore_mux_sel == "slow":
-            littlecore_mux_clk = XIN_OSC0_FREQ if littlecore_slow_sel == "xin_osc0_func" else DEEPSLOW_FREQ
-        elif littlecore_mux_sel == "gpll":
-            littlecore_mux_clk = GPLL_FREQ / (littlecore_gpll_div + 1)
-        elif littlecore_mux_sel == "lpll":
-            littlecore_mux_clk = lpll_freq
-        else:
-            littlecore_mux_clk = 0
-
-        l0_uc_clk = littlecore_mux_clk / (l0_uc_div + 1)
-        l1_uc_clk = littlecore_mux_clk / (l1_uc_div + 1)
-        l2_uc_clk = littlecore_mux_clk / (l2_uc_div + 1)
-        l3_uc_clk = littlecore_mux_clk / (l3_uc_div + 1)
-
-        litcore_pvtpll_freq = self.get_val("litcore_pvtpll_freq", FLAT_FIELDS)
-
-        def get_clk_freq(sel, uc_clk, pvtpll_freq):
-            if sel in ("UC_l0", "UC_l1", "UC_l2", "UC_l3"):
-                return uc_clk
-            elif sel == "Clean":
-                return CLEAN_FREQ
-            elif sel == "PVTPLL":
-                return pvtpll_freq
+    def update(self):
+        # One register snapshot per sample: every field decode below shares
+        # it instead of issuing its own mmap read
+        mem_map = self.mem_map
+        regs = {key: mem_map[key[0]].read32(key[1]) for key in UNIQUE_REGS}
+        if is_gpu_pvtpll_safe_to_read():
+            regs[_GPU_PVTPLL_REG] = mem_map[_GPU_PVTPLL_REG[0]].read32(
+                _GPU_PVTPLL_REG[1])
+        vals = self.decode_all(regs)
+
+        # Hoist the constants this loop touches repeatedly: LOAD_FAST is
+        # cheaper than LOAD_GLOBAL in a 10 Hz sampling path
+        xin_osc0 = XIN_OSC0_FREQ
+        gpll = GPLL_FREQ
+
+        # Core cluster calculations (bigcore0 / bigcore1 / littlecore):
+        # PLL frequency, source mux, per-core UC divider, clock selection
+        plls = {}
+        core = {}
+        for (pll_name, slow_name, gpll_div_name, mux_name, pvtpll_name,
+             cores) in _CORE_CLUSTERS:
+            m = vals["m_" + pll_name]
+            p = vals["p_" + pll_name]
+            s = vals["s_" + pll_name]
+            pll_freq = (xin_osc0 * m) / p / (1 << s) if m and p else 0
+            plls[pll_name] = pll_freq
+
+            slow_sel = vals[slow_name]
+            gpll_div = vals[gpll_div_name]
+            mux_sel = vals[mux_name]
+
+            if mux_sel == "slow":
+                mux_clk = xin_osc0 if slow_sel == "xin_osc0_func" else DEEPSLOW_FREQ
+            elif mux_sel == "gpll":
+                mux_clk = gpll / (gpll_div + 1)
+            elif mux_sel == pll_name:
+                mux_clk = pll_freq
             else:
-                return 0
+                mux_clk = 0
 
-        l0_clk_freq = get_clk_freq(l0_clk_sel, l0_uc_clk, litcore_pvtpll_freq)
-        l1_clk_freq = get_clk_freq(l1_clk_sel, l1_uc_clk, litcore_pvtpll_freq)
-        l2_clk_freq = get_clk_freq(l2_clk_sel, l2_uc_clk, litcore_pvtpll_freq)
-        l3_clk_freq = get_clk_freq(l3_clk_sel, l3_uc_clk,litcore_pvtpll_freq)
+            pvtpll_freq = vals[pvtpll_name]
+            for key, uc_div_name, clk_sel_name in cores:
+                uc_clk = mux_clk / (vals[uc_div_name] + 1)
+                clk_sel = vals[clk_sel_name]
+                core[key] = (_uc_freq(clk_sel, uc_clk, pvtpll_freq), clk_sel)
+
+        b0pll_freq = plls["b0pll"]
+        b1pll_freq = plls["b1pll"]
+        lpll_freq = plls["lpll"]
 
         # DSU Calculations
-        dsu_sclk_df_src_mux_sel = self.get_val("dsu_sclk_df_src_mux_sel", FLAT_FIELDS)
-        dsu_sclk_df_src_mux_div = self.get_val("dsu_sclk_df_src_mux_div", FLAT_FIELDS)
-        dsu_sclk_src_t_sel = self.get_val("dsu_sclk_src_t_sel", FLAT_FIELDS) 
+        dsu_sclk_df_src_mux_sel = vals["dsu_sclk_df_src_mux_sel"]
+        dsu_sclk_df_src_mux_div = vals["dsu_sclk_df_src_mux_div"]
+        dsu_sclk_src_t_sel = vals["dsu_sclk_src_t_sel"] 
 
         if dsu_sclk_df_src_mux_sel == "b0pll":
             dsu_sclk_df_src_mux_clk = b0pll_freq
@@ -540,11 +561,11 @@ class ClockMonitor:
         elif dsu_sclk_df_src_mux_sel == "lpll":
             dsu_sclk_df_src_mux_clk = lpll_freq
         elif dsu_sclk_df_src_mux_sel == "gpll":
-            dsu_sclk_df_src_mux_clk = GPLL_FREQ
+            dsu_sclk_df_src_mux_clk = gpll
         else:
             dsu_sclk_df_src_mux_clk = 0
 
-        dsu_pvtpll_freq = self.get_val("dsu_pvtpll_freq", FLAT_FIELDS)
+        dsu_pvtpll_freq = vals["dsu_pvtpll_freq"]
 
         if dsu_sclk_src_t_sel == "dsu_src":
             sclk_clk_freq = dsu_sclk_df_src_mux_clk / (dsu_sclk_df_src_mux_div + 1)
@@ -553,8 +574,8 @@ class ClockMonitor:
         else:
             sclk_clk_freq = 0
 
-        dsu_pclk_root_mux_sel = self.get_val("dsu_pclk_root_mux_sel", FLAT_FIELDS)
-        dsu_pclk_root_mux_div = self.get_val("dsu_pclk_root_mux_div", FLAT_FIELDS)
+        dsu_pclk_root_mux_sel = vals["dsu_pclk_root_mux_sel"]
+        dsu_pclk_root_mux_div = vals["dsu_pclk_root_mux_div"]
 
         if dsu_pclk_root_mux_sel == "b0pll":
             dsu_pclk_root_mux_clk = b0pll_freq
@@ -563,20 +584,20 @@ class ClockMonitor:
         elif dsu_pclk_root_mux_sel == "lpll":
             dsu_pclk_root_mux_clk = lpll_freq
         elif dsu_pclk_root_mux_sel == "gpll":
-            dsu_pclk_root_mux_clk = GPLL_FREQ
+            dsu_pclk_root_mux_clk = gpll
         else:
             dsu_pclk_root_mux_clk = 0
 
         pclk_clk_freq = dsu_pclk_root_mux_clk / (dsu_pclk_root_mux_div + 1)
 
-        dsu_aclkm_div = self.get_val("dsu_aclkm_div", FLAT_FIELDS)
-        dsu_aclks_div = self.get_val("dsu_aclks_div", FLAT_FIELDS)
-        dsu_aclkmp_div = self.get_val("dsu_aclkmp_div", FLAT_FIELDS)
-        dsu_periphclk_div = self.get_val("dsu_periphclk_div", FLAT_FIELDS)
-        dsu_cntclk_div = self.get_val("dsu_cntclk_div", FLAT_FIELDS)
-        dsu_tsclk_div = self.get_val("dsu_tsclk_div", FLAT_FIELDS)
-        dsu_atclk_div = self.get_val("dsu_atclk_div", FLAT_FIELDS)
-        dsu_gicclk_div = self.get_val("dsu_gicclk_t_div", FLAT_FIELDS)
+        dsu_aclkm_div = vals["dsu_aclkm_div"]
+        dsu_aclks_div = vals["dsu_aclks_div"]
+        dsu_aclkmp_div = vals["dsu_aclkmp_div"]
+        dsu_periphclk_div = vals["dsu_periphclk_div"]
+        dsu_cntclk_div = vals["dsu_cntclk_div"]
+        dsu_tsclk_div = vals["dsu_tsclk_div"]
+        dsu_atclk_div = vals["dsu_atclk_div"]
+        dsu_gicclk_div = vals["dsu_gicclk_t_div"]
 
         aclkm_clk_freq = dsu_sclk_df_src_mux_clk / (dsu_aclkm_div + 1)
         aclks_clk_freq = dsu_sclk_df_src_mux_clk / (dsu_aclks_div + 1)
@@ -588,16 +609,16 @@ class ClockMonitor:
         gicclk_clk_freq = dsu_sclk_df_src_mux_clk / (dsu_gicclk_div + 1)
 
         # GPU Calculations
-        gpu_src_sel = self.get_val("gpu_src_sel", FLAT_FIELDS)
-        gpu_src_div = self.get_val("gpu_src_div", FLAT_FIELDS)
-        gpu_src_mux_sel = self.get_val("gpu_src_mux_sel", FLAT_FIELDS)
+        gpu_src_sel = vals["gpu_src_sel"]
+        gpu_src_div = vals["gpu_src_div"]
+        gpu_src_mux_sel = vals["gpu_src_mux_sel"]
 
         if gpu_src_sel == "aupll":
             gpu_src_mux_clk = AUPLL_FREQ / (gpu_src_div + 1)
         elif gpu_src_sel == "cpll":
             gpu_src_mux_clk = CPLL_FREQ / (gpu_src_div + 1)
         elif gpu_src_sel == "gpll":
-            gpu_src_mux_clk = GPLL_FREQ / (gpu_src_div + 1)
+            gpu_src_mux_clk = gpll / (gpu_src_div + 1)
         elif gpu_src_sel == "npll":
             gpu_src_mux_clk = NPLL_FREQ / (gpu_src_div + 1)
         elif gpu_src_sel == "spll":
@@ -605,10 +626,8 @@ class ClockMonitor:
         else:
             gpu_src_mux_clk = 0
 
-        if is_gpu_pvtpll_safe_to_read():
-            gpu_pvtpll_freq = self.get_val("gpu_pvtpll_freq", FLAT_FIELDS)
-        else:
-            gpu_pvtpll_freq = -1
+        # Absent when the guarded read above was skipped
+        gpu_pvtpll_freq = vals.get("gpu_pvtpll_freq", -1)
 
         if gpu_src_mux_sel == "gpu_src":
             gpu_clk_freq = gpu_src_mux_clk
@@ -618,16 +637,16 @@ class ClockMonitor:
             gpu_clk_freq = 0
 
         # NPU Calculations
-        dsu0_src_sel = self.get_val("rknn_dsu0_src_sel", FLAT_FIELDS)
-        dsu0_src_div = self.get_val("rknn_dsu0_src_div", FLAT_FIELDS)
-        dsu0_mux_sel = self.get_val("rknn_dsu0_mux_sel", FLAT_FIELDS)
+        dsu0_src_sel = vals["rknn_dsu0_src_sel"]
+        dsu0_src_div = vals["rknn_dsu0_src_div"]
+        dsu0_mux_sel = vals["rknn_dsu0_mux_sel"]
 
         if dsu0_src_sel == "aupll":
             dsu0_src_mux_clk = AUPLL_FREQ / (dsu0_src_div + 1)
         elif dsu0_src_sel == "cpll":
             dsu0_src_mux_clk = CPLL_FREQ / (dsu0_src_div + 1)
         elif dsu0_src_sel == "gpll":
-            dsu0_src_mux_clk = GPLL_FREQ / (dsu0_src_div + 1)
+            dsu0_src_mux_clk = gpll / (dsu0_src_div + 1)
         elif dsu0_src_sel == "npll":
             dsu0_src_mux_clk = NPLL_FREQ / (dsu0_src_div + 1)
         elif dsu0_src_sel == "spll":
@@ -642,28 +661,22 @@ class ClockMonitor:
         else:
             npu_clk_freq = 0
 
-        self.data = {
-            "l0":           (l0_clk_freq, l0_clk_sel),
-            "l1":           (l1_clk_freq, l1_clk_sel),
-            "l2":           (l2_clk_freq, l2_clk_sel),
-            "l3":           (l3_clk_freq, l3_clk_sel),
-            "b0":           (b0_clk_freq, b0_clk_sel),
-            "b1":           (b1_clk_freq, b1_clk_sel),
-            "b2":           (b2_clk_freq, b2_clk_sel),
-            "b3":           (b3_clk_freq, b3_clk_sel),
-            "gpu":          (gpu_clk_freq, gpu_src_mux_sel),
-            "npu":          (npu_clk_freq, dsu0_mux_sel),
-            "dsu_sclk":     (sclk_clk_freq, dsu_sclk_src_t_sel),
-            "aclkm":        (aclkm_clk_freq, None),
-            "aclks":        (aclks_clk_freq, None),
-            "aclkmp":       (aclkmp_clk_freq, None),
-            "periphclk":    (periphclk_clk_freq, None),
-            "cntclk":       (cntclk_clk_freq, None),
-            "tsclk":        (tsclk_clk_freq, None),
-            "atclk":        (atclk_clk_freq, None),
-            "gicclk":       (gicclk_clk_freq, None),
-            "pclk":         (pclk_clk_freq, None),
-        }
+        # Update the existing dict in place: the key set is fixed, so there
+        # is no need to rebuild the container on every sample
+        data = self.data
+        data.update(core)
+        data["gpu"] = (gpu_clk_freq, gpu_src_mux_sel)
+        data["npu"] = (npu_clk_freq, dsu0_mux_sel)
+        data["dsu_sclk"] = (sclk_clk_freq, dsu_sclk_src_t_sel)
+        data["aclkm"] = (aclkm_clk_freq, None)
+        data["aclks"] = (aclks_clk_freq, None)
+        data["aclkmp"] = (aclkmp_clk_freq, None)
+        data["periphclk"] = (periphclk_clk_freq, None)
+        data["cntclk"] = (cntclk_clk_freq, None)
+        data["tsclk"] = (tsclk_clk_freq, None)
+        data["atclk"] = (atclk_clk_freq, None)
+        data["gicclk"] = (gicclk_clk_freq, None)
+        data["pclk"] = (pclk_clk_freq, None)
 
     def get(self, key):
         return self.data.get(key, (0, None))
@@ -674,68 +687,157 @@ class ClockMonitor:
 monitor = ClockMonitor()
 
 # === VOLTAGES ===
+def _pread_strip(path):
+    # open/pread/close is half the syscalls of the open()-based read_file
+    # and skips the Python file-object machinery; sysfs values fit in 64B
+    if _denied(path):
+        return None
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        return os.pread(fd, 64, 0).rstrip(b"\n\x00").decode()
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
+# Sysfs nodes whose read path is known to stall or hard-hang hardware
+# (the UFS descriptor nodes are the documented case); never opened, even
+# if a future metric sweep globs into one
+SYSFS_DENYLIST = ("ufs", "geometry_descriptor")
+
+def _denied(path):
+    for part in SYSFS_DENYLIST:
+        if part in path:
+            return True
+    return False
+
+# Nodes re-read every tick keep their descriptor open for the process
+# lifetime: sysfs and procfs regenerate contents on each read, so one
+# pread replaces the whole open/read/close triplet
+_fd_cache = {}
+
+def read_file_fast(path, size=128):
+    fd = _fd_cache.get(path)
+    if fd is None:
+        if _denied(path):
+            return None
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            return None
+        _fd_cache[path] = fd
+    try:
+        return os.pread(fd, size, 0).rstrip(b"\n\x00").decode()
+    except OSError:
+        return None
+
 def get_sorted_regulator_voltages():
     voltages = []
-    for reg in glob.glob("/sys/class/regulator/regulator.*"):
-        name = read_file(os.path.join(reg, "name"))
-        uV = read_file(os.path.join(reg, "microvolts"))
-        if name and uV:
-            try:
-                voltages.append((name, round(int(uV) / 1000)))
-            except:
+    try:
+        entries = os.scandir("/sys/class/regulator")
+    except OSError:
+        return voltages
+    with entries:
+        for entry in entries:
+            if not entry.name.startswith("regulator."):
                 continue
+            name = _pread_strip(os.path.join(entry.path, "name"))
+            uV = _pread_strip(os.path.join(entry.path, "microvolts"))
+            if name and uV:
+                try:
+                    voltages.append((name, round(int(uV) / 1000)))
+                except ValueError:
+                    continue
     return sorted(voltages)
 
 # === TEMPERATURES ===
+# The hwmon device list and the static name files never change while the
+# tool runs; enumerate them once instead of re-globbing every tick
+_HWMON_CACHE = None
+
+def _hwmon_cache():
+    global _HWMON_CACHE
+    if _HWMON_CACHE is None:
+        cache = []
+        for hwmon in glob.glob("/sys/class/hwmon/hwmon*"):
+            name = _pread_strip(os.path.join(hwmon, "name"))
+            if name:
+                cache.append((name, os.path.join(hwmon, "temp1_input")))
+        # Stored pre-sorted by name so each tick's readout needs no sort
+        _HWMON_CACHE = sorted(cache)
+    return _HWMON_CACHE
+
 def get_temperatures():
     temperatures = []
-    for hwmon in glob.glob("/sys/class/hwmon/hwmon*"):
-        name = read_file(os.path.join(hwmon, "name"))
-        temp = read_file(os.path.join(hwmon, "temp1_input")) 
-        if name and temp:
+    for name, temp_path in _hwmon_cache():
+        temp = read_file_fast(temp_path)
+        if temp:
             try:
                 temperatures.append((name, round(int(temp) / 1000, 1)))
             except:
                 continue
-    return sorted(temperatures, key=lambda x: x[0])
+    return temperatures
 
 
 # === LOAD & USAGE ===
 def read_cpu_times():
-    with open("/proc/stat") as f:
-        for line in f:
-            if line.startswith("cpu"):
-                parts = line.split()
-                cpu_id = parts[0]
-                times = list(map(int, parts[1:]))
-                yield cpu_id, times
-
-_prev_cpu_times = None
+    fd = _fd_cache.get("/proc/stat")
+    if fd is None:
+        try:
+            fd = os.open("/proc/stat", os.O_RDONLY)
+        except OSError:
+            return
+        _fd_cache["/proc/stat"] = fd
+    try:
+        buf = os.pread(fd, 8192, 0)
+    except OSError:
+        return
+    # The cpu lines sit contiguously at the top of /proc/stat; cut the
+    # buffer there and parse the bytes directly instead of decoding and
+    # line-scanning the whole file
+    end = buf.find(b"\nintr ")
+    if end != -1:
+        buf = buf[:end]
+    for line in buf.split(b"\n"):
+        if not line.startswith(b"cpu"):
+            break
+        parts = line.split()
+        yield parts[0].decode(), list(map(int, parts[1:]))
+
+_prev_cpu_times = None  # {cpu: (total, idle + iowait)}
+
+def _cpu_totals(times_iter):
+    # Reduce each sample to (total, idle + iowait) in one pass; the cached
+    # tuple doubles as next tick's baseline, so nothing is summed twice
+    return {cpu: (sum(t), t[3] + t[4]) for cpu, t in times_iter}
+
+def prime_cpu_usages():
+    # Seed the delta baseline at startup so the first tick already has a
+    # measurement window instead of sleeping inside the render loop
+    global _prev_cpu_times
+    _prev_cpu_times = _cpu_totals(read_cpu_times())
 
-def get_cpu_usages(interval=1.0):
+def get_cpu_usages():
     global _prev_cpu_times
 
-    curr = dict(read_cpu_times())
+    curr = _cpu_totals(read_cpu_times())
 
     if _prev_cpu_times is None:
+        # No baseline yet: report idle rather than blocking the caller
         _prev_cpu_times = curr
-        time.sleep(interval)
-        curr = dict(read_cpu_times())
+        return {cpu.upper(): 0.0 for cpu in curr}
 
+    prev_map = _prev_cpu_times
     usage = {}
-    for cpu in curr:
-        if cpu not in _prev_cpu_times:
+    for cpu, (curr_total, curr_idle) in curr.items():
+        prev = prev_map.get(cpu)
+        if prev is None:
             continue
-        prev = _prev_cpu_times[cpu]
-        curr_times = curr[cpu]
-
-        prev_total = sum(prev)
-        curr_total = sum(curr_times)
-        prev_idle = prev[3] + prev[4]  # idle + iowait
-        curr_idle = curr_times[3] + curr_times[4]
-
-        total_delta = curr_total - prev_total
-        idle_delta = curr_idle - prev_idle
+        total_delta = curr_total - prev[0]
+        idle_delta = curr_idle - prev[1]
 
         if total_delta == 0:
             usage[cpu.upper()] = 0.0
@@ -753,9 +855,8 @@ def get_load_values():
         "NPU": "/sys/devices/platform/fdab0000.npu/devfreq/fdab0000.npu/load",
     }
     for label, path in paths.items():
-        val = read_file(path)
+        val = read_file_fast(path)
         if val is not None:
-            val = val.strip()
             try:
                 if "@" in val:
                     val = val.split("@")[0]
@@ -784,43 +885,143 @@ def get_governors():
     }
 
     for label, path in paths.items():
-        val = read_file(path)
+        val = read_file_fast(path)
         if val:
-            match = re.search(r"\[([^\]]+)\]", val)
-            if match:
-                governors[label] = match.group(1)
+            # The active entry is bracketed (e.g. "powersave [performance]");
+            # a find/slice pair is all that's needed to pull it out
+            i = val.find("[")
+            j = val.find("]", i + 1)
+            if i != -1 and j != -1:
+                governors[label] = val[i + 1:j]
             else:
-                governors[label] = val    
+                governors[label] = val
     return governors
 
 # === SAR-DAC
+_ADC_BASE = "/sys/devices/iio_sysfs_trigger/subsystem/devices/iio:device0/"
+
+# in_voltage_scale is static; read it on first use only
+_ADC_SCALE = None
+
+# The channel set is fixed too; probe in_voltage0..7_raw once instead of
+# paying an open miss for absent channels every tick
+_ADC_CHANS = None
+
+def _adc_chans():
+    global _ADC_CHANS
+    if _ADC_CHANS is None:
+        chans = []
+        for i in range(8):  # 0 to 7
+            raw_path = os.path.join(_ADC_BASE, f"in_voltage{i}_raw")
+            if os.path.exists(raw_path):
+                chans.append((f"SARADC{i}", raw_path))
+        _ADC_CHANS = chans
+    return _ADC_CHANS
+
 def get_sar_adc_readings():
-    base_path = "/sys/devices/iio_sysfs_trigger/subsystem/devices/iio:device0/"
+    global _ADC_SCALE
     adc_data = []
 
-    try:
-        scale_path = os.path.join(base_path, "in_voltage_scale")
-        scale_str = read_file(scale_path)
-        scale = float(scale_str) if scale_str else 1.0
-    except:
-        scale = 1.0
-
-    for i in range(8):  # 0 to 7
-        raw_path = os.path.join(base_path, f"in_voltage{i}_raw")
-        raw_str = read_file(raw_path)
+    if _ADC_SCALE is None:
+        try:
+            scale_path = os.path.join(_ADC_BASE, "in_voltage_scale")
+            scale_str = _pread_strip(scale_path)
+            _ADC_SCALE = float(scale_str) if scale_str else 1.0
+        except:
+            _ADC_SCALE = 1.0
+    scale = _ADC_SCALE
+
+    for label, raw_path in _adc_chans():
+        raw_str = read_file_fast(raw_path)
         if raw_str:
             try:
                 raw_val = int(raw_str)
                 scaled_val = raw_val * scale
-                adc_data.append((f"SARADC{i}", raw_val, scaled_val))
+                adc_data.append((label, raw_val, scaled_val))
             except:
                 continue
     return adc_data
 
+# === SAMPLING ===
+# Latest metrics snapshot: produced once per tick by whichever loop runs
+# in the foreground (TUI or CLI) and consumed by the CSV logger thread,
+# so a combined -log run doesn't issue every sysfs read twice. Publishing
+# is a single reference assignment, which is atomic in CPython.
+_latest_sample = None
+
+# Deadline backoff for the sysfs-backed groups: a sweep that blows its
+# budget gets skipped for the next few ticks (the last good values are
+# reused) so one slow sensor can't stall every refresh
+_SLOW_DEADLINE_NS = 5_000_000
+_SLOW_SKIP_TICKS = 5
+_slow_skip = {}
+_last_groups = {}
+
+def _timed_group(sample, key, func):
+    skip = _slow_skip.get(key, 0)
+    if skip:
+        _slow_skip[key] = skip - 1
+        cached = _last_groups.get(key)
+        if cached is not None:
+            sample[key] = cached
+        return
+    t0 = time.perf_counter_ns()
+    val = func()
+    if time.perf_counter_ns() - t0 > _SLOW_DEADLINE_NS:
+        _slow_skip[key] = _SLOW_SKIP_TICKS
+    sample[key] = val
+    _last_groups[key] = val
+
+def _read_freqs():
+    refresh_clk_summary()
+    freqs = {}
+    for key in CLK_ORDERED:
+        freq = get_clk_frequency(key)
+        if freq is not None:
+            freqs[key] = freq
+    return freqs
+
+def collect_sample(args, slow=True):
+    sample = {}
+    if args.f:
+        _timed_group(sample, "freqs", _read_freqs)
+    if args.af:
+        monitor.update()
+        # monitor.data is updated in place; copy it so the logger sees a
+        # consistent view of this tick
+        sample["af"] = dict(monitor.all())
+    if args.v:
+        _timed_group(sample, "voltages", get_sorted_regulator_voltages)
+    if args.t:
+        _timed_group(sample, "temps", get_temperatures)
+    if slow:
+        if args.g:
+            _timed_group(sample, "governors", get_governors)
+        if getattr(args, "s", False):
+            _timed_group(sample, "adc", get_sar_adc_readings)
+    if args.l:
+        sample["usages"] = get_cpu_usages()
+        _timed_group(sample, "loads", get_load_values)
+    return sample
+
+# Label padding is deterministic; cache the ljust result so the render
+# loop formats only the value portion of each line
+_PAD = {}
+
+def _pad20(label):
+    pad = _PAD.get(label)
+    if pad is None:
+        pad = label.ljust(20)
+        _PAD[label] = pad
+    return pad
+
 # === TUI FUNCTIONS ===
 def tui_main(stdscr, args):
+    global _latest_sample
     import curses
+    import select
     import signal
+    import sys
 
     curses.start_color()
     curses.use_default_colors()
@@ -830,9 +1031,26 @@ def tui_main(stdscr, args):
     stdscr.nodelay(True)
     curses.curs_set(0)
 
+    # Computed once; the render loop reuses these instead of rebuilding
+    # the attribute and static header strings every tick
+    hdr_attr = curses.color_pair(1) | curses.A_BOLD
+    title = "RK3588 Telemetry (TUI) for Orange Pi 5 Max by SkatterBencher (v0.12) - Press 'q' to quit"
+    interval_text = f"Update interval: {args.i:.1f} seconds"
+    log_status = "Logging: ENABLED" if args.log else "Logging: DISABLED"
+
+    # Previous frame's cells keyed by (y, x); a cell is repainted only
+    # when its text or attribute changed since the last tick
+    last_frame = {}
+
+    # All cells land in one preallocated pad; a single noutrefresh of the
+    # visible rectangle pushes the frame, and a resize just repaints from
+    # scratch into the pad instead of clearing the screen
+    pad = curses.newpad(256, 512)
+
     def handle_resize(signum, frame):
         curses.resizeterm(*stdscr.getmaxyx())
-        stdscr.clear()
+        pad.erase()
+        last_frame.clear()
     signal.signal(signal.SIGWINCH, handle_resize)
 
     COLUMN_MAP = {
@@ -846,151 +1064,194 @@ def tui_main(stdscr, args):
         's': 1,
     }
 
+    # Section builders. The enabled flag set is fixed once args are
+    # parsed, so it is resolved into a list here instead of re-testing
+    # every flag on every tick
+    def sec_temps(sample):
+        lines = [("## Temperatures ##", hdr_attr)]
+        for name, temp in sample.get("temps", []):
+            lines.append(_pad20(name) + f" {temp:.1f} °C")
+        lines.append("")
+        return lines
+
+    def sec_freqs(sample):
+        lines = [("## Frequencies ##", hdr_attr)]
+        freqs = sample.get("freqs", {})
+        for key, label in CLK_ORDERED.items():
+            freq = freqs.get(key)
+            if freq is not None:
+                lines.append(_pad20(label) + f" {freq:.0f} MHz")
+        lines.append("")
+        return lines
+
+    af_display = [
+        ("A55_L0", "l0"),
+        ("A55_L1", "l1"),
+        ("A55_L2", "l2"),
+        ("A55_L3", "l3"),
+        ("A76_B0", "b0"),
+        ("A76_B1", "b1"),
+        ("A76_B2", "b2"),
+        ("A76_B3", "b3"),
+        ("GPU", "gpu"),
+        ("NPU", "npu"),
+    ]
+
+    dsu_labels = {
+        "dsu_sclk": "DSU SCLK:",
+        "aclkm": "DSU ACLK_M:",
+        "aclks": "DSU ACLK_S:",
+        "aclkmp": "DSU ACLK_MP:",
+        "periphclk": "DSU PERIPHCLK:",
+        "cntclk": "DSU CNTCLK:",
+        "tsclk": "DSU TSCLK:",
+        "atclk": "DSU ATCLK:",
+        "gicclk": "DSU GICCLK:",
+        "pclk": "DSU PCLK:",
+    }
+
+    def sec_af(sample):
+        lines = [("## Advanced Frequencies ##", hdr_attr)]
+        af = sample.get("af", {})
+        for display_key, data_key in af_display:
+            freq, sel = af.get(data_key, (0, None))
+            lines.append(f"{display_key + ':':<15} {freq:.0f} MHz ({sel})")
+        for key, label in dsu_labels.items():
+            freq, sel = af.get(key, (0, None))
+            if sel is not None:
+                lines.append(f"{label:<15} {freq:.0f} MHz ({sel})")
+            else:
+                lines.append(f"{label:<15} {freq:.0f} MHz")
+        lines.append("")
+        return lines
+
+    def sec_governors(sample):
+        lines = [("## Governors ##", hdr_attr)]
+        for label, val in sample.get("governors", {}).items():
+            lines.append(_pad20(label) + f" {val}")
+        lines.append("")
+        return lines
+
+    def sec_voltages(sample):
+        lines = [("## Voltages ##", hdr_attr)]
+        for name, uV in sample.get("voltages", []):
+            lines.append(_pad20(name) + f" {uV} mV")
+        lines.append("")
+        return lines
+
+    def sec_loads(sample):
+        lines = [("## Loads ##", hdr_attr)]
+        for label, usage in sample.get("usages", {}).items():
+            lines.append(_pad20(label) + f" {usage} %")
+        for label, val in sample.get("loads", {}).items():
+            lines.append(_pad20(label) + f" {val} %")
+        lines.append("")
+        return lines
+
+    def sec_adc(sample):
+        lines = [("## SAR-ADC (Scaled) ##", hdr_attr)]
+        for name, raw, scaled in sample.get("adc", []):
+            lines.append(_pad20(name) + f" {scaled:.0f}")
+        lines.append("")
+        return lines
+
+    sections = []
+    if args.t:
+        sections.append((sec_temps, COLUMN_MAP['t']))
+    if args.f:
+        sections.append((sec_freqs, COLUMN_MAP['f']))
+    if args.af:
+        sections.append((sec_af, COLUMN_MAP['af']))
+    if args.g:
+        sections.append((sec_governors, COLUMN_MAP['g']))
+    if args.v:
+        sections.append((sec_voltages, COLUMN_MAP['v']))
+    if args.l:
+        sections.append((sec_loads, COLUMN_MAP['l']))
+    if getattr(args, "s", False):
+        sections.append((sec_adc, COLUMN_MAP['s']))
+
+    # Governors and SAR-ADC values change rarely; re-read them every
+    # slow_every ticks and render the cached result in between
+    slow_every = max(1, getattr(args, "si", 4))
+    tick = 0
+    cached_governors = {}
+    cached_adc = []
+
     try:
         while True:
-            monitor.update()
-            stdscr.erase()
+            slow_tick = tick % slow_every == 0
+            sample = collect_sample(args, slow=slow_tick)
+            if slow_tick:
+                cached_governors = sample.get("governors", {})
+                cached_adc = sample.get("adc", [])
+            else:
+                # Keep the cached slow-group values in the published
+                # snapshot so logger rows keep their columns
+                if args.g:
+                    sample["governors"] = cached_governors
+                if getattr(args, "s", False):
+                    sample["adc"] = cached_adc
+            _latest_sample = sample
             max_y, max_x = stdscr.getmaxyx()
             col_width = max_x // 3 - 1
             start_row = 5
             cols = [[], [], []]
 
             # Header
-            stdscr.addstr(0, 0, "RK3588 Telemetry (TUI) for Orange Pi 5 Max by SkatterBencher (v0.12) - Press 'q' to quit", curses.color_pair(1) | curses.A_BOLD)
-            interval_text = f"Update interval: {args.i:.1f} seconds"
-            log_status = "Logging: ENABLED" if args.log else "Logging: DISABLED"
-            stdscr.addstr(2, 0, interval_text, curses.A_DIM)
-            stdscr.addstr(3, 0, log_status, curses.A_DIM)
-
-            # Add lines to the right column buffer instead of drawing immediately
-            def add_lines(lines, col_index):
-                for line in lines:
+            cells = [
+                (0, 0, title[:max_x - 1], hdr_attr),
+                (2, 0, interval_text[:max_x - 1], curses.A_DIM),
+                (3, 0, log_status[:max_x - 1], curses.A_DIM),
+            ]
+
+            for builder, col_index in sections:
+                for line in builder(sample):
                     if isinstance(line, tuple):
-                        text, attr = line
-                    else:
-                        text, attr = line, 0
-                    cols[col_index].append((text, attr))
-
-            # Temperatures
-            if args.t:
-                lines = [("## Temperatures ##", curses.color_pair(1) | curses.A_BOLD)]
-                for name, temp in get_temperatures():
-                    lines.append(f"{name:<20} {temp:.1f} °C")
-                lines.append("")
-                add_lines(lines, COLUMN_MAP['t'])
-
-            # Frequencies
-            if args.f:
-                lines = [("## Frequencies ##", curses.color_pair(1) | curses.A_BOLD)]
-                for key, label in CLK_ORDERED.items():
-                    freq = get_clk_frequency(key)
-                    if freq is not None:
-                        lines.append(f"{label:<20} {freq:.0f} MHz")
-                lines.append("")
-                add_lines(lines, COLUMN_MAP['f'])
-
-            # Advanced Frequencies
-            if args.af:
-                lines = [("## Advanced Frequencies ##", curses.color_pair(1) | curses.A_BOLD)]
-
-                key_map = {
-                    "A55_L0": "l0",
-                    "A55_L1": "l1",
-                    "A55_L2": "l2",
-                    "A55_L3": "l3",
-                    "A76_B0": "b0",
-                    "A76_B1": "b1",
-                    "A76_B2": "b2",
-                    "A76_B3": "b3",
-                    "GPU": "gpu",
-                    "NPU": "npu",
-                }
-
-                for display_key in ["A55_L0", "A55_L1", "A55_L2", "A55_L3", "A76_B0", "A76_B1", "A76_B2", "A76_B3", "GPU", "NPU"]:
-                    data_key = key_map.get(display_key)
-                    if data_key is None:
-                        freq, sel = 0, None
-                    else:
-                        freq, sel = monitor.get(data_key)
-                    lines.append(f"{display_key + ':':<15} {freq:.0f} MHz ({sel})")
-
-                dsu_labels = {
-                    "dsu_sclk": "DSU SCLK:",
-                    "aclkm": "DSU ACLK_M:",
-                    "aclks": "DSU ACLK_S:",
-                    "aclkmp": "DSU ACLK_MP:",
-                    "periphclk": "DSU PERIPHCLK:",
-                    "cntclk": "DSU CNTCLK:",
-                    "tsclk": "DSU TSCLK:",
-                    "atclk": "DSU ATCLK:",
-                    "gicclk": "DSU GICCLK:",
-                    "pclk": "DSU PCLK:",
-                }
-
-                for key, label in dsu_labels.items():
-                    freq, sel = monitor.get(key)
-                    if sel is not None:
-                        lines.append(f"{label:<15} {freq:.0f} MHz ({sel})")
+                        cols[col_index].append(line)
                     else:
-                        lines.append(f"{label:<15} {freq:.0f} MHz")
-
-                lines.append("")
-                add_lines(lines, COLUMN_MAP['af'])
+                        cols[col_index].append((line, 0))
 
-            # Governors
-            if args.g:
-                lines = [("## Governors ##", curses.color_pair(1) | curses.A_BOLD)]
-                for label, val in get_governors().items():
-                    lines.append(f"{label:<20} {val}")
-                lines.append("")
-                add_lines(lines, COLUMN_MAP['g'])
-
-            # Voltages
-            if args.v:
-                lines = [("## Voltages ##", curses.color_pair(1) | curses.A_BOLD)]
-                for name, uV in get_sorted_regulator_voltages():
-                    lines.append(f"{name:<20} {uV} mV")
-                lines.append("")
-                add_lines(lines, COLUMN_MAP['v'])
-
-            # Loads
-            if args.l:
-                lines = [("## Loads ##", curses.color_pair(1) | curses.A_BOLD)]
-                usages = get_cpu_usages()
-                for label, usage in usages.items():
-                    lines.append(f"{label:<20} {usage} %")
-                loads = get_load_values()
-                for label, val in loads.items():
-                    lines.append(f"{label:<20} {val} %")
-                lines.append("")
-                add_lines(lines, COLUMN_MAP['l'])
-
-            # SAR-ADC
-            if getattr(args, "s", False):
-                lines = [("## SAR-ADC (Scaled) ##", curses.color_pair(1) | curses.A_BOLD)]
-                for name, raw, scaled in get_sar_adc_readings():
-                    lines.append(f"{name:<20} {scaled:.0f}")
-                lines.append("")
-                add_lines(lines, COLUMN_MAP['s'])
-
-            # Draw all columns
+            # Collect all column cells, padded to the column width so a
+            # shorter value fully overwrites its predecessor
             for col_idx, col_lines in enumerate(cols):
                 x = col_idx * (col_width + 1)
                 for row_idx, (text, attr) in enumerate(col_lines):
                     y = start_row + row_idx
                     if y < max_y:
-                        stdscr.addstr(y, x, text[:col_width], attr)
-
-            stdscr.refresh()
-
-            # Exit
-            ch = stdscr.getch()
-            if ch == ord('q'):
+                        cells.append((y, x, text[:col_width].ljust(col_width), attr))
+
+            # Diff against the previous frame: repaint only changed cells
+            # and blank the ones that disappeared
+            frame = {}
+            for y, x, text, attr in cells:
+                frame[(y, x)] = (text, attr)
+                if last_frame.get((y, x)) != (text, attr):
+                    try:
+                        pad.addstr(y, x, text, attr)
+                    except curses.error:
+                        pass
+            for (y, x), (text, attr) in last_frame.items():
+                if (y, x) not in frame:
+                    try:
+                        pad.addstr(y, x, " " * len(text))
+                    except curses.error:
+                        pass
+            last_frame.clear()
+            last_frame.update(frame)
+
+            # One batched screen update per tick
+            pad.noutrefresh(0, 0, 0, 0, min(max_y, 256) - 1, min(max_x, 512) - 1)
+            curses.doupdate()
+            tick += 1
+
+            # Sleep on stdin with the refresh interval as timeout: a key
+            # press wakes the loop immediately, so 'q' quits without
+            # waiting out the rest of the tick
+            ready, _, _ = select.select([sys.stdin], [], [], max(0.1, args.i))
+            if ready and stdscr.getch() == ord('q'):
                 break
 
-            # Refresh delay
-            curses.napms(max(100, int(args.i * 1000)))
-
     except KeyboardInterrupt:
         curses.endwin()
         print("\n#########################")
@@ -998,6 +1259,7 @@ def tui_main(stdscr, args):
         print("\n#########################")
 
 def main(args=None):
+    global _latest_sample
     if args is None:
         parser = argparse.ArgumentParser()
         parser.add_argument("-f", action="store_true", help="Show frequencies")
@@ -1009,6 +1271,7 @@ def main(args=None):
         parser.add_argument("-s", action="store_true", help="Show sar-dac")
         parser.add_argument("-log", action="store_true", help="Log to CSV")
         parser.add_argument("-i", type=float, default=2.0, help="Refresh interval in seconds")
+        parser.add_argument("-si", type=int, default=4, help="Read governors/SAR-ADC every N ticks in the TUI")
         parser.add_argument("-tui", action="store_true", help="Run with TUI interface")
         args = parser.parse_args()
 
@@ -1022,53 +1285,71 @@ def main(args=None):
     stop_event = threading.Event()
     log_thread = None
 
+    if args.l:
+        prime_cpu_usages()
+
     if args.log:
-        monitor = ClockMonitor()
+        # The logger consumes the snapshots published by the foreground
+        # TUI/CLI loop instead of re-reading every metric itself
+        af_keys = [
+            ("l0", "A55_L0"),
+            ("l1", "A55_L1"),
+            ("l2", "A55_L2"),
+            ("l3", "A55_L3"),
+            ("b0", "A76_B0"),
+            ("b1", "A76_B1"),
+            ("b2", "A76_B2"),
+            ("b3", "A76_B3"),
+            ("gpu", "GPU"),
+            ("npu", "NPU"),
+            ("dsu_sclk", "DSU SCLK"),
+            ("aclkm", "ACLK_M"),
+            ("aclks", "ACLK_S"),
+            ("aclkmp", "ACLK_MP"),
+            ("periphclk", "PERIPHCLK"),
+            ("cntclk", "CNTCLK"),
+            ("tsclk", "TSCLK"),
+            ("atclk", "ATCLK"),
+            ("gicclk", "GICCLK"),
+            ("pclk", "PCLK"),
+        ]
 
         def logger():
             now = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
             log_filename = f"telemetry-{now}.csv"
-            with open(log_filename, mode="w", newline="") as log_file:
+            # Rows are batched and flushed in one writerows call so steady-
+            # state logging costs one buffered write per batch; the time
+            # bound keeps data on disk within a couple of seconds at slow
+            # refresh intervals
+            LOG_BATCH_ROWS = 16
+            LOG_FLUSH_SECS = 2.0
+            with open(log_filename, mode="w", newline="",
+                      buffering=1 << 16) as log_file:
                 csv_writer = csv.writer(log_file)
                 wrote_header = False
+                pending = []
+                last_flush = time.monotonic()
                 while not stop_event.is_set():
+                    sample = _latest_sample
+                    if sample is None:
+                        # The foreground loop hasn't published a tick yet
+                        stop_event.wait(0.1)
+                        continue
                     row = [datetime.datetime.now().isoformat()]
                     headers = ["Timestamp"]
 
                     if args.f:
+                        freqs = sample.get("freqs", {})
                         for key, label in CLK_ORDERED.items():
-                            freq = get_clk_frequency(key)
+                            freq = freqs.get(key)
                             if freq is not None:
                                 row.append(freq)
                                 headers.append(label + " (MHz)")
 
                     if args.af:
-                        monitor.update()
-                        af_keys = [
-                            ("l0", "A55_L0"),
-                            ("l1", "A55_L1"),
-                            ("l2", "A55_L2"),
-                            ("l3", "A55_L3"),
-                            ("b0", "A76_B0"),
-                            ("b1", "A76_B1"),
-                            ("b2", "A76_B2"),
-                            ("b3", "A76_B3"),
-                            ("gpu", "GPU"),
-                            ("npu", "NPU"),                           
-                            ("dsu_sclk", "DSU SCLK"),
-                            ("aclkm", "ACLK_M"),
-                            ("aclks", "ACLK_S"),
-                            ("aclkmp", "ACLK_MP"),
-                            ("periphclk", "PERIPHCLK"),
-                            ("cntclk", "CNTCLK"),
-                            ("tsclk", "TSCLK"),
-                            ("atclk", "ATCLK"),
-                            ("gicclk", "GICCLK"),
-                            ("pclk", "PCLK"),
-                        ]
-
+                        af = sample.get("af", {})
                         for key, label in af_keys:
-                            freq, sel = monitor.get(key)
+                            freq, sel = af.get(key, (0, None))
                             row.append(freq)
                             headers.append(f"{label} (MHz)")
                             if sel is not None:
@@ -1076,43 +1357,49 @@ def main(args=None):
                                 headers.append(f"{label} Source")
 
                     if args.v:
-                        for name, uV in get_sorted_regulator_voltages():
+                        for name, uV in sample.get("voltages", []):
                             row.append(uV)
                             headers.append(name + " (mV)")
 
                     if args.t:
-                        for name, temp in get_temperatures():
+                        for name, temp in sample.get("temps", []):
                             row.append(temp)
                             headers.append(name + " (°C)")
 
                     if args.g:
-                        governors = get_governors()
-                        for label, val in governors.items():
+                        for label, val in sample.get("governors", {}).items():
                             row.append(val)
                             headers.append(label + " Governor")
 
                     if args.l:
-                        usages = get_cpu_usages()
-                        for label, usage in usages.items():
+                        for label, usage in sample.get("usages", {}).items():
                             row.append(usage)
                             headers.append(label + " Usage (%)")
 
-                        loads = get_load_values()
-                        for label, val in loads.items():
+                        for label, val in sample.get("loads", {}).items():
                             row.append(val)
                             headers.append(label + " Load (%)")
 
                     if args.s:
-                        for name, raw, scaled in get_sar_adc_readings():
+                        for name, raw, scaled in sample.get("adc", []):
                             row.extend([raw, scaled])
                             headers.extend([f"{name} Raw", f"{name} Scaled"])
 
                     if not wrote_header:
                         csv_writer.writerow(headers)
                         wrote_header = True
-                    csv_writer.writerow(row)
-
-                    time.sleep(args.i)
+                    pending.append(row)
+                    now = time.monotonic()
+                    if (len(pending) >= LOG_BATCH_ROWS
+                            or now - last_flush >= LOG_FLUSH_SECS):
+                        csv_writer.writerows(pending)
+                        pending.clear()
+                        log_file.flush()
+                        last_flush = now
+
+                    stop_event.wait(args.i)
+                if pending:
+                    csv_writer.writerows(pending)
 
         log_thread = threading.Thread(target=logger, daemon=True)
         log_thread.start()
@@ -1129,7 +1416,11 @@ def main(args=None):
     # Non-TUI CLI output
     try:
         while True:
-            os.system("clear")
+            # ANSI home + clear: same effect as clear(1) without forking
+            # a process every tick
+            print("\x1b[H\x1b[2J", end="")
+            sample = collect_sample(args)
+            _latest_sample = sample
             row = [datetime.datetime.now().isoformat()]
             headers = ["Timestamp"]
 
@@ -1137,8 +1428,9 @@ def main(args=None):
 
             if args.f:
                 show_header("Frequencies")
+                freqs = sample.get("freqs", {})
                 for key, label in CLK_ORDERED.items():
-                    freq = get_clk_frequency(key)
+                    freq = freqs.get(key)
                     if freq is not None:
                         print(f"{label:<20} {freq:.0f} MHz")
                         row.append(freq)
@@ -1146,43 +1438,40 @@ def main(args=None):
 
             if args.v:
                 show_header("Voltages")
-                for name, uV in get_sorted_regulator_voltages():
+                for name, uV in sample.get("voltages", []):
                     print(f"{name:<20} {uV:.0f} mV")
                     row.append(uV)
                     headers.append(name + " (mV)")
 
             if args.t:
                 show_header("Temperatures")
-                for name, temp in get_temperatures():
+                for name, temp in sample.get("temps", []):
                     print(f"{name:<20} {temp:.1f} °C")
                     row.append(temp)
                     headers.append(name + " (°C)")
 
             if args.g:
                 show_header("Performance Governors")
-                governors = get_governors()
-                for label, val in governors.items():
+                for label, val in sample.get("governors", {}).items():
                     print(f"{label:<20} {val}")
                     row.append(val)
                     headers.append(label + " Governor")
 
             if args.l:
                 show_header("Load")
-                usages = get_cpu_usages()
-                for label, usage in usages.items():
+                for label, usage in sample.get("usages", {}).items():
                     print(f"{label:<20} {usage} %")
                     row.append(usage)
                     headers.append(label + " Usage (%)")
 
-                loads = get_load_values()
-                for label, val in loads.items():
+                for label, val in sample.get("loads", {}).items():
                     print(f"{label:<20} {val} %")
                     row.append(val)
                     headers.append(label + " Load (%)")
 
             if args.s:
                 show_header("SAR-ADC Readings")
-                for name, raw, scaled in get_sar_adc_readings():
+                for name, raw, scaled in sample.get("adc", []):
                     print(f"{name:<20} {scaled:.0f}")
 
             if args.log: